@@ -0,0 +1,50 @@
+"""
+Compare the latency of successful and failed authentication attempts.
+
+A login attempt for an unknown address should cost the same as one for
+a known address so that response times do not reveal which addresses
+are registered.
+"""
+
+from benchmarks import utils
+
+
+def main():
+    utils.setup_django()
+
+    from django.contrib.auth import get_user_model
+
+    from email_auth import authentication, models
+
+    password = "password"
+    user = get_user_model().objects.create_user(
+        password=password, username="benchmark"
+    )
+    models.EmailAddress.objects.create(
+        address="known@example.com", is_verified=True, user=user
+    )
+
+    backend = authentication.VerifiedEmailBackend()
+
+    # Warm up any lazily computed state, such as the dummy hash.
+    backend.authenticate(None, "unknown@example.com", password)
+
+    hit = utils.report(
+        "hit",
+        lambda: backend.authenticate(None, "known@example.com", password),
+    )
+    wrong_password = utils.report(
+        "wrong password",
+        lambda: backend.authenticate(None, "known@example.com", "wrong"),
+    )
+    miss = utils.report(
+        "miss",
+        lambda: backend.authenticate(None, "unknown@example.com", password),
+    )
+
+    print(f"miss/hit ratio: {miss / hit:.3f}")
+    print(f"miss/wrong password ratio: {miss / wrong_password:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Compare the insert throughput of random and time ordered email address
+primary keys.
+
+Random keys are inserted at arbitrary positions in the primary key
+index while time ordered keys are appended to the end of it. The gap
+between the two grows with the size of the table, so the benchmark
+inserts a large number of rows by default::
+
+    python -m benchmarks.email_address_ids --rows 1000000
+"""
+
+import argparse
+import time
+import uuid
+
+from benchmarks import utils
+
+
+def insert_rows(user, id_factory, rows, batch_size):
+    """
+    Insert email addresses in batches.
+
+    Args:
+        user:
+            The user who owns the inserted addresses.
+        id_factory:
+            The function used to generate primary keys.
+        rows:
+            The total number of rows to insert.
+        batch_size:
+            The number of rows inserted by each statement.
+
+    Returns:
+        The number of rows inserted per second.
+    """
+    from email_auth import models
+
+    start = time.perf_counter()
+
+    for offset in range(0, rows, batch_size):
+        count = min(batch_size, rows - offset)
+        models.EmailAddress.objects.bulk_create(
+            [
+                models.EmailAddress(
+                    address=f"user-{offset + i}@example.com",
+                    id=id_factory(),
+                    normalized_address=f"user-{offset + i}@example.com",
+                    user=user,
+                )
+                for i in range(count)
+            ]
+        )
+
+    return rows / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", default=10000, type=int)
+    parser.add_argument("--rows", default=1000000, type=int)
+    args = parser.parse_args()
+
+    utils.setup_django()
+
+    from django.contrib.auth import get_user_model
+    from django.db import connection
+
+    from email_auth import models
+
+    user = get_user_model().objects.create_user(username="benchmark")
+    factories = [
+        ("uuid4", uuid.uuid4),
+        ("time ordered", models.generate_time_ordered_uuid),
+    ]
+
+    results = {}
+    for name, factory in factories:
+        # Deleting through the ORM would load every row to cascade to
+        # related models, none of which exist here.
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {models.EmailAddress._meta.db_table}")
+
+        results[name] = insert_rows(user, factory, args.rows, args.batch_size)
+        print(f"{name}: {results[name]:,.0f} rows/s")
+
+    ratio = results["time ordered"] / results["uuid4"]
+    print(f"time ordered/uuid4 throughput ratio: {ratio:.3f}")
+
+
+if __name__ == "__main__":
+    main()
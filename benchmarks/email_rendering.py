@@ -0,0 +1,60 @@
+"""
+Compare the cost of rendering an email through ``email_utils`` against
+the cached templates used by ``email_auth.mail``.
+
+``email_utils`` looks both templates up by name for every email, which
+raises and handles ``TemplateDoesNotExist`` for every missing HTML
+template even when Django's cached template loader is active.
+"""
+
+from benchmarks import utils
+
+
+def main():
+    utils.setup_django()
+
+    from django.contrib.auth import get_user_model
+    from django.template import TemplateDoesNotExist
+    from django.template.loader import render_to_string
+    from django.utils.translation import ugettext_lazy as _
+
+    from email_auth import mail, models
+
+    user = get_user_model().objects.create_user(username="benchmark")
+    email = models.EmailAddress.objects.create(
+        address="benchmark@example.com", user=user
+    )
+    verification = models.EmailVerification(email=email)
+    context = {
+        "email": email,
+        "user": user,
+        "verification": verification,
+        "verification_url": None,
+    }
+    template_name = "email_auth/emails/verify-email"
+    subject = _("Please Verify Your Email Address")
+
+    def render_uncached():
+        # Mirrors the rendering done by ``email_utils.send_email``.
+        for extension in ("html", "txt"):
+            try:
+                render_to_string(
+                    context=context,
+                    template_name=f"{template_name}.{extension}",
+                )
+            except TemplateDoesNotExist:
+                pass
+
+    before = utils.report("email_utils", render_uncached, number=1000)
+    after = utils.report(
+        "mail.render_email",
+        lambda: mail.render_email(template_name, context),
+        number=1000,
+    )
+    utils.report("subject translation", lambda: str(subject), number=1000)
+
+    print(f"rendering speedup: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
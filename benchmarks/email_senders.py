@@ -0,0 +1,79 @@
+"""
+Compare the throughput of registering email addresses with each of the
+included email senders.
+
+Each registration creates an email address and sends its verification
+email, as the registration serializer does.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks import utils
+
+
+SENDERS = [
+    "email_auth.senders.InlineSender",
+    "email_auth.senders.LocmemSender",
+    "email_auth.senders.SpoolSender",
+]
+
+
+def register(user, count):
+    """
+    Register email addresses and send their verification emails.
+
+    Args:
+        user:
+            The owner of the registered addresses.
+        count:
+            The number of addresses to register.
+
+    Returns:
+        The number of registrations per second.
+    """
+    from email_auth import models, senders
+
+    start = time.perf_counter()
+
+    for i in range(count):
+        email = models.EmailAddress.objects.create(
+            address=f"user-{i}@example.com", user=user
+        )
+        email.send_verification_email()
+
+    senders.close_senders()
+
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--registrations", default=2000, type=int)
+    args = parser.parse_args()
+
+    utils.setup_django()
+
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+
+    from email_auth import models
+
+    user = get_user_model().objects.create_user(username="benchmark")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for sender in SENDERS:
+            settings.EMAIL_AUTH = {
+                "EMAIL_SENDER": sender,
+                "EMAIL_SPOOL_PATH": os.path.join(directory, "emails.jsonl"),
+            }
+            models.EmailAddress.objects.all().delete()
+
+            rate = register(user, args.registrations)
+            print(f"{sender}: {rate:,.0f} registrations/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Compare the throughput of sending each email over a new mail connection
+against reusing a persistent connection.
+
+Emails are sent with Django's SMTP backend to a minimal local SMTP
+server. Connecting to a real mail server also involves network round
+trips and TLS negotiation, which can be simulated by delaying the
+server's greeting::
+
+    python -m benchmarks.mail_connections --handshake-delay 0.05
+"""
+
+import argparse
+import socketserver
+import threading
+import time
+
+from benchmarks import utils
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    """
+    Accept every message sent over a connection and discard it.
+    """
+
+    def handle(self):
+        time.sleep(self.server.handshake_delay)
+        self.reply(b"220 localhost ESMTP")
+
+        for line in self.rfile:
+            command = line[:4].upper()
+            if command == b"DATA":
+                self.reply(b"354 End data with <CR><LF>.<CR><LF>")
+                for data in self.rfile:
+                    if data == b".\r\n":
+                        break
+                self.reply(b"250 OK")
+            elif command == b"QUIT":
+                self.reply(b"221 Bye")
+                return
+            else:
+                self.reply(b"250 OK")
+
+    def reply(self, response):
+        self.wfile.write(response + b"\r\n")
+
+
+def start_server(handshake_delay):
+    """
+    Start the SMTP server in a background thread.
+
+    Args:
+        handshake_delay:
+            The number of seconds to wait before greeting each new
+            connection.
+
+    Returns:
+        The port the server is listening on.
+    """
+    socketserver.ThreadingTCPServer.allow_reuse_address = True
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), SMTPHandler)
+    server.daemon_threads = True
+    server.handshake_delay = handshake_delay
+    threading.Thread(daemon=True, target=server.serve_forever).start()
+
+    return server.server_address[1]
+
+
+def send(messages, get_connection):
+    """
+    Send messages, each over the connection returned by a factory.
+
+    Args:
+        messages:
+            The number of messages to send.
+        get_connection:
+            A function returning the connection to send a message with.
+
+    Returns:
+        The number of messages sent per second.
+    """
+    from django.core import mail
+
+    start = time.perf_counter()
+
+    for i in range(messages):
+        mail.EmailMessage(
+            body="Body",
+            connection=get_connection(),
+            from_email="noreply@example.com",
+            subject=f"Message {i}",
+            to=["test@example.com"],
+        ).send()
+
+    return messages / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--handshake-delay", default=0, type=float)
+    parser.add_argument("--max-messages", default=100, type=int)
+    parser.add_argument("--messages", default=1000, type=int)
+    args = parser.parse_args()
+
+    utils.setup_django()
+
+    from django.conf import settings
+    from django.core import mail as django_mail
+
+    from email_auth import mail
+
+    settings.EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+    settings.EMAIL_HOST = "127.0.0.1"
+    settings.EMAIL_PORT = start_server(args.handshake_delay)
+
+    new = send(args.messages, django_mail.get_connection)
+    print(f"new connection per message: {new:,.0f} messages/s")
+
+    with mail.PersistentConnection(
+        max_messages=args.max_messages
+    ) as connection:
+        persistent = send(args.messages, lambda: connection)
+    print(f"persistent connection: {persistent:,.0f} messages/s")
+
+    print(f"persistent/new throughput ratio: {persistent / new:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Compare the concurrent throughput of the sync and async REST views when
+served by uvicorn.
+
+Requests are made to the email verification request endpoint with
+unregistered addresses, so each request looks up the address and sends
+a notification with the inline sender. Emails are sent to a minimal
+local SMTP server whose greeting can be delayed to simulate a remote
+mail server::
+
+    python -m benchmarks.rest_views --handshake-delay 0.05
+
+Serving the views under ASGI requires Django 3.1 or later and uvicorn.
+"""
+
+import argparse
+import concurrent.futures
+import socket
+import threading
+import time
+import types
+import urllib.parse
+import urllib.request
+
+from benchmarks import mail_connections, utils
+
+
+def get_free_port():
+    """
+    Returns:
+        A port on the loopback interface that is not in use.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+
+        return sock.getsockname()[1]
+
+
+def start_server(app):
+    """
+    Serve an ASGI application with uvicorn in a background thread.
+
+    Args:
+        app:
+            The ASGI application to serve.
+
+    Returns:
+        The port the server is listening on.
+    """
+    import uvicorn
+
+    port = get_free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(app, lifespan="off", log_level="warning", port=port)
+    )
+    threading.Thread(daemon=True, target=server.run).start()
+
+    while not server.started:
+        time.sleep(0.01)
+
+    return port
+
+
+def post(url, index):
+    """
+    Request a verification email for an unregistered address.
+
+    Args:
+        url:
+            The URL of the endpoint.
+        index:
+            The index of the request, used to give each request its own
+            address.
+    """
+    data = urllib.parse.urlencode({"email": f"user-{index}@example.com"})
+    with urllib.request.urlopen(url, data.encode()) as response:
+        assert response.status == 201, response.status
+
+
+def measure(url, requests, concurrency):
+    """
+    Make concurrent requests to an endpoint.
+
+    Args:
+        url:
+            The URL of the endpoint.
+        requests:
+            The total number of requests to make.
+        concurrency:
+            The number of requests in flight at once.
+
+    Returns:
+        The number of requests completed per second.
+    """
+    with concurrent.futures.ThreadPoolExecutor(concurrency) as executor:
+        # Warm up the server and its connections.
+        list(executor.map(post, [url] * concurrency, range(concurrency)))
+
+        start = time.perf_counter()
+        list(executor.map(post, [url] * requests, range(requests)))
+
+        return requests / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", default=50, type=int)
+    parser.add_argument("--handshake-delay", default=0.02, type=float)
+    parser.add_argument("--requests", default=1000, type=int)
+    args = parser.parse_args()
+
+    import django
+
+    try:
+        import uvicorn  # noqa
+    except ImportError:
+        raise SystemExit("This benchmark requires uvicorn.")
+
+    if django.VERSION < (3, 1):
+        raise SystemExit("This benchmark requires Django 3.1 or later.")
+
+    utils.setup_django()
+
+    from django.conf import settings
+    from django.core.handlers.asgi import ASGIHandler
+    from django.urls import path
+
+    from email_auth.interfaces.rest import views
+
+    settings.EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+    settings.EMAIL_HOST = "127.0.0.1"
+    settings.EMAIL_PORT = mail_connections.start_server(args.handshake_delay)
+
+    # Serve both versions of the view side by side.
+    urlconf = types.ModuleType("urlconf")
+    urlconf.urlpatterns = [
+        path("sync/", views.EmailVerificationRequestView.as_view()),
+        path("async/", views.AsyncEmailVerificationRequestView.as_view()),
+    ]
+    settings.ROOT_URLCONF = urlconf
+
+    port = start_server(ASGIHandler())
+
+    results = {}
+    for name in ("sync", "async"):
+        url = f"http://127.0.0.1:{port}/{name}/"
+        results[name] = measure(url, args.requests, args.concurrency)
+        print(f"{name} views: {results[name]:,.0f} requests/s")
+
+    ratio = results["async"] / results["sync"]
+    print(f"async/sync throughput ratio: {ratio:.1f}")
+
+
+if __name__ == "__main__":
+    main()
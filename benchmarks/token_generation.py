@@ -0,0 +1,43 @@
+"""
+Compare generating tokens one character at a time with
+:py:func:`django.utils.crypto.get_random_string` against translating a
+single read of random bytes::
+
+    python -m benchmarks.token_generation
+"""
+
+from benchmarks import utils
+
+
+def main():
+    utils.setup_django()
+
+    from django.utils import crypto
+
+    from email_auth import token_generation
+
+    alphabet = token_generation.ALPHANUMERIC
+    batch = 1000
+
+    baseline = utils.report(
+        "get_random_string",
+        lambda: crypto.get_random_string(64, alphabet),
+        number=10000,
+    )
+    single = utils.report(
+        "generate_token",
+        lambda: token_generation.generate_token(64),
+        number=10000,
+    )
+    batched = utils.report(
+        f"generate_tokens ({batch} per call)",
+        lambda: token_generation.generate_tokens(batch, 64),
+        number=100,
+    )
+
+    print(f"generate_token speedup: {baseline / single:.1f}x")
+    print(f"generate_tokens speedup: {baseline * batch / batched:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
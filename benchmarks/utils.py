@@ -0,0 +1,60 @@
+"""
+Shared setup for the benchmark scripts.
+
+Benchmarks are run from the root of the repository as modules, for
+example::
+
+    python -m benchmarks.authentication
+"""
+
+import os
+import statistics
+import timeit
+
+
+def setup_django():
+    """
+    Configure Django using the test settings and create a throwaway test
+    database for the benchmark to use.
+    """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "test_settings")
+
+    import django
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    django.setup()
+    setup_test_environment()
+    connection.creation.create_test_db(verbosity=0)
+
+
+def report(name, func, number=10, repeat=5):
+    """
+    Time a function and print a summary of the results.
+
+    Args:
+        name:
+            The name to display for the benchmark.
+        func:
+            The function to time.
+        number:
+            The number of calls that make up a single measurement.
+        repeat:
+            The number of measurements to take.
+
+    Returns:
+        The median time per call in seconds.
+    """
+    timings = [
+        total / number
+        for total in timeit.repeat(func, number=number, repeat=repeat)
+    ]
+    median = statistics.median(timings)
+
+    print(
+        f"{name}: median {median * 1000:.3f}ms, "
+        f"min {min(timings) * 1000:.3f}ms, "
+        f"max {max(timings) * 1000:.3f}ms"
+    )
+
+    return median
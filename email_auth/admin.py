@@ -9,7 +9,7 @@ class EmailVerificationInline(admin.TabularInline):
     """
 
     extra = 0
-    fields = ("email", "token", "time_sent", "time_created", "time_updated")
+    fields = ("email", "selector", "time_sent", "time_created", "time_updated")
     model = models.EmailVerification
     readonly_fields = fields
 
@@ -47,6 +47,7 @@ class EmailAddressAdmin(admin.ModelAdmin):
         "time_updated",
     )
     list_filter = ("is_verified",)
+    list_select_related = ("user",)
     readonly_fields = ("time_created", "time_updated")
     search_fields = ("address",)
 
@@ -59,10 +60,11 @@ class EmailVerificationAdmin(admin.ModelAdmin):
 
     autocomplete_fields = ("email",)
     date_hierarchy = "time_created"
-    fields = ("email", "token", "time_sent", "time_created", "time_updated")
+    fields = ("email", "selector", "time_sent", "time_created", "time_updated")
     list_display = ("email", "time_sent", "time_created", "time_updated")
-    readonly_fields = ("time_created", "time_sent", "time_updated", "token")
-    search_fields = ("email__address", "token")
+    list_select_related = ("email",)
+    readonly_fields = ("selector", "time_created", "time_sent", "time_updated")
+    search_fields = ("email__address", "selector")
 
 
 @admin.register(models.PasswordReset)
@@ -73,7 +75,41 @@ class PasswordResetAdmin(admin.ModelAdmin):
 
     autocomplete_fields = ("email",)
     date_hierarchy = "time_created"
-    fields = ("email", "token", "time_sent", "time_created", "time_updated")
+    fields = ("email", "selector", "time_sent", "time_created", "time_updated")
     list_display = ("email", "time_sent", "time_created", "time_updated")
-    readonly_fields = ("time_created", "time_sent", "time_updated", "token")
-    search_fields = ("email__address", "token")
+    list_select_related = ("email",)
+    readonly_fields = ("selector", "time_created", "time_sent", "time_updated")
+    search_fields = ("email__address", "selector")
+
+
+@admin.register(models.OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    """
+    Admin for the ``OutboundEmail`` model.
+    """
+
+    date_hierarchy = "time_created"
+    fields = (
+        "recipients",
+        "from_email",
+        "subject",
+        "body",
+        "html_body",
+        "attempts",
+        "last_error",
+        "time_available",
+        "time_created",
+    )
+    list_display = (
+        "subject",
+        "recipients",
+        "attempts",
+        "time_available",
+        "time_created",
+    )
+    readonly_fields = fields
+    search_fields = ("recipients", "subject")
+
+    # Emails are only added to the outbox by the app.
+    def has_add_permission(self, request):
+        return False
@@ -33,6 +33,88 @@ class AppSettings(object):
 
         return settings_dict.get(name, default)
 
+    @property
+    def ADDRESS_CACHE_TIMEOUT(self) -> Optional[int]:
+        """
+        The number of seconds that the owner of a verified email address
+        is cached for by the authentication backend. Caching is disabled
+        if this is ``None``.
+        """
+        return self._setting("ADDRESS_CACHE_TIMEOUT", None)
+
+    @property
+    def ASYNC_VIEWS(self) -> bool:
+        """
+        A boolean indicating if the REST interface is served by the
+        async versions of its views.
+        """
+        return self._setting("ASYNC_VIEWS", False)
+
+    @property
+    def CACHE_ALIAS(self) -> str:
+        """
+        The alias of the Django cache used by the app.
+        """
+        return self._setting("CACHE_ALIAS", "default")
+
+    @property
+    def EMAIL_COALESCING_WINDOW(self) -> Optional[int]:
+        """
+        The number of seconds during which repeated requests for the
+        same email to the same address share a single send. Requests
+        are not coalesced if this is ``None``.
+        """
+        return self._setting("EMAIL_COALESCING_WINDOW", None)
+
+    @property
+    def EMAIL_CONNECTION_IDLE_TIMEOUT(self) -> Optional[float]:
+        """
+        The number of seconds a reused mail connection may be idle
+        before it is reopened. If this is ``None``, idle connections are
+        not reopened.
+        """
+        return self._setting("EMAIL_CONNECTION_IDLE_TIMEOUT", 30)
+
+    @property
+    def EMAIL_CONNECTION_MAX_MESSAGES(self) -> Optional[int]:
+        """
+        The number of messages sent over a reused mail connection before
+        it is reopened. If this is ``None``, connections are reused for
+        any number of messages.
+        """
+        return self._setting("EMAIL_CONNECTION_MAX_MESSAGES", 100)
+
+    @property
+    def EMAIL_RATE_LIMIT(self) -> Optional[int]:
+        """
+        The maximum number of emails sent to the mail server per second
+        across all processes. Emails are not rate limited if this is
+        ``None``.
+        """
+        return self._setting("EMAIL_RATE_LIMIT", None)
+
+    @property
+    def EMAIL_SENDER(self) -> str:
+        """
+        The import path of the sender that delivers the app's emails.
+        """
+        return self._setting("EMAIL_SENDER", "email_auth.senders.InlineSender")
+
+    @property
+    def EMAIL_SPOOL_BATCH_SIZE(self) -> int:
+        """
+        The number of emails buffered by the spool sender before they
+        are written to the spool file.
+        """
+        return self._setting("EMAIL_SPOOL_BATCH_SIZE", 100)
+
+    @property
+    def EMAIL_SPOOL_PATH(self) -> Optional[str]:
+        """
+        The path of the file that the spool sender appends emails to.
+        """
+        return self._setting("EMAIL_SPOOL_PATH", None)
+
     @property
     def EMAIL_VERIFICATION_URL(self) -> Optional[str]:
         """
@@ -40,6 +122,22 @@ class AppSettings(object):
         """
         return self._setting("EMAIL_VERIFICATION_URL", None)
 
+    @property
+    def EMAIL_VERIFICATION_TTL(self) -> Optional[int]:
+        """
+        The number of seconds that email verification tokens are valid
+        for. Tokens do not expire if this is ``None``.
+        """
+        return self._setting("EMAIL_VERIFICATION_TTL", None)
+
+    @property
+    def PASSWORD_RESET_TTL(self) -> Optional[int]:
+        """
+        The number of seconds that password reset tokens are valid for.
+        Tokens do not expire if this is ``None``.
+        """
+        return self._setting("PASSWORD_RESET_TTL", None)
+
     @property
     def PASSWORD_RESET_URL(self) -> Optional[str]:
         """
@@ -47,6 +145,110 @@ class AppSettings(object):
         """
         return self._setting("PASSWORD_RESET_URL", None)
 
+    @property
+    def LOGIN_THROTTLE_ADDRESS_LIMIT(self) -> Optional[int]:
+        """
+        The number of login attempts allowed for a single email address
+        within the throttling window. Attempts are not throttled by
+        address if this is ``None``.
+        """
+        return self._setting("LOGIN_THROTTLE_ADDRESS_LIMIT", None)
+
+    @property
+    def LOGIN_THROTTLE_IP_LIMIT(self) -> Optional[int]:
+        """
+        The number of login attempts allowed from a single IP address
+        within the throttling window. Attempts are not throttled by IP
+        if this is ``None``.
+        """
+        return self._setting("LOGIN_THROTTLE_IP_LIMIT", None)
+
+    @property
+    def LOGIN_THROTTLE_WINDOW(self) -> int:
+        """
+        The length of the sliding window used to throttle login
+        attempts, in seconds.
+        """
+        return self._setting("LOGIN_THROTTLE_WINDOW", 60)
+
+    @property
+    def PASSWORD_HASHING_CONCURRENCY(self) -> Optional[int]:
+        """
+        The maximum number of passwords the authentication backend may
+        hash at the same time in each process. There is no limit if this
+        is ``None``.
+        """
+        return self._setting("PASSWORD_HASHING_CONCURRENCY", None)
+
+    @property
+    def PASSWORD_HASHING_TIMEOUT(self) -> Optional[float]:
+        """
+        The number of seconds to wait for a hashing slot before failing
+        the authentication attempt. If this is ``None``, there is no
+        time limit.
+        """
+        return self._setting("PASSWORD_HASHING_TIMEOUT", None)
+
+    @property
+    def SIGNED_TOKEN_MAX_AGE(self) -> int:
+        """
+        The number of seconds that tokens issued by the signed token
+        backend are valid for.
+        """
+        return self._setting("SIGNED_TOKEN_MAX_AGE", 60 * 60 * 24)
+
+    @property
+    def TIME_ORDERED_IDS(self) -> bool:
+        """
+        A boolean indicating if new email addresses are given time
+        ordered UUIDs instead of random ones.
+        """
+        return self._setting("TIME_ORDERED_IDS", False)
+
+    @property
+    def TOKEN_ADDRESS_LIMIT(self) -> Optional[int]:
+        """
+        The maximum number of stored email verifications and the maximum
+        number of stored password resets per email address. If this is
+        ``None``, there is no limit.
+        """
+        return self._setting("TOKEN_ADDRESS_LIMIT", None)
+
+    @property
+    def TOKEN_BACKEND(self) -> str:
+        """
+        The import path of the class used to issue and validate email
+        verification and password reset tokens.
+        """
+        return self._setting(
+            "TOKEN_BACKEND", "email_auth.tokens.ModelTokenBackend"
+        )
+
+    @property
+    def TOKEN_LENGTH(self) -> int:
+        """
+        The number of characters in newly generated email verification
+        and password reset tokens.
+        """
+        return self._setting("TOKEN_LENGTH", 64)
+
+    @property
+    def TOKEN_RESEND_INTERVAL(self) -> Optional[int]:
+        """
+        The number of seconds after a stored token is sent during which
+        requests for another token of the same type are ignored. If
+        this is ``None``, every request sends a new token.
+        """
+        return self._setting("TOKEN_RESEND_INTERVAL", None)
+
+    @property
+    def USER_CACHE_TIMEOUT(self) -> Optional[int]:
+        """
+        The number of seconds that users retrieved by the authentication
+        backend are cached for. Caching is disabled if this is ``None``.
+        """
+        return self._setting("USER_CACHE_TIMEOUT", None)
+
 
 # Ugly? Guido recommends this himself ...
 # http://mail.python.org/pipermail/python-ideas/2012-May/014969.html
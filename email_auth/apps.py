@@ -1,4 +1,7 @@
 from django.apps import AppConfig
+from django.contrib.auth import get_user_model
+from django.core.signals import setting_changed
+from django.db.models import signals
 from django.utils.translation import ugettext_lazy as _
 
 
@@ -7,5 +10,46 @@ class EmailAuthConfig(AppConfig):
     Default configuration for the ``email_auth`` package.
     """
 
+    # Keep integer primary keys for models without an explicit primary key
+    # on Django 3.2 and later.
+    default_auto_field = "django.db.models.AutoField"
     name = "email_auth"
     verbose_name = _("Simple Email Authentication")
+
+    def ready(self):
+        """
+        Connect the app's signal receivers.
+        """
+        from email_auth import caching, mail, models, senders
+
+        signals.post_save.connect(
+            caching.invalidate_cached_user_id,
+            dispatch_uid="email_auth.invalidate_cached_user_id.save",
+            sender=models.EmailAddress,
+        )
+        signals.post_delete.connect(
+            caching.invalidate_cached_user_id,
+            dispatch_uid="email_auth.invalidate_cached_user_id.delete",
+            sender=models.EmailAddress,
+        )
+
+        user_model = get_user_model()
+
+        signals.post_save.connect(
+            caching.invalidate_cached_user,
+            dispatch_uid="email_auth.invalidate_cached_user.save",
+            sender=user_model,
+        )
+        signals.post_delete.connect(
+            caching.invalidate_cached_user,
+            dispatch_uid="email_auth.invalidate_cached_user.delete",
+            sender=user_model,
+        )
+
+        setting_changed.connect(
+            mail.clear_template_cache,
+            dispatch_uid="email_auth.clear_template_cache",
+        )
+        setting_changed.connect(
+            senders.reset_senders, dispatch_uid="email_auth.reset_senders"
+        )
@@ -0,0 +1,46 @@
+"""
+Helpers for calling the app's synchronous code from async contexts.
+"""
+
+from asgiref.sync import sync_to_async
+
+
+async def aget(queryset, **kwargs):
+    """
+    Asynchronously retrieve a single object from a queryset.
+
+    The query is run through ``sync_to_async`` in the thread used for
+    database access.
+
+    Args:
+        queryset:
+            The queryset to retrieve the object from.
+        **kwargs:
+            The lookups identifying the object.
+
+    Returns:
+        The object matching the provided lookups.
+    """
+    return await sync_to_async(queryset.get)(**kwargs)
+
+
+async def run_in_thread(func, *args, **kwargs):
+    """
+    Run a CPU bound function in a worker thread so it does not block the
+    event loop.
+
+    The function is not run in the thread used for database access, so
+    it must not make any queries.
+
+    Args:
+        func:
+            The function to run.
+        *args:
+            Positional arguments to pass to the function.
+        **kwargs:
+            Keyword arguments to pass to the function.
+
+    Returns:
+        The return value of the function.
+    """
+    return await sync_to_async(func, thread_sensitive=False)(*args, **kwargs)
@@ -1,8 +1,10 @@
 import logging
 
+from asgiref.sync import sync_to_async
 from django.contrib.auth import get_user_model
+from django.core.exceptions import PermissionDenied
 
-from email_auth import models
+from email_auth import async_utils, caching, hashing, models, throttling
 
 
 logger = logging.getLogger(__name__)
@@ -30,33 +32,193 @@ class VerifiedEmailBackend:
         Returns:
             The user matching the provided credentials if they exist or
             ``None`` if they don't.
+
+        Raises:
+            PermissionDenied:
+                If the attempt exceeds the login throttling limits. This
+                stops Django from trying any other backends.
         """
+        if username is None or password is None:
+            return None
+
+        if throttling.is_login_throttled(request, username):
+            logger.warning("Throttled login attempt for: %s", username)
+            raise PermissionDenied
+
         try:
-            email = models.EmailAddress.objects.get(
-                address=username, is_verified=True
+            return self._authenticate(username, password)
+        except hashing.HashingTimeout:
+            logger.warning(
+                "Timed out waiting to hash the password for: %s", username
             )
-        except models.EmailAddress.DoesNotExist:
+            return None
+
+    async def aauthenticate(self, request, username=None, password=None):
+        """
+        Asynchronous version of :py:meth:`authenticate`.
+
+        Queries are run through ``sync_to_async`` in the thread used for
+        database access. Password hashing is done in a worker thread so
+        that it does not block the event loop.
+        """
+        if username is None or password is None:
+            return None
+
+        if await throttling.ais_login_throttled(request, username):
+            logger.warning("Throttled login attempt for: %s", username)
+            raise PermissionDenied
+
+        try:
+            return await self._aauthenticate(username, password)
+        except hashing.HashingTimeout:
+            logger.warning(
+                "Timed out waiting to hash the password for: %s", username
+            )
+            return None
+
+    def _authenticate(self, username, password):
+        """
+        Look up the owner of a verified email address and check their
+        password.
+
+        Raises:
+            hashing.HashingTimeout:
+                If no hashing slot became available in time.
+        """
+        user = self._get_address_owner(models.normalize_address(username))
+        if user is None:
+            # Do a password comparison anyway to mitigate timing
+            # attacks.
+            hashing.check_dummy_password(password)
+
+            logger.debug("Could not find verified email: %s", username)
+            return None
+
+        with hashing.hashing_slot():
+            is_correct = user.check_password(password)
+
+        if is_correct and user.is_active:
+            logger.debug(
+                "Authenticated user with email '%s': %r", username, user
+            )
+            return user
+
+        return None
+
+    async def _aauthenticate(self, username, password):
+        """
+        Asynchronous version of :py:meth:`_authenticate`.
+        """
+        user = await self._aget_address_owner(
+            models.normalize_address(username)
+        )
+        if user is None:
             # Do a password comparison anyway to mitigate timing
             # attacks.
-            dummy_user = get_user_model()()
-            dummy_user.set_password("jekyll")
-            dummy_user.check_password("hyde")
+            await async_utils.run_in_thread(
+                hashing.check_dummy_password, password
+            )
 
             logger.debug("Could not find verified email: %s", username)
             return None
 
-        if email.user.check_password(password) and email.user.is_active:
+        if await self._acheck_password(user, password) and user.is_active:
             logger.debug(
-                "Authenticated user with email '%s': %r", username, email.user
+                "Authenticated user with email '%s': %r", username, user
             )
-            return email.user
+            return user
 
         return None
 
+    def _get_address_owner(self, normalized_address):
+        """
+        Get the owner of a verified email address.
+
+        If the ``ADDRESS_CACHE_TIMEOUT`` setting is provided, the ID of
+        the owner is cached so that subsequent lookups only need to
+        fetch the user by their primary key. The user is always fetched
+        from the database so that their password and status are current.
+
+        Args:
+            normalized_address:
+                The normalized form of the email address.
+
+        Returns:
+            The user who owns the verified email address or ``None`` if
+            no such address exists.
+        """
+        user_id = caching.get_cached_user_id(normalized_address)
+        if user_id is not None:
+            try:
+                return get_user_model().objects.get(pk=user_id)
+            except get_user_model().DoesNotExist:
+                pass
+
+        try:
+            email = models.EmailAddress.objects.for_login(
+                normalized_address
+            ).get()
+        except models.EmailAddress.DoesNotExist:
+            return None
+        except models.EmailAddress.MultipleObjectsReturned:
+            self._log_ambiguous_address(normalized_address)
+            return None
+
+        caching.cache_user_id(normalized_address, email.user_id)
+
+        return email.user
+
+    async def _aget_address_owner(self, normalized_address):
+        """
+        Asynchronous version of :py:meth:`_get_address_owner`.
+        """
+        user_id = await caching.aget_cached_user_id(normalized_address)
+        if user_id is not None:
+            try:
+                return await async_utils.aget(
+                    get_user_model().objects.all(), pk=user_id
+                )
+            except get_user_model().DoesNotExist:
+                pass
+
+        try:
+            email = await async_utils.aget(
+                models.EmailAddress.objects.for_login(normalized_address)
+            )
+        except models.EmailAddress.DoesNotExist:
+            return None
+        except models.EmailAddress.MultipleObjectsReturned:
+            self._log_ambiguous_address(normalized_address)
+            return None
+
+        await caching.acache_user_id(normalized_address, email.user_id)
+
+        return email.user
+
+    @staticmethod
+    def _log_ambiguous_address(normalized_address):
+        """
+        Log that several verified email addresses differ only in case.
+
+        Such addresses are prevented by a unique index on databases that
+        support partial indexes. On other databases, the address cannot
+        be attributed to a single user, so it is treated as unknown.
+
+        Args:
+            normalized_address:
+                The normalized form of the ambiguous email address.
+        """
+        logger.warning(
+            "Multiple verified email addresses match '%s'.", normalized_address
+        )
+
     def get_user(self, user_id):
         """
         Get a user by their ID.
 
+        If the ``USER_CACHE_TIMEOUT`` setting is provided, users are
+        cached to avoid a query on every authenticated request.
+
         Args:
             user_id:
                 The ID of the user to retrieve.
@@ -65,7 +227,67 @@ class VerifiedEmailBackend:
             The user with the specified ID or ``None`` if there is no
             user with the provided ID.
         """
+        user = caching.get_cached_user(user_id)
+        if user is not None:
+            return user
+
+        try:
+            user = get_user_model().objects.get(pk=user_id)
+        except get_user_model().DoesNotExist:
+            return None
+
+        caching.cache_user(user)
+
+        return user
+
+    async def aget_user(self, user_id):
+        """
+        Asynchronous version of :py:meth:`get_user`.
+        """
+        user = await caching.aget_cached_user(user_id)
+        if user is not None:
+            return user
+
         try:
-            return get_user_model().objects.get(pk=user_id)
+            user = await async_utils.aget(
+                get_user_model().objects.all(), pk=user_id
+            )
         except get_user_model().DoesNotExist:
             return None
+
+        await caching.acache_user(user)
+
+        return user
+
+    @staticmethod
+    async def _acheck_password(user, password):
+        """
+        Check a user's password without blocking the event loop.
+
+        Like ``user.check_password``, the stored hash is upgraded if the
+        password is correct but was hashed with outdated parameters.
+
+        Args:
+            user:
+                The user whose password is being checked.
+            password:
+                The password to check.
+
+        Returns:
+            A boolean indicating if the password is correct.
+        """
+        needs_upgrade = []
+        is_correct = await async_utils.run_in_thread(
+            hashing.check_password,
+            password,
+            user.password,
+            needs_upgrade.append,
+        )
+
+        if needs_upgrade:
+            await async_utils.run_in_thread(user.set_password, password)
+            # Password hash upgrades are not password changes.
+            user._password = None
+            await sync_to_async(user.save)(update_fields=["password"])
+
+        return is_correct
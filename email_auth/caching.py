@@ -0,0 +1,254 @@
+"""
+Caching of data used by the authentication backend.
+
+All data is stored in the cache specified by the ``CACHE_ALIAS``
+setting.
+"""
+
+import hashlib
+
+from django.core.cache import caches
+
+from email_auth import app_settings, async_utils
+
+
+def get_cache():
+    """
+    Returns:
+        The cache used by the app.
+    """
+    return caches[app_settings.CACHE_ALIAS]
+
+
+def increment(key, timeout):
+    """
+    Atomically increment a counter in the cache, creating it if it does
+    not exist.
+
+    Args:
+        key:
+            The cache key of the counter.
+        timeout:
+            The number of seconds the counter is kept for after it is
+            created or ``None`` to keep it indefinitely.
+
+    Returns:
+        The value of the counter after it was incremented.
+    """
+    cache = get_cache()
+    cache.add(key, 0, timeout=timeout)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # The counter expired between creating and incrementing it.
+        cache.set(key, 1, timeout=timeout)
+
+        return 1
+
+
+def make_key(prefix, value):
+    """
+    Build a cache key for a value provided by a user.
+
+    Args:
+        prefix:
+            The prefix identifying the type of data stored under the
+            key, eg ``"email_auth:address"``.
+        value:
+            The value the data is stored for.
+
+    Returns:
+        The cache key. The value is hashed so that arbitrary user input
+        produces a valid cache key.
+    """
+    digest = hashlib.sha256(value.encode()).hexdigest()
+
+    return f"{prefix}:{digest}"
+
+
+def get_address_cache_key(normalized_address):
+    """
+    Args:
+        normalized_address:
+            A normalized email address.
+
+    Returns:
+        The cache key that the ID of the owner of the provided address
+        is stored under.
+    """
+    return make_key("email_auth:address", normalized_address)
+
+
+def get_cached_user_id(normalized_address):
+    """
+    Retrieve the ID of the owner of a verified email address from the
+    cache.
+
+    Args:
+        normalized_address:
+            The normalized form of the verified email address.
+
+    Returns:
+        The ID of the user who owns the address or ``None`` if it is
+        not cached or address caching is disabled.
+    """
+    if app_settings.ADDRESS_CACHE_TIMEOUT is None:
+        return None
+
+    return get_cache().get(get_address_cache_key(normalized_address))
+
+
+async def aget_cached_user_id(normalized_address):
+    """
+    Asynchronous version of :py:func:`get_cached_user_id`.
+    """
+    if app_settings.ADDRESS_CACHE_TIMEOUT is None:
+        return None
+
+    return await async_utils.run_in_thread(
+        get_cached_user_id, normalized_address
+    )
+
+
+def cache_user_id(normalized_address, user_id):
+    """
+    Store the ID of the owner of a verified email address if address
+    caching is enabled.
+
+    Args:
+        normalized_address:
+            The normalized form of the verified email address.
+        user_id:
+            The ID of the user who owns the address.
+    """
+    timeout = app_settings.ADDRESS_CACHE_TIMEOUT
+    if timeout is None:
+        return
+
+    get_cache().set(
+        get_address_cache_key(normalized_address), user_id, timeout
+    )
+
+
+async def acache_user_id(normalized_address, user_id):
+    """
+    Asynchronous version of :py:func:`cache_user_id`.
+    """
+    if app_settings.ADDRESS_CACHE_TIMEOUT is None:
+        return
+
+    await async_utils.run_in_thread(cache_user_id, normalized_address, user_id)
+
+
+def invalidate_cached_user_id(sender, instance, **kwargs):
+    """
+    Signal receiver that removes the cached owner of an email address
+    when the address is saved or deleted.
+
+    Saving an address covers it being verified, unverified, changed, or
+    moved to another user. Both the address the instance was loaded with
+    and its current address are invalidated.
+
+    Args:
+        sender:
+            The email address model.
+        instance:
+            The email address that was saved or deleted.
+    """
+    if app_settings.ADDRESS_CACHE_TIMEOUT is None:
+        return
+
+    # Avoid triggering a query if the address was not loaded.
+    addresses = {
+        instance.__dict__.get("normalized_address"),
+        getattr(instance, "_loaded_normalized_address", None),
+    }
+    keys = [get_address_cache_key(a) for a in addresses if a is not None]
+
+    get_cache().delete_many(keys)
+
+
+def get_user_cache_key(user_id):
+    """
+    Args:
+        user_id:
+            The primary key of a user.
+
+    Returns:
+        The cache key that the user with the provided ID is stored
+        under.
+    """
+    return f"email_auth:user:{user_id}"
+
+
+def get_cached_user(user_id):
+    """
+    Retrieve a user from the cache.
+
+    Args:
+        user_id:
+            The primary key of the user to retrieve.
+
+    Returns:
+        The cached user or ``None`` if the user is not cached or user
+        caching is disabled.
+    """
+    if app_settings.USER_CACHE_TIMEOUT is None:
+        return None
+
+    return get_cache().get(get_user_cache_key(user_id))
+
+
+async def aget_cached_user(user_id):
+    """
+    Asynchronous version of :py:func:`get_cached_user`.
+    """
+    if app_settings.USER_CACHE_TIMEOUT is None:
+        return None
+
+    return await async_utils.run_in_thread(get_cached_user, user_id)
+
+
+def cache_user(user):
+    """
+    Store a user in the cache if user caching is enabled.
+
+    Args:
+        user:
+            The user to cache.
+    """
+    timeout = app_settings.USER_CACHE_TIMEOUT
+    if timeout is None:
+        return
+
+    get_cache().set(get_user_cache_key(user.pk), user, timeout)
+
+
+async def acache_user(user):
+    """
+    Asynchronous version of :py:func:`cache_user`.
+    """
+    if app_settings.USER_CACHE_TIMEOUT is None:
+        return
+
+    await async_utils.run_in_thread(cache_user, user)
+
+
+def invalidate_cached_user(sender, instance, **kwargs):
+    """
+    Signal receiver that removes a user from the cache when they are
+    saved or deleted.
+
+    Saving a user covers any change that affects authentication, such as
+    a new password or the user being deactivated.
+
+    Args:
+        sender:
+            The user model.
+        instance:
+            The user that was saved or deleted.
+    """
+    if app_settings.USER_CACHE_TIMEOUT is None:
+        return
+
+    get_cache().delete(get_user_cache_key(instance.pk))
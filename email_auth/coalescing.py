@@ -0,0 +1,134 @@
+"""
+Coalescing of repeated requests for the same email.
+
+Requests for the same type of email to the same normalized address
+within the ``EMAIL_COALESCING_WINDOW`` share a single send. The first
+request adds a marker to the cache specified by the ``CACHE_ALIAS``
+setting and later requests inside the window skip the lookup, token
+issue, and send entirely. A shared cache must be used for requests to be
+coalesced across processes.
+"""
+
+from email_auth import app_settings, async_utils, caching, models
+
+
+def get_marker_key(email_type, address):
+    """
+    Args:
+        email_type:
+            The type of email being requested, eg ``"verification"``.
+        address:
+            The email address the email is requested for. It does not
+            need to be normalized.
+
+    Returns:
+        The cache key of the marker recording that the email is being
+        sent.
+    """
+    return caching.make_key(
+        f"email_auth:coalesce:{email_type}", models.normalize_address(address),
+    )
+
+
+def claim(email_type, address):
+    """
+    Claim the send of an email for the current request.
+
+    Args:
+        email_type:
+            The type of email being requested, eg ``"verification"``.
+        address:
+            The email address the email is requested for.
+
+    Returns:
+        A boolean indicating if the request should send the email. This
+        is always ``True`` if coalescing is disabled.
+    """
+    window = app_settings.EMAIL_COALESCING_WINDOW
+    if window is None:
+        return True
+
+    # ``add`` only succeeds for the first request in the window.
+    return caching.get_cache().add(
+        get_marker_key(email_type, address), True, timeout=window
+    )
+
+
+def release(email_type, address):
+    """
+    Release a claim on the send of an email so that the next request
+    tries again.
+
+    Args:
+        email_type:
+            The type of email being requested, eg ``"verification"``.
+        address:
+            The email address the email is requested for.
+    """
+    if app_settings.EMAIL_COALESCING_WINDOW is not None:
+        caching.get_cache().delete(get_marker_key(email_type, address))
+
+
+class Coalesce:
+    """
+    Context manager that determines if a request for an email should
+    send it or share the send of an earlier request.
+
+    It can be used with both ``with`` and ``async with``. If the block
+    raises an exception, the claim is released so that the next request
+    tries again.
+
+    Entering the context gives a boolean indicating if the request
+    should send the email. This is always ``True`` if coalescing is
+    disabled.
+    """
+
+    def __init__(self, email_type, address):
+        """
+        Args:
+            email_type:
+                The type of email being requested, eg
+                ``"verification"``.
+            address:
+                The email address the email is requested for.
+        """
+        self.address = address
+        self.claimed = False
+        self.email_type = email_type
+
+    def __enter__(self):
+        self.claimed = claim(self.email_type, self.address)
+
+        return self.claimed
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.claimed and exc_type is not None:
+            release(self.email_type, self.address)
+
+    async def __aenter__(self):
+        # The cache client may block, so it is kept off the event loop.
+        self.claimed = await async_utils.run_in_thread(
+            claim, self.email_type, self.address
+        )
+
+        return self.claimed
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if self.claimed and exc_type is not None:
+            await async_utils.run_in_thread(
+                release, self.email_type, self.address
+            )
+
+
+def coalesce(email_type, address):
+    """
+    Args:
+        email_type:
+            The type of email being requested, eg ``"verification"``.
+        address:
+            The email address the email is requested for.
+
+    Returns:
+        A :py:class:`Coalesce` context manager for the request.
+    """
+    return Coalesce(email_type, address)
@@ -1,14 +1,58 @@
 from unittest import mock
 
 import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
 
 from email_auth import models
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """
+    Clear all caches after each test so cached data does not leak
+    between tests.
+    """
+    yield
+
+    for cache in caches.all():
+        cache.clear()
+
+
+@pytest.fixture
+def email(db):
+    """
+    An unverified email address owned by a user whose password is
+    ``"password"``.
+    """
+    user = get_user_model().objects.create_user(
+        password="password", username="test-user"
+    )
+
+    return models.EmailAddress.objects.create(
+        address="test@example.com", user=user
+    )
+
+
+@pytest.fixture
+def verified_email(email):
+    """
+    A verified version of the ``email`` fixture.
+    """
+    email.is_verified = True
+    email.save()
+
+    return email
+
+
 @pytest.fixture
 def mock_email_address_qs():
     mock_qs = mock.Mock(spec=models.EmailAddress.objects)
     mock_qs.all.return_value = mock_qs
+    mock_qs.for_address.return_value = mock_qs
+    mock_qs.for_login.return_value = mock_qs
+    mock_qs.verified.return_value = mock_qs
+    mock_qs.with_user.return_value = mock_qs
 
     with mock.patch("email_auth.models.EmailAddress.objects", new=mock_qs):
         yield mock_qs
@@ -18,6 +62,7 @@ def mock_email_address_qs():
 def mock_email_verification_qs():
     mock_qs = mock.Mock(spec=models.EmailVerification.objects)
     mock_qs.all.return_value = mock_qs
+    mock_qs.select_related.return_value = mock_qs
 
     with mock.patch(
         "email_auth.models.EmailVerification.objects", new=mock_qs
@@ -29,6 +74,7 @@ def mock_email_verification_qs():
 def mock_password_reset_qs():
     mock_qs = mock.Mock(spec=models.PasswordReset.objects)
     mock_qs.all.return_value = mock_qs
+    mock_qs.select_related.return_value = mock_qs
 
     with mock.patch("email_auth.models.PasswordReset.objects", new=mock_qs):
         yield mock_qs
@@ -0,0 +1,172 @@
+"""
+Global rate limiting of outgoing email.
+
+Sends are governed by a token bucket holding up to ``EMAIL_RATE_LIMIT``
+tokens that is refilled continuously at ``EMAIL_RATE_LIMIT`` tokens per
+second. Each email sent to the mail server takes a token, so a second's
+worth of emails can be sent at once after the bucket has been idle, but
+the sustained rate never exceeds the limit. The bucket is stored in the
+cache specified by the ``CACHE_ALIAS`` setting, so a shared cache must
+be used for the limit to apply across processes.
+
+Emails that cannot get a token while a request is processed are saved
+to the outbox instead of failing the request. The ``dispatch_emails``
+command waits for tokens before sending them.
+"""
+
+import contextlib
+import time
+
+from email_auth import app_settings, caching, senders, signals
+
+
+# The key of the number of tokens in the bucket and the time it was
+# last updated.
+BUCKET_KEY = "email_auth:governor:bucket"
+
+# The key of the lock held while the bucket is updated.
+LOCK_KEY = "email_auth:governor:lock"
+
+# The number of seconds before the lock expires in case the process
+# holding it dies before releasing it.
+LOCK_TIMEOUT = 1
+
+# The key of the counter of emails deferred to the outbox.
+DEFERRED_COUNT_KEY = "email_auth:governor:deferred"
+
+
+@contextlib.contextmanager
+def lock_bucket():
+    """
+    Hold the lock on the bucket so that it can be read and updated
+    atomically.
+    """
+    cache = caching.get_cache()
+    while not cache.add(LOCK_KEY, True, timeout=LOCK_TIMEOUT):
+        time.sleep(0.001)
+
+    try:
+        yield
+    finally:
+        cache.delete(LOCK_KEY)
+
+
+def get_tokens(limit, now):
+    """
+    Args:
+        limit:
+            The value of the ``EMAIL_RATE_LIMIT`` setting.
+        now:
+            The current Unix time.
+
+    Returns:
+        The number of tokens in the bucket after refilling it for the
+        time since it was last updated.
+    """
+    state = caching.get_cache().get(BUCKET_KEY)
+    if state is None:
+        return limit
+
+    tokens, updated = state
+    # Clocks of different hosts may disagree, so time never runs
+    # backwards for the bucket.
+    elapsed = max(now - updated, 0)
+
+    return min(tokens + elapsed * limit, limit)
+
+
+def take(limit):
+    """
+    Take a token from the bucket if one is available.
+
+    Args:
+        limit:
+            The value of the ``EMAIL_RATE_LIMIT`` setting.
+
+    Returns:
+        ``0`` if a token was taken, otherwise the number of seconds
+        until the next token is added to the bucket.
+    """
+    with lock_bucket():
+        now = time.time()
+        tokens = get_tokens(limit, now)
+        if tokens >= 1:
+            # A missing bucket is full, and an idle bucket is refilled
+            # within a second, so it only needs to be kept briefly.
+            caching.get_cache().set(BUCKET_KEY, (tokens - 1, now), timeout=2)
+
+            return 0
+
+    if limit == 0:
+        return 1
+
+    return (1 - tokens) / limit
+
+
+def acquire():
+    """
+    Take a token from the bucket if one is available.
+
+    Returns:
+        A boolean indicating if a token was taken. This is always
+        ``True`` if the ``EMAIL_RATE_LIMIT`` setting is ``None``.
+    """
+    limit = app_settings.EMAIL_RATE_LIMIT
+    if limit is None:
+        return True
+
+    return take(limit) == 0
+
+
+def wait():
+    """
+    Block until a token has been taken from the bucket.
+    """
+    while True:
+        limit = app_settings.EMAIL_RATE_LIMIT
+        if limit is None:
+            return
+
+        delay = take(limit)
+        if not delay:
+            return
+
+        # Check at least once a second in case the limit is changed.
+        time.sleep(min(delay, 1))
+
+
+def defer(message):
+    """
+    Save a message to the outbox to be sent once tokens are available.
+
+    Args:
+        message:
+            The message that could not get a token.
+    """
+    senders.OutboxSender().send_messages([message])
+
+    caching.increment(DEFERRED_COUNT_KEY, timeout=None)
+
+    signals.email_deferred.send(sender=None, message=message)
+
+
+def get_available_tokens():
+    """
+    Returns:
+        The number of whole tokens in the bucket or ``None`` if the
+        ``EMAIL_RATE_LIMIT`` setting is ``None``.
+    """
+    limit = app_settings.EMAIL_RATE_LIMIT
+    if limit is None:
+        return None
+
+    return int(get_tokens(limit, time.time()))
+
+
+def get_deferred_count():
+    """
+    Returns:
+        The number of emails that have been deferred to the outbox since
+        the counter was last evicted from the cache.
+    """
+    return caching.get_cache().get(DEFERRED_COUNT_KEY, 0)
@@ -0,0 +1,170 @@
+"""
+Password hashing helpers used by the authentication backend.
+"""
+
+import contextlib
+import logging
+import threading
+import time
+
+from django.contrib.auth import hashers
+from django.utils import crypto
+
+from email_auth import app_settings, signals
+
+
+logger = logging.getLogger(__name__)
+
+
+# Dummy password hashes keyed by the class of the hasher that generated
+# them.
+_dummy_password_hashes = {}
+
+# Semaphores limiting concurrent hashing keyed by the number of hashes
+# they allow at once.
+_semaphores = {}
+_semaphores_lock = threading.Lock()
+
+
+class HashingTimeout(Exception):
+    """
+    Exception raised when no hashing slot becomes available before the
+    ``PASSWORD_HASHING_TIMEOUT`` is exceeded.
+    """
+
+
+def _get_semaphore(limit):
+    """
+    Args:
+        limit:
+            The maximum number of concurrent hashes.
+
+    Returns:
+        The semaphore shared by all callers using the provided limit.
+    """
+    with _semaphores_lock:
+        if limit not in _semaphores:
+            _semaphores[limit] = threading.BoundedSemaphore(limit)
+
+        return _semaphores[limit]
+
+
+@contextlib.contextmanager
+def hashing_slot():
+    """
+    Context manager that reserves one of the hashing slots configured by
+    the ``PASSWORD_HASHING_CONCURRENCY`` setting while its body runs.
+
+    The time spent waiting for a slot and the time spent in the body are
+    reported through the :py:data:`email_auth.signals.password_hashed`
+    signal.
+
+    Raises:
+        HashingTimeout:
+            If no slot becomes available before the
+            ``PASSWORD_HASHING_TIMEOUT`` is exceeded.
+    """
+    limit = app_settings.PASSWORD_HASHING_CONCURRENCY
+    semaphore = _get_semaphore(limit) if limit is not None else None
+
+    wait_start = time.perf_counter()
+    if semaphore is not None:
+        timeout = app_settings.PASSWORD_HASHING_TIMEOUT
+        if not semaphore.acquire(timeout=timeout):
+            wait_time = time.perf_counter() - wait_start
+            signals.password_hashing_timed_out.send(
+                sender=None, wait_time=wait_time
+            )
+
+            raise HashingTimeout(
+                f"No hashing slot became available after {wait_time:.3f}s."
+            )
+
+    hash_start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if semaphore is not None:
+            semaphore.release()
+
+    hash_time = time.perf_counter() - hash_start
+    wait_time = hash_start - wait_start
+
+    logger.debug(
+        "Hashed password after waiting %.3fs for %.3fs", wait_time, hash_time
+    )
+    signals.password_hashed.send(
+        sender=None, hash_time=hash_time, wait_time=wait_time
+    )
+
+
+def check_password(password, encoded, setter=None):
+    """
+    Check a password against an encoded hash while holding a hashing
+    slot.
+
+    Args:
+        password:
+            The raw password to check.
+        encoded:
+            The encoded password hash to check against.
+        setter:
+            An optional callable that is passed the raw password if it
+            is correct but the hash needs to be upgraded.
+
+    Returns:
+        A boolean indicating if the password matches the hash.
+
+    Raises:
+        HashingTimeout:
+            If no hashing slot became available in time.
+    """
+    with hashing_slot():
+        return hashers.check_password(password, encoded, setter)
+
+
+def get_dummy_password_hash():
+    """
+    Get a hash of a random password generated with the default password
+    hasher.
+
+    The hash is only computed the first time it is requested for each
+    hasher so that checking a password against it costs exactly one
+    hash.
+
+    Returns:
+        The encoded hash of a random password.
+    """
+    hasher = hashers.get_hasher()
+    hasher_class = type(hasher)
+
+    if hasher_class not in _dummy_password_hashes:
+        _dummy_password_hashes[hasher_class] = hashers.make_password(
+            crypto.get_random_string(length=32), hasher=hasher
+        )
+
+    return _dummy_password_hashes[hasher_class]
+
+
+def check_dummy_password(password):
+    """
+    Check a password against the dummy password hash.
+
+    This is used to make authentication attempts for unknown users take
+    as long as attempts for known users in order to mitigate timing
+    attacks.
+
+    Args:
+        password:
+            The password to check.
+
+    Returns:
+        ``False``. The password never matches the dummy hash.
+
+    Raises:
+        HashingTimeout:
+            If no hashing slot became available in time.
+    """
+    check_password(password, get_dummy_password_hash())
+
+    return False
@@ -1,14 +1,14 @@
 import logging
-from typing import Optional
 
-import email_utils
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.contrib.auth import password_validation
-from django.core.exceptions import ValidationError
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.db import IntegrityError
 from django.utils.translation import ugettext_lazy as _
 from rest_framework import serializers
 
-from email_auth import models
+from email_auth import async_utils, coalescing, mail, models, tokens
 
 
 logger = logging.getLogger(__name__)
@@ -21,7 +21,29 @@ class EmailVerificationRequestSerializer(serializers.Serializer):
 
     email = serializers.EmailField()
 
-    def save(self, **kwargs) -> Optional[models.EmailVerification]:
+    async def ais_valid(self, raise_exception=False):
+        """
+        Asynchronous version of ``is_valid()``. Validation does not
+        query the database, so it is run directly.
+        """
+        return self.is_valid(raise_exception=raise_exception)
+
+    async def asave(self, **kwargs):
+        """
+        Asynchronous version of :py:meth:`save`.
+
+        Returns:
+            The verification issued by the token backend if one was
+            issued or else ``None``.
+        """
+        address = self.validated_data["email"]
+        async with coalescing.coalesce("verification", address) as should_send:
+            if not should_send:
+                return None
+
+            return await self._asend(address)
+
+    def save(self, **kwargs):
         """
         Send the appropriate email notification to the provided email
         address. If the email address exists in the database but has not
@@ -31,13 +53,37 @@ class EmailVerificationRequestSerializer(serializers.Serializer):
         system, we advice the user to register or add the email address
         to their account first.
 
+        Identical requests within the ``EMAIL_COALESCING_WINDOW`` share
+        the first request's email and take no action.
+
         Returns:
-            The :py:class:`EmailVerification` instance that was created
-            if one was created or else ``None``.
+            The verification issued by the token backend if one was
+            issued or else ``None``.
+        """
+        address = self.validated_data["email"]
+        with coalescing.coalesce("verification", address) as should_send:
+            if not should_send:
+                return None
+
+            return self._send(address)
+
+    def _send(self, address):
+        """
+        Send the appropriate email for the provided address.
+
+        Args:
+            address:
+                The email address provided by the user.
+
+        Returns:
+            The verification issued by the token backend if one was
+            issued or else ``None``.
         """
         try:
-            email_inst = models.EmailAddress.objects.get(
-                address__iexact=self.validated_data["email"]
+            email_inst = (
+                models.EmailAddress.objects.for_address(address)
+                .with_user()
+                .get()
             )
         except models.EmailAddress.DoesNotExist:
             self._send_missing_email_notification()
@@ -49,10 +95,48 @@ class EmailVerificationRequestSerializer(serializers.Serializer):
 
             return None
 
-        verification = models.EmailVerification(email=email_inst)
-        verification.send_email()
+        return tokens.get_token_backend().send_verification(email_inst)
 
-        return verification
+    async def _asend(self, address):
+        """
+        Asynchronous version of :py:meth:`_send`.
+
+        Queries are run in the thread used for database access. Issuing
+        a token saves it in the same transaction as its email, so the
+        token backend is called from that thread as a single step.
+        """
+        try:
+            email_inst = await async_utils.aget(
+                models.EmailAddress.objects.for_address(address).with_user()
+            )
+        except models.EmailAddress.DoesNotExist:
+            await mail.asend_email(**self._get_missing_email_notification())
+
+            return None
+
+        if email_inst.is_verified:
+            await email_inst.asend_already_verified()
+
+            return None
+
+        return await sync_to_async(
+            tokens.get_token_backend().send_verification
+        )(email_inst)
+
+    def _get_missing_email_notification(self):
+        """
+        Returns:
+            The arguments for :py:func:`email_auth.mail.send_email` that
+            describe the email informing the user they need to register
+            or add the email to their account before they can verify it.
+        """
+        return {
+            "context": {"email": self.validated_data["email"]},
+            "from_email": settings.DEFAULT_FROM_EMAIL,
+            "recipient_list": [self.validated_data["email"]],
+            "subject": _("Unregistered Email Address"),
+            "template_name": "email_auth/emails/unregistered-email",
+        }
 
     def _send_missing_email_notification(self):
         """
@@ -60,13 +144,7 @@ class EmailVerificationRequestSerializer(serializers.Serializer):
         need to register or add the email to their account before they
         can verify it.
         """
-        email_utils.send_email(
-            context={"email": self.validated_data["email"]},
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[self.validated_data["email"]],
-            subject=_("Unregistered Email Address"),
-            template_name="email_auth/emails/unregistered-email",
-        )
+        mail.send_email(**self._get_missing_email_notification())
 
 
 class EmailVerificationSerializer(serializers.Serializer):
@@ -74,18 +152,56 @@ class EmailVerificationSerializer(serializers.Serializer):
     Serializer used to verify email addresses using verification tokens.
     """
 
-    token = serializers.CharField(
-        max_length=models.TOKEN_LENGTH, write_only=True
-    )
+    token = serializers.CharField(write_only=True)
+
+    _verification = None
+
+    async def ais_valid(self, raise_exception=False):
+        """
+        Asynchronous version of ``is_valid()``. Validating the token
+        queries the database, so it is run in the thread used for
+        database access.
+        """
+        return await sync_to_async(self.is_valid)(
+            raise_exception=raise_exception
+        )
 
-    _verification: models.EmailVerification = None
+    async def asave(self, **kwargs):
+        """
+        Asynchronous version of :py:meth:`save`. Verification uses a
+        transaction, so it is run in the thread used for database
+        access.
+        """
+        await sync_to_async(self.save)(**kwargs)
 
     def save(self, **kwargs):
         """
         Mark the email address associated with the token as verified and
         delete the verification token.
+
+        Raises:
+            serializers.ValidationError:
+                If the token was used by another request after it was
+                validated or another account has already verified the
+                same address.
         """
-        self._verification.verify()
+        try:
+            self._verification.verify()
+        except ObjectDoesNotExist:
+            raise serializers.ValidationError(
+                {"token": _("The provided verification token is invalid.")}
+            )
+        except (IntegrityError, ValidationError):
+            # Verified addresses that differ only in case are rejected
+            # when verifying them and by a unique index.
+            raise serializers.ValidationError(
+                {
+                    "token": _(
+                        "This email address has already been verified by "
+                        "another account."
+                    )
+                }
+            )
 
     def validate_token(self, token):
         """
@@ -103,10 +219,10 @@ class EmailVerificationSerializer(serializers.Serializer):
                 If the token is invalid.
         """
         try:
-            self._verification = models.EmailVerification.objects.get(
-                token=token
+            self._verification = tokens.get_token_backend().get_verification(
+                token
             )
-        except models.EmailVerification.DoesNotExist:
+        except tokens.InvalidToken:
             raise serializers.ValidationError(
                 _("The provided verification token is invalid.")
             )
@@ -122,27 +238,94 @@ class PasswordResetRequestSerializer(serializers.Serializer):
 
     email = serializers.EmailField()
 
-    def save(self, **kwargs) -> Optional[models.PasswordReset]:
+    async def ais_valid(self, raise_exception=False):
+        """
+        Asynchronous version of ``is_valid()``. Validation does not
+        query the database, so it is run directly.
+        """
+        return self.is_valid(raise_exception=raise_exception)
+
+    async def asave(self, **kwargs):
+        """
+        Asynchronous version of :py:meth:`save`.
+
+        Returns:
+            The password reset issued by the token backend if one was
+            issued or else ``None``.
+        """
+        address = self.validated_data["email"]
+        async with coalescing.coalesce(
+            "password_reset", address
+        ) as should_send:
+            if not should_send:
+                return None
+
+            return await self._asend(address)
+
+    def save(self, **kwargs):
         """
         Send a new password reset token to the provided email address if
         the email has already been verified. If the provided email has
         not been verified, no action is taken.
 
+        Identical requests within the ``EMAIL_COALESCING_WINDOW`` share
+        the first request's email and take no action.
+
+        Returns:
+            The password reset issued by the token backend if one was
+            issued or else ``None``.
+        """
+        address = self.validated_data["email"]
+        with coalescing.coalesce("password_reset", address) as should_send:
+            if not should_send:
+                return None
+
+            return self._send(address)
+
+    def _send(self, address):
+        """
+        Send a password reset to the provided address if it is verified.
+
+        Args:
+            address:
+                The email address provided by the user.
+
         Returns:
-            The created :py:class:`PasswordReset` instance if one was
-            created or else ``None``.
+            The password reset issued by the token backend if one was
+            issued or else ``None``.
         """
         try:
-            email = models.EmailAddress.objects.get(
-                address__iexact=self.validated_data["email"], is_verified=True
+            email = (
+                models.EmailAddress.objects.for_address(address)
+                .verified()
+                .with_user()
+                .get()
             )
         except models.EmailAddress.DoesNotExist:
             return None
 
-        reset = models.PasswordReset(email=email)
-        reset.send_email()
+        return tokens.get_token_backend().send_password_reset(email)
+
+    async def _asend(self, address):
+        """
+        Asynchronous version of :py:meth:`_send`.
+
+        Queries are run in the thread used for database access. Issuing
+        a token saves it in the same transaction as its email, so the
+        token backend is called from that thread as a single step.
+        """
+        try:
+            email = await async_utils.aget(
+                models.EmailAddress.objects.for_address(address)
+                .verified()
+                .with_user()
+            )
+        except models.EmailAddress.DoesNotExist:
+            return None
 
-        return reset
+        return await sync_to_async(
+            tokens.get_token_backend().send_password_reset
+        )(email)
 
 
 class PasswordResetSerializer(serializers.Serializer):
@@ -153,25 +336,44 @@ class PasswordResetSerializer(serializers.Serializer):
     password = serializers.CharField(
         style={"input_type": "password"}, write_only=True
     )
-    token = serializers.CharField(
-        max_length=models.TOKEN_LENGTH, write_only=True
-    )
+    token = serializers.CharField(write_only=True)
+
+    _reset = None
+
+    async def ais_valid(self, raise_exception=False):
+        """
+        Asynchronous version of ``is_valid()``. Validating the token
+        queries the database, so it is run in the thread used for
+        database access.
+        """
+        return await sync_to_async(self.is_valid)(
+            raise_exception=raise_exception
+        )
 
-    _reset: models.PasswordReset = None
+    async def asave(self, **kwargs):
+        """
+        Asynchronous version of :py:meth:`save`. Resetting the password
+        uses a transaction, so it is run in the thread used for
+        database access.
+        """
+        await sync_to_async(self.save)(**kwargs)
 
     def save(self, **kwargs):
         """
         Reset the password of the user associated with the provided
         password reset token.
-        """
-        reset = self._reset
-        user = reset.email.user
-        user.set_password(self.validated_data["password"])
-        user.save()
-
-        logger.info("Reset the password for user %r", user)
 
-        reset.delete()
+        Raises:
+            serializers.ValidationError:
+                If the token was used by another request after it was
+                validated.
+        """
+        try:
+            self._reset.reset_password(self.validated_data["password"])
+        except ObjectDoesNotExist:
+            raise serializers.ValidationError(
+                {"token": _("The provided password reset token is invalid.")}
+            )
 
     def validate(self, attrs: dict) -> dict:
         """
@@ -186,10 +388,10 @@ class PasswordResetSerializer(serializers.Serializer):
             The validated data.
         """
         try:
-            self._reset = models.PasswordReset.objects.get(
-                token=attrs["token"]
+            self._reset = tokens.get_token_backend().get_password_reset(
+                attrs["token"]
             )
-        except models.PasswordReset.DoesNotExist:
+        except tokens.InvalidToken:
             raise serializers.ValidationError(
                 {"token": _("The provided password reset token is invalid.")}
             )
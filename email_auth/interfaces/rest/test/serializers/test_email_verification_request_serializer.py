@@ -28,9 +28,7 @@ def test_save_unverified_email(_, mock_email_address_qs):
     assert serializer.is_valid()
     verification = serializer.save()
 
-    assert mock_email_address_qs.get.call_args[1] == {
-        "address__iexact": email.address
-    }
+    assert mock_email_address_qs.for_address.call_args[0] == (email.address,)
     assert verification.email == email
     assert verification.send_email.call_count == 1
 
@@ -51,14 +49,12 @@ def test_save_verified_email(_, mock_email_address_qs):
     assert serializer.is_valid()
     verification = serializer.save()
 
-    assert mock_email_address_qs.get.call_args[1] == {
-        "address__iexact": email.address
-    }
+    assert mock_email_address_qs.for_address.call_args[0] == (email.address,)
     assert verification is None
     assert email.send_already_verified.call_count == 1
 
 
-@mock.patch("email_auth.interfaces.rest.serializers.email_utils.send_email")
+@mock.patch("email_auth.interfaces.rest.serializers.mail.send_email")
 def test_save_missing_email(mock_send_email, mock_email_address_qs):
     """
     If the provided email doesn't exist in the database, an email should
@@ -73,9 +69,7 @@ def test_save_missing_email(mock_send_email, mock_email_address_qs):
     assert serializer.is_valid()
     verification = serializer.save()
 
-    assert mock_email_address_qs.get.call_args[1] == {
-        "address__iexact": data["email"]
-    }
+    assert mock_email_address_qs.for_address.call_args[0] == (data["email"],)
     assert verification is None
     assert mock_send_email.call_args[1] == {
         "context": {"email": data["email"]},
@@ -1,6 +1,8 @@
 from unittest import mock
 
 import pytest
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError
 
 from email_auth import models
 
@@ -19,7 +21,7 @@ def test_save_valid_data(mock_verify, mock_email_verification_qs):
     associated with the token as verified and delete the token.
     """
     verification = models.EmailVerification()
-    mock_email_verification_qs.get.return_value = verification
+    mock_email_verification_qs.get_by_token.return_value = verification
 
     data = {"token": verification.token}
     serializer = serializers.EmailVerificationSerializer(data=data)
@@ -29,9 +31,31 @@ def test_save_valid_data(mock_verify, mock_email_verification_qs):
 
     assert serializer.data == {}
     assert mock_verify.call_count == 1
-    assert mock_email_verification_qs.get.call_args[1] == {
-        "token": verification.token
-    }
+    assert mock_email_verification_qs.get_by_token.call_args[0] == (
+        verification.token,
+    )
+
+
+@pytest.mark.parametrize(
+    "error", [IntegrityError, DjangoValidationError("Already verified.")]
+)
+def test_save_address_verified_by_other_account(
+    error, mock_email_verification_qs
+):
+    """
+    If another account has already verified the same address, saving
+    the serializer should raise a validation error.
+    """
+    verification = models.EmailVerification()
+    verification.verify = mock.Mock(side_effect=error)
+    mock_email_verification_qs.get_by_token.return_value = verification
+
+    data = {"token": verification.token}
+    serializer = serializers.EmailVerificationSerializer(data=data)
+
+    assert serializer.is_valid()
+    with pytest.raises(ValidationError):
+        serializer.save()
 
 
 def test_validate_valid_token(mock_email_verification_qs):
@@ -39,15 +63,15 @@ def test_validate_valid_token(mock_email_verification_qs):
     If the token is valid, it should be returned.
     """
     verification = models.EmailVerification()
-    mock_email_verification_qs.get.return_value = verification
+    mock_email_verification_qs.get_by_token.return_value = verification
     serializer = serializers.EmailVerificationSerializer()
 
     token = serializer.validate_token(verification.token)
 
     assert token == verification.token
-    assert mock_email_verification_qs.get.call_args[1] == {
-        "token": verification.token
-    }
+    assert mock_email_verification_qs.get_by_token.call_args[0] == (
+        verification.token,
+    )
 
 
 def test_validate_invalid_token(mock_email_verification_qs):
@@ -56,7 +80,7 @@ def test_validate_invalid_token(mock_email_verification_qs):
     ValidationError should be raised.
     """
     token = "invalid"
-    mock_email_verification_qs.get.side_effect = (
+    mock_email_verification_qs.get_by_token.side_effect = (
         models.EmailVerification.DoesNotExist
     )
     serializer = serializers.EmailVerificationSerializer()
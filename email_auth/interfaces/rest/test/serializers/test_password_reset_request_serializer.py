@@ -1,8 +1,10 @@
 from unittest import mock
 
 import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
 
-from email_auth import models
+from email_auth import coalescing, models
 
 
 pytest.importorskip("rest_framework")
@@ -27,10 +29,8 @@ def test_save_unregistered_email(mock_email_address_qs):
 
     assert result is None
     assert serializer.data == data
-    assert mock_email_address_qs.get.call_args[1] == {
-        "address__iexact": address,
-        "is_verified": True,
-    }
+    assert mock_email_address_qs.for_address.call_args[0] == (address,)
+    assert mock_email_address_qs.verified.call_count == 1
 
 
 def test_save_unverified_email(mock_email_address_qs):
@@ -49,10 +49,8 @@ def test_save_unverified_email(mock_email_address_qs):
 
     assert result is None
     assert serializer.data == data
-    assert mock_email_address_qs.get.call_args[1] == {
-        "address__iexact": address,
-        "is_verified": True,
-    }
+    assert mock_email_address_qs.for_address.call_args[0] == (address,)
+    assert mock_email_address_qs.verified.call_count == 1
 
 
 @mock.patch("email_auth.models.PasswordReset.send_email")
@@ -72,7 +70,57 @@ def test_save_verified_email(_, mock_email_address_qs):
 
     assert serializer.data == data
     assert result.send_email.call_count == 1
-    assert mock_email_address_qs.get.call_args[1] == {
-        "address__iexact": email.address,
-        "is_verified": True,
-    }
+    assert mock_email_address_qs.for_address.call_args[0] == (email.address,)
+    assert mock_email_address_qs.verified.call_count == 1
+
+
+@pytest.mark.django_db
+def test_asave_coalesced(mailoutbox, settings):
+    """
+    Repeated async saves within the coalescing window should only send a
+    single password reset.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_COALESCING_WINDOW": 60}
+    user = get_user_model().objects.create_user(username="Test User")
+    models.EmailAddress.objects.create(
+        address="test@example.com", is_verified=True, user=user
+    )
+
+    results = []
+    for _ in range(2):
+        serializer = serializers.PasswordResetRequestSerializer(
+            data={"email": "test@example.com"}
+        )
+        assert async_to_sync(serializer.ais_valid)()
+        results.append(async_to_sync(serializer.asave)())
+
+    assert results[0] == models.PasswordReset.objects.get()
+    assert results[1] is None
+    assert len(mailoutbox) == 1
+
+
+@pytest.mark.django_db
+@mock.patch(
+    "email_auth.tokens.ModelTokenBackend.send_password_reset",
+    autospec=True,
+    side_effect=RuntimeError,
+)
+def test_asave_error_releases_claim(_, settings):
+    """
+    If an async save fails, the next request for the address should try
+    again.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_COALESCING_WINDOW": 60}
+    user = get_user_model().objects.create_user(username="Test User")
+    models.EmailAddress.objects.create(
+        address="test@example.com", is_verified=True, user=user
+    )
+    serializer = serializers.PasswordResetRequestSerializer(
+        data={"email": "test@example.com"}
+    )
+    assert serializer.is_valid()
+
+    with pytest.raises(RuntimeError):
+        async_to_sync(serializer.asave)()
+
+    assert coalescing.claim("password_reset", "test@example.com")
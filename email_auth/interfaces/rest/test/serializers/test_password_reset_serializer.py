@@ -17,8 +17,9 @@ from email_auth.interfaces.rest import serializers  # noqa
 NEW_PASSWORD = "MySup3rSecurePassword"
 
 
+@pytest.mark.django_db
 @mock.patch("django.contrib.auth.models.User.save", autospec=True)
-@mock.patch("email_auth.models.PasswordReset.delete", autospec=True)
+@mock.patch("email_auth.models.PasswordReset.consume", autospec=True)
 def test_save_valid_token(_, __, mock_password_reset_qs):
     """
     Saving the serializer with a valid token should reset the password
@@ -27,7 +28,7 @@ def test_save_valid_token(_, __, mock_password_reset_qs):
     user = get_user_model()(username="Test User")
     email = models.EmailAddress(user=user)
     reset = models.PasswordReset(email=email)
-    mock_password_reset_qs.get.return_value = reset
+    mock_password_reset_qs.get_by_token.return_value = reset
 
     data = {"password": NEW_PASSWORD, "token": reset.token}
     serializer = serializers.PasswordResetSerializer(data=data)
@@ -37,9 +38,9 @@ def test_save_valid_token(_, __, mock_password_reset_qs):
 
     assert serializer.data == {}
     assert user.check_password(NEW_PASSWORD)
-    assert mock_password_reset_qs.get.call_args[1] == {"token": reset.token}
+    assert mock_password_reset_qs.get_by_token.call_args[0] == (reset.token,)
     assert user.save.call_count == 1
-    assert reset.delete.call_count == 1
+    assert reset.consume.call_count == 1
 
 
 @mock.patch(
@@ -55,14 +56,14 @@ def test_validate(mock_validate_password, mock_password_reset_qs):
     user = get_user_model()()
     email = models.EmailAddress(user=user)
     reset = models.PasswordReset(email=email)
-    mock_password_reset_qs.get.return_value = reset
+    mock_password_reset_qs.get_by_token.return_value = reset
 
     data = {"password": NEW_PASSWORD, "token": reset.token}
     serializer = serializers.PasswordResetSerializer(data=data)
 
     assert not serializer.is_valid()
     assert set(serializer.errors.keys()) == {"password"}
-    assert mock_password_reset_qs.get.call_args[1] == {"token": reset.token}
+    assert mock_password_reset_qs.get_by_token.call_args[0] == (reset.token,)
     assert mock_validate_password.call_args[0][0] == NEW_PASSWORD
     assert mock_validate_password.call_args[1] == {"user": user}
 
@@ -73,7 +74,9 @@ def test_validate_invalid_token(mock_password_reset_qs):
     raised.
     """
     token = "foo"
-    mock_password_reset_qs.get.side_effect = models.PasswordReset.DoesNotExist
+    mock_password_reset_qs.get_by_token.side_effect = (
+        models.PasswordReset.DoesNotExist
+    )
 
     data = {"password": NEW_PASSWORD, "token": token}
     serializer = serializers.PasswordResetSerializer(data=data)
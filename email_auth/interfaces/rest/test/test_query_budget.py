@@ -0,0 +1,145 @@
+"""
+Query budgets for the REST endpoints.
+
+Each test pins the maximum number of queries an endpoint may issue.
+Budgets include the savepoints used by atomic blocks, since they are
+real round trips to the database.
+"""
+
+import re
+
+import pytest
+
+from email_auth import models
+
+
+pytest.importorskip("rest_framework")
+
+# Imports that require "rest_framework"
+from rest_framework.test import APIClient  # noqa
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+def get_token(mailoutbox):
+    """
+    Extract the token from the most recently sent email.
+    """
+    return re.search(r"/(\w+)\n", mailoutbox[-1].body).group(1)
+
+
+@pytest.mark.django_db
+def test_email_verification_request(
+    api_client, django_assert_max_num_queries, email, settings
+):
+    """
+    Requesting a verification email should look up the address with its
+    owner and insert the verification.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_VERIFICATION_URL": "/verify/{key}"}
+    url = "/rest/email-verification-requests/"
+
+    with django_assert_max_num_queries(2):
+        response = api_client.post(url, {"email": email.address})
+
+    assert response.status_code == 201
+
+
+@pytest.mark.django_db
+def test_email_verification_request_verified(
+    api_client, django_assert_max_num_queries, email
+):
+    """
+    Requesting a verification email for a verified address should only
+    look up the address.
+    """
+    email.is_verified = True
+    email.save()
+    url = "/rest/email-verification-requests/"
+
+    with django_assert_max_num_queries(1):
+        response = api_client.post(url, {"email": email.address})
+
+    assert response.status_code == 201
+
+
+@pytest.mark.django_db
+def test_email_verification(
+    api_client, django_assert_max_num_queries, email, mailoutbox, settings
+):
+    """
+    Verifying an email should look up the token with its address, then
+    claim the token, check that no other account has verified the
+    address, and update the address in a transaction.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_VERIFICATION_URL": "/verify/{key}"}
+    email.send_verification_email()
+    token = get_token(mailoutbox)
+    url = "/rest/email-verifications/"
+
+    with django_assert_max_num_queries(8):
+        response = api_client.post(url, {"token": token})
+
+    assert response.status_code == 201
+
+
+@pytest.mark.django_db
+def test_password_reset_request(
+    api_client, django_assert_max_num_queries, email, settings
+):
+    """
+    Requesting a password reset should look up the address with its
+    owner and insert the reset.
+    """
+    settings.EMAIL_AUTH = {"PASSWORD_RESET_URL": "/reset/{key}"}
+    email.is_verified = True
+    email.save()
+    url = "/rest/password-reset-requests/"
+
+    with django_assert_max_num_queries(2):
+        response = api_client.post(url, {"email": email.address})
+
+    assert response.status_code == 201
+
+
+@pytest.mark.django_db
+def test_password_reset_request_unknown(
+    api_client, django_assert_max_num_queries
+):
+    """
+    Requesting a password reset for an unknown address should only look
+    up the address.
+    """
+    url = "/rest/password-reset-requests/"
+
+    with django_assert_max_num_queries(1):
+        response = api_client.post(url, {"email": "foo@example.com"})
+
+    assert response.status_code == 201
+
+
+@pytest.mark.django_db
+def test_password_reset(
+    api_client, django_assert_max_num_queries, email, mailoutbox, settings
+):
+    """
+    Resetting a password should look up the token with its address and
+    user, then claim the token and update the password in a
+    transaction.
+    """
+    settings.EMAIL_AUTH = {"PASSWORD_RESET_URL": "/reset/{key}"}
+    email.is_verified = True
+    email.save()
+    models.PasswordReset(email=email).send_email()
+    token = get_token(mailoutbox)
+    url = "/rest/password-resets/"
+
+    with django_assert_max_num_queries(7):
+        response = api_client.post(
+            url, {"password": "MySup3rSecurePassword", "token": token}
+        )
+
+    assert response.status_code == 201
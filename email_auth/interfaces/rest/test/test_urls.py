@@ -0,0 +1,44 @@
+from unittest import mock
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+
+
+pytest.importorskip("rest_framework")
+
+# Imports that require "rest_framework"
+from email_auth.interfaces.rest import urls, views  # noqa
+
+
+def test_get_view():
+    """
+    By default, the URLs should be served by the sync views.
+    """
+    view = urls.get_view("PasswordResetView")
+
+    assert view.cls is views.PasswordResetView
+
+
+@mock.patch("email_auth.interfaces.rest.views.NATIVE_ASYNC_VIEWS", True)
+def test_get_view_async(settings):
+    """
+    If the ``ASYNC_VIEWS`` setting is enabled, the URLs should be served
+    by the async views.
+    """
+    settings.EMAIL_AUTH = {"ASYNC_VIEWS": True}
+
+    view = urls.get_view("PasswordResetView")
+
+    assert view.cls is views.AsyncPasswordResetView
+
+
+@mock.patch("email_auth.interfaces.rest.views.NATIVE_ASYNC_VIEWS", False)
+def test_get_view_async_not_supported(settings):
+    """
+    If the ``ASYNC_VIEWS`` setting is enabled on a version of Django
+    that cannot serve async views, an exception should be raised.
+    """
+    settings.EMAIL_AUTH = {"ASYNC_VIEWS": True}
+
+    with pytest.raises(ImproperlyConfigured):
+        urls.get_view("PasswordResetView")
@@ -1,13 +1,18 @@
+import re
+
 import pytest
 import requests
 from django.contrib.auth import get_user_model
 
 from email_auth import models
+from email_auth.test import test_utils
 
 
 pytest.importorskip("rest_framework")
 
 # Imports that require "rest_framework"
+from rest_framework.test import APIRequestFactory  # noqa
+
 from email_auth.interfaces.rest import views, serializers  # noqa
 
 
@@ -46,8 +51,15 @@ def test_request_verification_email(live_server, mailoutbox, settings):
 
     msg = mailoutbox[0]
 
+    # Only a hash of the token is stored, so it has to be recovered from
+    # the email.
+    match = re.search(url_template.format(key=r"(\w+)"), msg.body)
+
     assert msg.to == [email.address]
-    assert url_template.format(key=email.verifications.get().token) in msg.body
+    assert match is not None
+    assert models.EmailVerification.objects.get_by_token(match.group(1)) == (
+        email.verifications.get()
+    )
 
 
 @pytest.mark.functional_test
@@ -95,3 +107,83 @@ def test_request_verification_email_unknown_address(live_server, mailoutbox):
 
     assert msg.to == [data["email"]]
     assert "unregistered email" in msg.subject.lower()
+
+
+@pytest.mark.functional_test
+def test_request_verification_email_coalesced(
+    live_server, mailoutbox, settings
+):
+    """
+    Repeated requests within the coalescing window should receive the
+    same response but only send a single email.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_COALESCING_WINDOW": 60}
+    user = get_user_model().objects.create_user(username="Test User")
+    models.EmailAddress.objects.create(address="test@example.com", user=user)
+
+    data = {"email": "test@example.com"}
+    url = f"{live_server}/rest/email-verification-requests/"
+    responses = [requests.post(url, data) for _ in range(3)]
+
+    assert [r.status_code for r in responses] == [201] * 3
+    assert all(r.json() == data for r in responses)
+    assert len(mailoutbox) == 1
+    assert models.EmailVerification.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_async_request_verification_email(mailoutbox, settings):
+    """
+    The async view should send a new verification token to an unverified
+    email address.
+    """
+    settings.EMAIL_AUTH = {
+        "EMAIL_VERIFICATION_URL": "https://localhost/verify-email/{key}"
+    }
+    user = get_user_model().objects.create_user(username="test-user")
+    email = models.EmailAddress.objects.create(
+        address="test@example.com", user=user
+    )
+
+    data = {"email": email.address}
+    request = APIRequestFactory().post("/", data)
+    response = test_utils.call_view(
+        views.AsyncEmailVerificationRequestView.as_view(), request
+    )
+
+    assert response.status_code == 201
+    assert response.data == data
+    assert len(mailoutbox) == 1
+    assert mailoutbox[0].to == [email.address]
+    assert email.verifications.count() == 1
+
+
+@pytest.mark.django_db
+def test_async_request_verification_email_unknown_address(mailoutbox):
+    """
+    The async view should notify an unknown email address that it has
+    not been registered yet.
+    """
+    data = {"email": "unknown@example.com"}
+    request = APIRequestFactory().post("/", data)
+    response = test_utils.call_view(
+        views.AsyncEmailVerificationRequestView.as_view(), request
+    )
+
+    assert response.status_code == 201
+    assert len(mailoutbox) == 1
+    assert "unregistered email" in mailoutbox[0].subject.lower()
+
+
+def test_async_request_verification_email_invalid_address(mailoutbox):
+    """
+    The async view should reject invalid email addresses.
+    """
+    request = APIRequestFactory().post("/", {"email": "not-an-email"})
+    response = test_utils.call_view(
+        views.AsyncEmailVerificationRequestView.as_view(), request
+    )
+
+    assert response.status_code == 400
+    assert "email" in response.data
+    assert len(mailoutbox) == 0
@@ -3,11 +3,14 @@ import requests
 from django.contrib.auth import get_user_model
 
 from email_auth import models
+from email_auth.test import test_utils
 
 
 pytest.importorskip("rest_framework")
 
 # Imports that require "rest_framework"
+from rest_framework.test import APIRequestFactory  # noqa
+
 from email_auth.interfaces.rest import serializers, views  # noqa
 
 
@@ -55,3 +58,44 @@ def test_verify_email_invalid_token(live_server):
     assert response.json() == {
         "token": ["The provided verification token is invalid."]
     }
+
+
+@pytest.mark.django_db
+def test_async_verify_email():
+    """
+    The async view should mark the email address associated with a
+    valid token as verified.
+    """
+    user = get_user_model().objects.create_user(username="test")
+    email = models.EmailAddress.objects.create(
+        address="test@example.com", user=user
+    )
+    verification = models.EmailVerification.objects.create(email=email)
+
+    request = APIRequestFactory().post("/", {"token": verification.token})
+    response = test_utils.call_view(
+        views.AsyncEmailVerificationView.as_view(), request
+    )
+
+    assert response.status_code == 201
+    assert response.data == {}
+
+    email.refresh_from_db()
+
+    assert email.is_verified
+
+
+@pytest.mark.django_db
+def test_async_verify_email_invalid_token():
+    """
+    The async view should return a 400 response for an invalid token.
+    """
+    request = APIRequestFactory().post("/", {"token": "invalid-token"})
+    response = test_utils.call_view(
+        views.AsyncEmailVerificationView.as_view(), request
+    )
+
+    assert response.status_code == 400
+    assert response.data == {
+        "token": ["The provided verification token is invalid."]
+    }
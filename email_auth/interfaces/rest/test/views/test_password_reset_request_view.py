@@ -1,12 +1,17 @@
+import re
+
 import pytest
 import requests
 from django.contrib.auth import get_user_model
 
 from email_auth import models
+from email_auth.test import test_utils
 
 
 pytest.importorskip("rest_framework")
 
+from rest_framework.test import APIRequestFactory  # noqa
+
 from email_auth.interfaces.rest import serializers, views  # noqa
 
 
@@ -43,10 +48,15 @@ def test_request_password_reset(live_server, mailoutbox, settings):
     assert len(mailoutbox) == 1
 
     msg = mailoutbox[0]
-    reset = models.PasswordReset.objects.get()
+    # Only a hash of the token is stored, so it has to be recovered from
+    # the email.
+    match = re.search(reset_url_template.format(key=r"(\w+)"), msg.body)
 
     assert msg.to == [data["email"]]
-    assert reset_url_template.format(key=reset.token) in msg.body
+    assert match is not None
+    assert models.PasswordReset.objects.get_by_token(match.group(1)) == (
+        models.PasswordReset.objects.get()
+    )
 
 
 @pytest.mark.functional_test
@@ -82,3 +92,68 @@ def test_request_password_reset_unverified_email(live_server, mailoutbox):
     assert response.status_code == 201
     assert response.json() == data
     assert len(mailoutbox) == 0
+
+
+@pytest.mark.functional_test
+def test_request_password_reset_coalesced(live_server, mailoutbox, settings):
+    """
+    Repeated requests within the coalescing window should receive the
+    same response but only send a single email.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_COALESCING_WINDOW": 60}
+    user = get_user_model().objects.create_user(username="Test User")
+    models.EmailAddress.objects.create(
+        address="test@example.com", is_verified=True, user=user
+    )
+
+    data = {"email": "test@example.com"}
+    url = f"{live_server}/rest/password-reset-requests/"
+    responses = [requests.post(url, data) for _ in range(3)]
+
+    assert [r.status_code for r in responses] == [201] * 3
+    assert all(r.json() == data for r in responses)
+    assert len(mailoutbox) == 1
+    assert models.PasswordReset.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_async_request_password_reset(mailoutbox, settings):
+    """
+    The async view should send a password reset token to a verified
+    email address.
+    """
+    settings.EMAIL_AUTH = {
+        "PASSWORD_RESET_URL": "http://localhost/reset-password/{key}"
+    }
+    user = get_user_model().objects.create_user(username="Test User")
+    email = models.EmailAddress.objects.create(
+        address="test@example.com", is_verified=True, user=user
+    )
+
+    data = {"email": email.address}
+    request = APIRequestFactory().post("/", data)
+    response = test_utils.call_view(
+        views.AsyncPasswordResetRequestView.as_view(), request
+    )
+
+    assert response.status_code == 201
+    assert response.data == data
+    assert len(mailoutbox) == 1
+    assert mailoutbox[0].to == [email.address]
+    assert models.PasswordReset.objects.filter(email=email).count() == 1
+
+
+@pytest.mark.django_db
+def test_async_request_password_reset_missing_email(mailoutbox):
+    """
+    The async view should not send an email to an unknown address.
+    """
+    data = {"email": "unknown@example.com"}
+    request = APIRequestFactory().post("/", data)
+    response = test_utils.call_view(
+        views.AsyncPasswordResetRequestView.as_view(), request
+    )
+
+    assert response.status_code == 201
+    assert response.data == data
+    assert len(mailoutbox) == 0
@@ -3,10 +3,13 @@ import requests
 from django.contrib.auth import get_user_model
 
 from email_auth import models
+from email_auth.test import test_utils
 
 
 pytest.importorskip("rest_framework")
 
+from rest_framework.test import APIRequestFactory  # noqa
+
 from email_auth.interfaces.rest import serializers, views  # noqa
 
 
@@ -67,3 +70,58 @@ def test_reset_password_invalid_token(live_server):
     # Password shouldn't have changed
     user.refresh_from_db()
     assert user.check_password(password)
+
+
+@pytest.mark.django_db
+def test_async_reset_password():
+    """
+    The async view should reset the password of the user associated
+    with a valid token.
+    """
+    user = get_user_model().objects.create_user(username="Test User")
+    email = models.EmailAddress.objects.create(
+        address="test@example.com", is_verified=True, user=user
+    )
+    reset = models.PasswordReset.objects.create(email=email)
+
+    data = {"password": "NewPassword", "token": reset.token}
+    request = APIRequestFactory().post("/", data)
+    response = test_utils.call_view(
+        views.AsyncPasswordResetView.as_view(), request
+    )
+
+    assert response.status_code == 201
+    assert response.data == {}
+
+    user.refresh_from_db()
+
+    assert user.check_password(data["password"])
+
+
+@pytest.mark.django_db
+def test_async_reset_password_invalid_token():
+    """
+    The async view should return a 400 response for an invalid token.
+    """
+    data = {"password": "NewPassword", "token": "invalid-token"}
+    request = APIRequestFactory().post("/", data)
+    response = test_utils.call_view(
+        views.AsyncPasswordResetView.as_view(), request
+    )
+
+    assert response.status_code == 400
+    assert response.data == {
+        "token": ["The provided password reset token is invalid."]
+    }
+
+
+def test_async_method_not_allowed():
+    """
+    The async view should reject methods other than ``POST``.
+    """
+    request = APIRequestFactory().get("/")
+    response = test_utils.call_view(
+        views.AsyncPasswordResetView.as_view(), request
+    )
+
+    assert response.status_code == 405
@@ -1,29 +1,59 @@
+from django.core.exceptions import ImproperlyConfigured
 from django.urls import path
 
+from email_auth import app_settings
 from email_auth.interfaces.rest import views
 
 
 app_name = "email-auth:rest"
 
+
+def get_view(name):
+    """
+    Args:
+        name:
+            The name of a view class in
+            :py:mod:`email_auth.interfaces.rest.views`.
+
+    Returns:
+        The view function for the class, or for its async version if
+        the ``ASYNC_VIEWS`` setting is enabled.
+
+    Raises:
+        ImproperlyConfigured:
+            If the ``ASYNC_VIEWS`` setting is enabled but the installed
+            version of Django cannot serve async views natively.
+    """
+    if app_settings.ASYNC_VIEWS:
+        if not views.NATIVE_ASYNC_VIEWS:
+            raise ImproperlyConfigured(
+                "The ASYNC_VIEWS setting requires Django 3.1 or later."
+            )
+
+        name = f"Async{name}"
+
+    return getattr(views, name).as_view()
+
+
 urlpatterns = [
     path(
         "email-verification-requests/",
-        views.EmailVerificationRequestView.as_view(),
+        get_view("EmailVerificationRequestView"),
         name="email-verification-request-list",
     ),
     path(
         "email-verifications/",
-        views.EmailVerificationView.as_view(),
+        get_view("EmailVerificationView"),
         name="email-verification-list",
     ),
     path(
         "password-reset-requests/",
-        views.PasswordResetRequestView.as_view(),
+        get_view("PasswordResetRequestView"),
         name="password-reset-request-list",
     ),
     path(
         "password-resets/",
-        views.PasswordResetView.as_view(),
+        get_view("PasswordResetView"),
         name="password-reset-list",
     ),
 ]
@@ -1,8 +1,110 @@
-from rest_framework import generics
+import asyncio
+import functools
+
+import django
+from asgiref.sync import async_to_sync, sync_to_async
+from rest_framework import generics, status
+from rest_framework.response import Response
 
 from email_auth.interfaces.rest import serializers
 
 
+# Django serves views that are coroutine functions natively from 3.1.
+NATIVE_ASYNC_VIEWS = django.VERSION >= (3, 1)
+
+
+class AsyncCreateAPIView(generics.CreateAPIView):
+    """
+    Base class for views that create a resource using a serializer
+    providing the async ``ais_valid()`` and ``asave()`` methods.
+
+    Requests are handled by a coroutine. If the installed version of
+    Django supports async views, the coroutine is served natively under
+    ASGI. Otherwise, it is wrapped with ``async_to_sync`` so the view
+    still works under WSGI.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        async def view(request, *args, **kwargs):
+            self = cls(**initkwargs)
+            # ``View.setup()`` does not exist before Django 2.2.
+            self.request = request
+            self.args = args
+            self.kwargs = kwargs
+
+            return await self.adispatch(request, *args, **kwargs)
+
+        functools.update_wrapper(view, cls, updated=())
+
+        if not NATIVE_ASYNC_VIEWS:
+            view = functools.update_wrapper(async_to_sync(view), view)
+
+        view.cls = cls
+        view.initkwargs = initkwargs
+        # DRF performs its own CSRF checks for session authentication.
+        view.csrf_exempt = True
+
+        return view
+
+    async def acreate(self, request, *args, **kwargs):
+        """
+        Asynchronous version of ``create()``.
+        """
+        serializer = self.get_serializer(data=request.data)
+        await serializer.ais_valid(raise_exception=True)
+        await self.aperform_create(serializer)
+        headers = self.get_success_headers(serializer.data)
+
+        return Response(
+            serializer.data, status=status.HTTP_201_CREATED, headers=headers
+        )
+
+    async def adispatch(self, request, *args, **kwargs):
+        """
+        Asynchronous version of ``dispatch()``.
+
+        Authentication, permission checks, and throttling may query the
+        database, so they are run in the thread used for database
+        access.
+        """
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            method = request.method.lower()
+            if method in self.http_method_names:
+                handler = getattr(self, method, self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            response = handler(request, *args, **kwargs)
+            if asyncio.iscoroutine(response):
+                response = await response
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(
+            request, response, *args, **kwargs
+        )
+
+        return self.response
+
+    async def aperform_create(self, serializer):
+        """
+        Asynchronous version of ``perform_create()``.
+        """
+        await serializer.asave()
+
+    async def post(self, request, *args, **kwargs):
+        return await self.acreate(request, *args, **kwargs)
+
+
 class EmailVerificationRequestView(generics.CreateAPIView):
     """
     post:
@@ -68,3 +170,27 @@ class PasswordResetView(generics.CreateAPIView):
     """
 
     serializer_class = serializers.PasswordResetSerializer
+
+
+class AsyncEmailVerificationRequestView(AsyncCreateAPIView):
+    __doc__ = EmailVerificationRequestView.__doc__
+
+    serializer_class = serializers.EmailVerificationRequestSerializer
+
+
+class AsyncEmailVerificationView(AsyncCreateAPIView):
+    __doc__ = EmailVerificationView.__doc__
+
+    serializer_class = serializers.EmailVerificationSerializer
+
+
+class AsyncPasswordResetRequestView(AsyncCreateAPIView):
+    __doc__ = PasswordResetRequestView.__doc__
+
+    serializer_class = serializers.PasswordResetRequestSerializer
+
+
+class AsyncPasswordResetView(AsyncCreateAPIView):
+    __doc__ = PasswordResetView.__doc__
+
+    serializer_class = serializers.PasswordResetSerializer
@@ -0,0 +1,332 @@
+"""
+Rendering and delivery of the emails sent by the app.
+
+Emails are rendered from templates and handed to the sender specified
+by the ``EMAIL_SENDER`` setting. Emails saved to the outbox by the
+:py:class:`email_auth.senders.OutboxSender` are sent by the
+``dispatch_emails`` management command.
+"""
+
+import functools
+import time
+
+import email_utils
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core import mail
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
+
+from email_auth import app_settings, async_utils, governor, senders
+
+
+class PersistentConnection:
+    """
+    A mail backend connection that is reused across many messages.
+
+    The connection implements the ``send_messages()`` method of Django's
+    email backends, so it can be passed as the ``connection`` of an
+    :py:class:`django.core.mail.EmailMessage`. The underlying connection
+    is opened when the first message is sent and reopened after it has
+    sent ``max_messages`` messages, has been idle for more than
+    ``idle_timeout`` seconds, or has failed to send a message.
+    """
+
+    def __init__(self, backend=None, idle_timeout=None, max_messages=None):
+        """
+        Args:
+            backend:
+                The import path of the email backend to use. Defaults
+                to Django's ``EMAIL_BACKEND`` setting.
+            idle_timeout:
+                The number of seconds the connection may be unused
+                before it is reopened. Defaults to the
+                ``EMAIL_CONNECTION_IDLE_TIMEOUT`` setting.
+            max_messages:
+                The number of messages to send before the connection is
+                reopened. Defaults to the
+                ``EMAIL_CONNECTION_MAX_MESSAGES`` setting.
+        """
+        if idle_timeout is None:
+            idle_timeout = app_settings.EMAIL_CONNECTION_IDLE_TIMEOUT
+        if max_messages is None:
+            max_messages = app_settings.EMAIL_CONNECTION_MAX_MESSAGES
+
+        self.backend = backend
+        self.idle_timeout = idle_timeout
+        self.max_messages = max_messages
+
+        self._connection = None
+        self._last_used = None
+        self._sent = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """
+        Close the underlying connection if it is open.
+        """
+        if self._connection is None:
+            return
+
+        try:
+            self._connection.close()
+        finally:
+            self._connection = None
+
+    def close_if_idle(self):
+        """
+        Close the underlying connection if it has exceeded its idle
+        timeout. This should be called by long running processes before
+        they wait for more messages so that the mail server does not
+        have to time out the connection.
+        """
+        if self._is_idle():
+            self.close()
+
+    def send_messages(self, email_messages):
+        """
+        Send messages over the shared connection.
+
+        Args:
+            email_messages:
+                A list of :py:class:`django.core.mail.EmailMessage`
+                instances to send.
+
+        Returns:
+            The number of messages that were sent.
+        """
+        if self._is_idle() or (
+            self.max_messages is not None and self._sent >= self.max_messages
+        ):
+            self.close()
+
+        if self._connection is None:
+            self._connection = mail.get_connection(self.backend)
+            self._connection.open()
+            self._last_used = time.monotonic()
+            self._sent = 0
+
+        try:
+            sent = self._connection.send_messages(email_messages)
+        except Exception:
+            # The state of the connection is unknown after an error, so
+            # the next message uses a fresh one.
+            self.close()
+            raise
+
+        self._last_used = time.monotonic()
+        self._sent += len(email_messages)
+
+        return sent
+
+    def _is_idle(self):
+        """
+        Returns:
+            A boolean indicating if the connection is open and has been
+            unused for longer than its idle timeout.
+        """
+        return (
+            self._connection is not None
+            and self.idle_timeout is not None
+            and time.monotonic() - self._last_used > self.idle_timeout
+        )
+
+
+def atomic():
+    """
+    Returns:
+        The context manager provided by the configured sender for code
+        that saves rows and sends an email about them.
+    """
+    return senders.get_sender().atomic()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_cached_templates(template_name):
+    """
+    Load and cache the templates of an email.
+
+    Args:
+        template_name:
+            The name of the template to use without an extension.
+
+    Returns:
+        A tuple containing the compiled plain text and HTML templates.
+        A template that does not exist is ``None``.
+
+    Raises:
+        email_utils.NoTemplatesException:
+            If neither template exists.
+    """
+    templates = []
+    for extension in ("txt", "html"):
+        try:
+            templates.append(get_template(f"{template_name}.{extension}"))
+        except TemplateDoesNotExist:
+            templates.append(None)
+
+    if not any(templates):
+        raise email_utils.NoTemplatesException(template_name)
+
+    return tuple(templates)
+
+
+def clear_template_cache(setting, **kwargs):
+    """
+    Signal receiver that discards the cached email templates when the
+    template settings change.
+
+    Args:
+        setting:
+            The name of the setting that changed.
+    """
+    if setting in ("DEBUG", "TEMPLATES"):
+        _get_cached_templates.cache_clear()
+
+
+def render_email(template_name, context):
+    """
+    Render the bodies of a templated email the same way as
+    :py:func:`email_utils.send_email`.
+
+    Templates are looked up and compiled once per process. If
+    ``DEBUG`` is enabled, they are loaded for every email so that
+    changes to them are picked up.
+
+    Args:
+        template_name:
+            The name of the template to use without an extension.
+        context:
+            The context to render the templates with.
+
+    Returns:
+        A tuple containing the plain text and HTML bodies. A body whose
+        template does not exist is empty.
+
+    Raises:
+        email_utils.NoTemplatesException:
+            If neither template exists.
+    """
+    if settings.DEBUG:
+        templates = _get_cached_templates.__wrapped__(template_name)
+    else:
+        templates = _get_cached_templates(template_name)
+
+    return tuple(
+        template.render(context) if template is not None else ""
+        for template in templates
+    )
+
+
+def send_email(context, from_email, recipient_list, subject, template_name):
+    """
+    Render a templated email and deliver it with the configured sender.
+
+    If the ``EMAIL_RATE_LIMIT`` has been reached, the email is saved to
+    the outbox instead.
+
+    Args:
+        context:
+            The context to render the templates with.
+        from_email:
+            The address the email is sent from.
+        recipient_list:
+            The addresses to send the email to.
+        subject:
+            The email's subject.
+        template_name:
+            The name of the template to use without an extension.
+    """
+    message = _build_message(
+        context, from_email, recipient_list, subject, template_name
+    )
+
+    sender = senders.get_sender()
+    if sender.governed and not governor.acquire():
+        governor.defer(message)
+
+        return
+
+    sender.send_messages([message])
+
+
+async def asend_email(
+    context, from_email, recipient_list, subject, template_name
+):
+    """
+    Asynchronous version of :py:func:`send_email`.
+
+    The email is rendered and rate limited in a worker thread and
+    delivered with the sender's ``asend_messages`` method, so the event
+    loop is not blocked. The context must not require any queries to
+    render.
+    """
+    message = await async_utils.run_in_thread(
+        _build_message,
+        context,
+        from_email,
+        recipient_list,
+        subject,
+        template_name,
+    )
+
+    sender = senders.get_sender()
+    if sender.governed and not await async_utils.run_in_thread(
+        governor.acquire
+    ):
+        await sync_to_async(governor.defer)(message)
+
+        return
+
+    await sender.asend_messages([message])
+
+
+def send_outbound_email(outbound_email, connection=None):
+    """
+    Send an email from the outbox.
+
+    Args:
+        outbound_email:
+            The :py:class:`email_auth.models.OutboundEmail` to send.
+        connection:
+            The mail backend connection to send the email with. Django's
+            default backend is used if this is not provided.
+    """
+    message = mail.EmailMultiAlternatives(
+        body=outbound_email.body,
+        connection=connection,
+        from_email=outbound_email.from_email,
+        subject=outbound_email.subject,
+        to=outbound_email.recipient_list,
+    )
+    if outbound_email.html_body:
+        message.attach_alternative(outbound_email.html_body, "text/html")
+
+    message.send()
+
+
+def _build_message(
+    context, from_email, recipient_list, subject, template_name
+):
+    """
+    Render a templated email.
+
+    Returns:
+        An :py:class:`django.core.mail.EmailMultiAlternatives` instance
+        with the rendered bodies. See :py:func:`send_email` for the
+        arguments.
+    """
+    body, html_body = render_email(template_name, context)
+
+    message = mail.EmailMultiAlternatives(
+        body=body, from_email=from_email, subject=subject, to=recipient_list
+    )
+    if html_body:
+        message.attach_alternative(html_body, "text/html")
+
+    return message
@@ -0,0 +1,141 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+
+from email_auth import governor, mail, models
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Send the emails queued in the outbox. Several instances of the "
+        "command can run at once."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--backoff",
+            default=60,
+            help=(
+                "The number of seconds to wait before retrying an email "
+                "after its first failure. The delay doubles after each "
+                "further failure."
+            ),
+            type=float,
+        )
+        parser.add_argument(
+            "--batch-size",
+            default=100,
+            help="The maximum number of emails to lease at once.",
+            type=int,
+        )
+        parser.add_argument(
+            "--lease",
+            default=300,
+            help=(
+                "The number of seconds a batch is leased for before other "
+                "workers may send it."
+            ),
+            type=float,
+        )
+        parser.add_argument(
+            "--max-attempts",
+            default=5,
+            help="The number of attempts after which an email is abandoned.",
+            type=int,
+        )
+        parser.add_argument(
+            "--max-backoff",
+            default=60 * 60,
+            help="The maximum number of seconds between retries.",
+            type=float,
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once no emails are available instead of polling.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            default=5,
+            help="The number of seconds to wait when no emails are available.",
+            type=float,
+        )
+
+    def handle(self, *args, **options):
+        with mail.PersistentConnection() as connection:
+            while True:
+                sent, failed = self.dispatch(
+                    connection,
+                    options["batch_size"],
+                    options["lease"],
+                    options["max_attempts"],
+                    options["backoff"],
+                    options["max_backoff"],
+                )
+                if sent or failed:
+                    self.stdout.write(f"Sent {sent} emails, {failed} failed.")
+                    continue
+
+                if options["once"]:
+                    break
+
+                connection.close_if_idle()
+                time.sleep(options["poll_interval"])
+
+    @staticmethod
+    def dispatch(
+        connection, batch_size, lease, max_attempts, backoff, max_backoff
+    ):
+        """
+        Lease and send a single batch of emails.
+
+        Each email waits for a token from the governor before it is
+        sent. Emails that fail to send are released to be retried with
+        an exponentially increasing delay.
+
+        Args:
+            connection:
+                The mail connection to send the emails with. It is
+                shared by every batch sent by the command.
+            batch_size:
+                The maximum number of emails to lease.
+            lease:
+                The number of seconds the batch is leased for.
+            max_attempts:
+                The number of attempts after which an email is
+                abandoned.
+            backoff:
+                The delay before the first retry in seconds.
+            max_backoff:
+                The maximum delay between retries in seconds.
+
+        Returns:
+            A tuple containing the number of emails that were sent and
+            the number that failed.
+        """
+        emails = models.OutboundEmail.objects.lease(
+            batch_size, lease, max_attempts
+        )
+        if not emails:
+            return 0, 0
+
+        sent = failed = 0
+        for email in emails:
+            governor.wait()
+
+            try:
+                mail.send_outbound_email(email, connection=connection)
+            except Exception as e:
+                logger.exception("Failed to send %r", email)
+                delay = min(backoff * 2 ** email.attempts, max_backoff)
+                email.mark_failed(repr(e), delay)
+                failed += 1
+            else:
+                email.mark_sent()
+                sent += 1
+
+        return sent, failed
@@ -0,0 +1,82 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from email_auth import models
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete email verifications and password resets that are older "
+        "than their configured time to live."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            default=1000,
+            help="The maximum number of rows to delete in each statement.",
+            type=int,
+        )
+        parser.add_argument(
+            "--pause",
+            default=0.1,
+            help="The number of seconds to wait between batches.",
+            type=float,
+        )
+
+    def handle(self, *args, **options):
+        for model in (models.EmailVerification, models.PasswordReset):
+            name = model._meta.verbose_name_plural
+
+            if model.get_ttl() is None:
+                self.stdout.write(f"Skipping {name} as they do not expire.")
+                continue
+
+            deleted = self.prune(
+                model, options["batch_size"], options["pause"]
+            )
+            self.stdout.write(f"Deleted {deleted} expired {name}.")
+
+    @staticmethod
+    def prune(model, batch_size, pause):
+        """
+        Delete the expired instances of a model in batches.
+
+        Each batch is selected using the index on the creation time and
+        deleted by primary key, so every statement only locks a bounded
+        number of rows.
+
+        Args:
+            model:
+                The token model to prune.
+            batch_size:
+                The maximum number of rows to delete in each batch.
+            pause:
+                The number of seconds to wait between batches.
+
+        Returns:
+            The total number of deleted instances.
+        """
+        total = 0
+
+        while True:
+            # The expiry cutoff is recomputed for each batch so that
+            # rows expiring while the command runs are also removed.
+            pks = list(
+                model.objects.expired()
+                .order_by("time_created")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not pks:
+                break
+
+            deleted, _ = model.objects.filter(pk__in=pks).delete()
+            total += deleted
+
+            if len(pks) < batch_size:
+                break
+
+            time.sleep(pause)
+
+        return total
@@ -0,0 +1,23 @@
+# Generated by Django 2.2.28 on 2026-10-18 06:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("email_auth", "0004_passwordreset")]
+
+    operations = [
+        migrations.AddField(
+            model_name="emailaddress",
+            name="normalized_address",
+            field=models.EmailField(
+                default="",
+                editable=False,
+                help_text="The normalized version of the address used for case-insensitive lookups.",
+                max_length=254,
+                verbose_name="normalized address",
+            ),
+            preserve_default=False,
+        )
+    ]
@@ -0,0 +1,51 @@
+from django.db import migrations, models
+
+
+# The number of rows updated per statement. Each batch is committed on
+# its own so that locks on large tables are only held briefly.
+BATCH_SIZE = 1000
+
+
+def populate_normalized_address(apps, schema_editor):
+    EmailAddress = apps.get_model("email_auth", "EmailAddress")
+    pending = EmailAddress.objects.filter(normalized_address="").order_by("pk")
+
+    last_pk = None
+    while True:
+        batch_qs = pending
+        if last_pk is not None:
+            batch_qs = batch_qs.filter(pk__gt=last_pk)
+
+        batch = list(batch_qs.values_list("pk", "address")[:BATCH_SIZE])
+        if not batch:
+            break
+
+        # The addresses are normalized in Python rather than with SQL's
+        # ``LOWER``, which only handles ASCII on some databases. A
+        # single ``CASE`` expression updates the whole batch in one
+        # statement.
+        EmailAddress.objects.filter(pk__in=[pk for pk, _ in batch]).update(
+            normalized_address=models.Case(
+                *[
+                    models.When(pk=pk, then=models.Value(address.lower()))
+                    for pk, address in batch
+                ],
+                output_field=models.EmailField(),
+            )
+        )
+
+        last_pk = batch[-1][0]
+
+
+class Migration(migrations.Migration):
+
+    # Each batch is committed in its own transaction.
+    atomic = False
+
+    dependencies = [("email_auth", "0005_emailaddress_normalized_address")]
+
+    operations = [
+        migrations.RunPython(
+            populate_normalized_address, migrations.RunPython.noop
+        )
+    ]
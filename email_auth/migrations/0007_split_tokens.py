@@ -0,0 +1,87 @@
+import hashlib
+
+from django.db import migrations, models
+
+
+# Tokens issued before this migration are 64 characters long. The first
+# 16 characters become the selector and a digest of the remainder is
+# stored as the verifier so that outstanding tokens remain valid.
+SELECTOR_LENGTH = 16
+
+
+def split_existing_tokens(apps, schema_editor):
+    for model_name in ("EmailVerification", "PasswordReset"):
+        Model = apps.get_model("email_auth", model_name)
+        tokens = Model.objects.values_list("token", flat=True)
+
+        for token in tokens.iterator():
+            verifier = token[SELECTOR_LENGTH:]
+            Model.objects.filter(token=token).update(
+                token=token[:SELECTOR_LENGTH],
+                verifier_hash=hashlib.sha256(verifier.encode()).digest(),
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("email_auth", "0006_populate_emailaddress_normalized_address")
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="emailverification",
+            name="verifier_hash",
+            field=models.BinaryField(
+                default=b"",
+                help_text="A digest of the secret part of the token.",
+                max_length=32,
+                verbose_name="verifier hash",
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="passwordreset",
+            name="verifier_hash",
+            field=models.BinaryField(
+                default=b"",
+                help_text="A digest of the secret part of the token.",
+                max_length=32,
+                verbose_name="verifier hash",
+            ),
+            preserve_default=False,
+        ),
+        # The plain text tokens cannot be recovered, so this migration
+        # is not reversible.
+        migrations.RunPython(split_existing_tokens),
+        migrations.RenameField(
+            model_name="emailverification",
+            old_name="token",
+            new_name="selector",
+        ),
+        migrations.RenameField(
+            model_name="passwordreset", old_name="token", new_name="selector"
+        ),
+        migrations.AlterField(
+            model_name="emailverification",
+            name="selector",
+            field=models.CharField(
+                help_text="The public part of the token used to look it up.",
+                max_length=16,
+                primary_key=True,
+                serialize=False,
+                verbose_name="selector",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="passwordreset",
+            name="selector",
+            field=models.CharField(
+                help_text="The public part of the token used to look it up.",
+                max_length=16,
+                primary_key=True,
+                serialize=False,
+                verbose_name="selector",
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 2.2.28 on 2026-10-18 06:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("email_auth", "0007_split_tokens")]
+
+    operations = [
+        migrations.AlterField(
+            model_name="emailverification",
+            name="time_created",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                db_index=True,
+                help_text="The time that the instance was created.",
+                verbose_name="creation time",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="passwordreset",
+            name="time_created",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                db_index=True,
+                help_text="The time that the instance was created.",
+                verbose_name="creation time",
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 2.2.28 on 2026-10-18 06:27
+
+from django.db import migrations, models
+import email_auth.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("email_auth", "0008_index_token_creation_time")]
+
+    operations = [
+        migrations.AlterField(
+            model_name="emailaddress",
+            name="id",
+            field=models.UUIDField(
+                default=email_auth.models.generate_email_address_id,
+                help_text="A unique identifier for the instance.",
+                primary_key=True,
+                serialize=False,
+                verbose_name="ID",
+            ),
+        ),
+    ]
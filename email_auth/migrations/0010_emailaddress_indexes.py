@@ -0,0 +1,18 @@
+# Generated by Django 2.2.28 on 2026-10-18 06:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("email_auth", "0009_emailaddress_id_generator")]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="emailaddress",
+            index=models.Index(
+                fields=["user", "time_created"],
+                name="email_auth_user_created_idx",
+            ),
+        ),
+    ]
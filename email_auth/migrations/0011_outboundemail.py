@@ -0,0 +1,112 @@
+# Generated by Django 2.2.28 on 2026-10-18 06:38
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("email_auth", "0010_emailaddress_indexes")]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboundEmail",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="The number of failed attempts to send the email.",
+                        verbose_name="attempts",
+                    ),
+                ),
+                (
+                    "body",
+                    models.TextField(
+                        blank=True,
+                        help_text="The plain text body of the email.",
+                        verbose_name="body",
+                    ),
+                ),
+                (
+                    "from_email",
+                    models.CharField(
+                        help_text="The address the email is sent from.",
+                        max_length=255,
+                        verbose_name="from email",
+                    ),
+                ),
+                (
+                    "html_body",
+                    models.TextField(
+                        blank=True,
+                        help_text="The HTML body of the email.",
+                        verbose_name="HTML body",
+                    ),
+                ),
+                (
+                    "last_error",
+                    models.TextField(
+                        blank=True,
+                        help_text="The error from the last failed attempt to send.",
+                        verbose_name="last error",
+                    ),
+                ),
+                (
+                    "lease_id",
+                    models.UUIDField(
+                        blank=True,
+                        db_index=True,
+                        help_text="Identifies the worker that last leased the email.",
+                        null=True,
+                        verbose_name="lease ID",
+                    ),
+                ),
+                (
+                    "recipients",
+                    models.TextField(
+                        help_text="The addresses to send the email to, one per line.",
+                        verbose_name="recipients",
+                    ),
+                ),
+                (
+                    "subject",
+                    models.TextField(
+                        help_text="The subject of the email.",
+                        verbose_name="subject",
+                    ),
+                ),
+                (
+                    "time_available",
+                    models.DateTimeField(
+                        db_index=True,
+                        default=django.utils.timezone.now,
+                        help_text="The time after which the email may be sent. This is pushed back while the email is leased and between retries.",
+                        verbose_name="available time",
+                    ),
+                ),
+                (
+                    "time_created",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        help_text="The time that the instance was created.",
+                        verbose_name="creation time",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "outbound email",
+                "verbose_name_plural": "outbound emails",
+                "ordering": ("time_created",),
+            },
+        ),
+    ]
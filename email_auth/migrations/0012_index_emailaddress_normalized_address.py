@@ -0,0 +1,22 @@
+# Generated by Django 2.2.28 on 2026-10-18 07:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("email_auth", "0011_outboundemail")]
+
+    operations = [
+        migrations.AlterField(
+            model_name="emailaddress",
+            name="normalized_address",
+            field=models.EmailField(
+                db_index=True,
+                editable=False,
+                help_text="The normalized version of the address used for case-insensitive lookups.",
+                max_length=254,
+                verbose_name="normalized address",
+            ),
+        ),
+    ]
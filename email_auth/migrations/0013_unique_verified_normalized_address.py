@@ -0,0 +1,81 @@
+import logging
+
+from django.db import migrations, models
+
+
+logger = logging.getLogger(__name__)
+
+
+INDEX_NAME = "email_auth_verified_uniq"
+
+# Partial unique indexes are only supported by these databases. The index
+# is a safeguard; ``EmailAddress.verify()`` enforces the rule on every
+# database.
+PARTIAL_INDEX_VENDORS = ("postgresql", "sqlite")
+
+
+def unverify_duplicates(apps, schema_editor):
+    """
+    Keep the earliest verification of each normalized address and mark
+    the other verified addresses that differ only in case as unverified.
+    """
+    EmailAddress = apps.get_model("email_auth", "EmailAddress")
+    verified = EmailAddress.objects.filter(is_verified=True)
+
+    # The default ordering is cleared so that it is not added to the
+    # ``GROUP BY`` clause.
+    duplicates = (
+        verified.order_by()
+        .values("normalized_address")
+        .annotate(count=models.Count("pk"))
+        .filter(count__gt=1)
+        .values_list("normalized_address", flat=True)
+    )
+    for normalized_address in list(duplicates):
+        addresses = verified.filter(
+            normalized_address=normalized_address
+        ).order_by("time_verified", "time_created")
+        keep = addresses.values_list("pk", flat=True)[0]
+        others = addresses.exclude(pk=keep)
+
+        logger.warning(
+            "Marking email addresses %s as unverified because email "
+            "address %s verified the same address first.",
+            ", ".join(str(pk) for pk in others.values_list("pk", flat=True)),
+            keep,
+        )
+        others.update(is_verified=False, time_verified=None)
+
+
+def create_index(apps, schema_editor):
+    if schema_editor.connection.vendor not in PARTIAL_INDEX_VENDORS:
+        return
+
+    table = apps.get_model("email_auth", "EmailAddress")._meta.db_table
+    schema_editor.execute(
+        f"CREATE UNIQUE INDEX {schema_editor.quote_name(INDEX_NAME)} "
+        f"ON {schema_editor.quote_name(table)} "
+        f"({schema_editor.quote_name('normalized_address')}) "
+        f"WHERE {schema_editor.quote_name('is_verified')}"
+    )
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor not in PARTIAL_INDEX_VENDORS:
+        return
+
+    schema_editor.execute(f"DROP INDEX {schema_editor.quote_name(INDEX_NAME)}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("email_auth", "0012_index_emailaddress_normalized_address")
+    ]
+
+    operations = [
+        migrations.RunPython(unverify_duplicates, migrations.RunPython.noop),
+        # Django only supports conditional constraints from version 2.2,
+        # so the index is created manually.
+        migrations.RunPython(create_index, drop_index),
+    ]
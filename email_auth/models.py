@@ -1,28 +1,42 @@
+import datetime
+import hashlib
+import hmac
 import logging
-import string
+import os
+import time
 import uuid
 
-import email_utils
 from django.conf import settings
-from django.db import models
-from django.utils import crypto, timezone
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    ImproperlyConfigured,
+    ValidationError,
+)
+from django.db import connections, models, transaction
+from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 
-from email_auth import app_settings
+from email_auth import app_settings, mail, token_generation
 
 
 logger = logging.getLogger(__name__)
 
 
 # Warning: changing this value requires database migrations as it
-# affects the length of all columns that store tokens.
-TOKEN_LENGTH = 64
+# affects the length of all columns that store token selectors.
+TOKEN_SELECTOR_LENGTH = 16
+
+# The size of the digest of a token's verifier in bytes.
+VERIFIER_HASH_LENGTH = hashlib.sha256().digest_size
 
 
 def build_repr(instance, fields):
     """
     Build the string representation for an instance.
 
+    Related objects that have not been loaded are represented by their
+    primary key so that building the repr never queries the database.
+
     Args:
         instance:
             The instance to build the repr for.
@@ -33,23 +47,281 @@ def build_repr(instance, fields):
         A string describing the provided instance including
         representations of all specified fields.
     """
-    values = [f"{f}={repr(getattr(instance, f))}" for f in fields]
+    values = []
+    for name in fields:
+        field = _get_unloaded_foreign_key(instance, name)
+        if field is not None:
+            values.append(
+                f"{field.attname}={repr(getattr(instance, field.attname))}"
+            )
+        else:
+            values.append(f"{name}={repr(getattr(instance, name))}")
 
     return f'{instance.__class__.__name__}({", ".join(values)})'
 
 
+def _get_unloaded_foreign_key(instance, name):
+    """
+    Args:
+        instance:
+            A model instance or any other object.
+        name:
+            The name of an attribute of the instance.
+
+    Returns:
+        The foreign key field with the provided name if the instance is
+        a model instance and the related object has not been loaded or
+        else ``None``.
+    """
+    opts = getattr(instance, "_meta", None)
+    if opts is None:
+        return None
+
+    try:
+        field = opts.get_field(name)
+    except FieldDoesNotExist:
+        return None
+
+    if not field.many_to_one or field.is_cached(instance):
+        return None
+
+    # Unsaved relations are reported by their value, which is ``None``.
+    if getattr(instance, field.attname) is None:
+        return None
+
+    return field
+
+
+def normalize_address(address):
+    """
+    Normalize an email address for case-insensitive comparison.
+
+    Args:
+        address:
+            The email address to normalize.
+
+    Returns:
+        The normalized form of the address that is stored in
+        :py:attr:`EmailAddress.normalized_address` and used for all
+        lookups.
+    """
+    return address.lower()
+
+
 def generate_token():
     """
     Create a random token.
 
     Returns:
-        A random alphanumeric string.
+        A random alphanumeric string with the length specified by the
+        ``TOKEN_LENGTH`` setting.
+    """
+    return token_generation.generate_token(app_settings.TOKEN_LENGTH)
+
+
+def generate_email_address_id():
+    """
+    Create a primary key for a new email address.
+
+    Returns:
+        A time ordered UUID if the ``TIME_ORDERED_IDS`` setting is
+        enabled or else a random UUID.
+    """
+    if app_settings.TIME_ORDERED_IDS:
+        return generate_time_ordered_uuid()
+
+    return uuid.uuid4()
+
+
+def generate_time_ordered_uuid():
+    """
+    Create a UUID whose most significant bits are the current time.
+
+    The layout follows version 7 of the UUID specification: a 48 bit
+    Unix timestamp in milliseconds followed by the version, variant, and
+    74 random bits. Keys generated this way are inserted at the end of
+    the primary key index instead of at random positions within it.
+
+    Returns:
+        A new version 7 UUID.
+    """
+    timestamp_ms = int(time.time() * 1000)
+    value = (timestamp_ms & 0xFFFFFFFFFFFF) << 80
+    value |= int.from_bytes(os.urandom(10), "big") & ((1 << 80) - 1)
+
+    # Overwrite the version and variant bits.
+    value &= ~(0xF << 76)
+    value |= 0x7 << 76
+    value &= ~(0x3 << 62)
+    value |= 0x2 << 62
+
+    return uuid.UUID(int=value)
+
+
+def hash_verifier(verifier):
+    """
+    Hash the secret part of a token for storage.
+
+    Args:
+        verifier:
+            The verifier to hash.
+
+    Returns:
+        The digest of the verifier as bytes.
+    """
+    return hashlib.sha256(verifier.encode()).digest()
+
+
+def split_token(token):
+    """
+    Split a token into its selector and verifier.
+
+    Args:
+        token:
+            The token to split.
+
+    Returns:
+        A tuple containing the token's selector and verifier.
+    """
+    return token[:TOKEN_SELECTOR_LENGTH], token[TOKEN_SELECTOR_LENGTH:]
+
+
+def send_password_reset_token(password_reset):
+    """
+    Send an email containing a password reset token.
+
+    Args:
+        password_reset:
+            The password reset being sent. It must have ``email`` and
+            ``token`` attributes.
+    """
+    reset_url_template = app_settings.PASSWORD_RESET_URL
+    if reset_url_template is not None:
+        reset_url = reset_url_template.format(key=password_reset.token)
+    else:
+        reset_url = None
+
+    context = {"password_reset": password_reset, "reset_url": reset_url}
+
+    mail.send_email(
+        context=context,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        recipient_list=[password_reset.email.address],
+        subject=_("Reset Your Password"),
+        template_name="email_auth/emails/reset-password",
+    )
+
+
+def send_verification_token(verification):
     """
-    return crypto.get_random_string(
-        allowed_chars=string.ascii_letters + string.digits, length=TOKEN_LENGTH
+    Send an email containing an email verification token.
+
+    Args:
+        verification:
+            The verification being sent. It must have ``email`` and
+            ``token`` attributes.
+    """
+    verification_url_template = app_settings.EMAIL_VERIFICATION_URL
+    if verification_url_template is not None:
+        verification_url = verification_url_template.format(
+            key=verification.token
+        )
+    else:
+        verification_url = None
+
+    context = {
+        "email": verification.email,
+        "user": verification.email.user,
+        "verification": verification,
+        "verification_url": verification_url,
+    }
+    template = "email_auth/emails/verify-email"
+
+    mail.send_email(
+        context=context,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        recipient_list=[verification.email.address],
+        subject=_("Please Verify Your Email Address"),
+        template_name=template,
     )
 
 
+def set_user_password(user, password):
+    """
+    Set and save a new password for a user.
+
+    Args:
+        user:
+            The user whose password is being reset.
+        password:
+            The user's new password.
+    """
+    user.set_password(password)
+    user.save(update_fields=["password"])
+
+    logger.info("Reset the password for user %r", user)
+
+
+class EmailAddressQuerySet(models.QuerySet):
+    """
+    Queryset for email addresses.
+    """
+
+    def for_address(self, address):
+        """
+        Args:
+            address:
+                The email address to look up. It does not need to be
+                normalized.
+
+        Returns:
+            A queryset containing the addresses matching the provided
+            address regardless of case.
+        """
+        return self.filter(normalized_address=normalize_address(address))
+
+    def for_login(self, address):
+        """
+        Args:
+            address:
+                The email address provided for a login attempt.
+
+        Returns:
+            A queryset containing the verified address matching the
+            provided address. The owner of the address is fetched in
+            the same query and none of the address's other columns are
+            loaded.
+        """
+        return self.for_address(address).verified().with_user().only("user")
+
+    def for_user(self, user):
+        """
+        Args:
+            user:
+                The user whose email addresses should be returned.
+
+        Returns:
+            A queryset containing the user's email addresses in the
+            order they were added.
+        """
+        return self.filter(user=user).order_by("time_created")
+
+    def verified(self):
+        """
+        Returns:
+            A queryset containing only verified email addresses.
+        """
+        return self.filter(is_verified=True)
+
+    def with_user(self):
+        """
+        Returns:
+            A queryset that fetches the owner of each address in the
+            same query.
+        """
+        return self.select_related("user")
+
+
 class EmailAddress(models.Model):
     """
     An email address belonging to a user.
@@ -61,7 +333,7 @@ class EmailAddress(models.Model):
         verbose_name=_("address"),
     )
     id = models.UUIDField(
-        default=uuid.uuid4,
+        default=generate_email_address_id,
         help_text=_("A unique identifier for the instance."),
         primary_key=True,
         verbose_name=_("ID"),
@@ -73,6 +345,15 @@ class EmailAddress(models.Model):
             "address."
         ),
     )
+    normalized_address = models.EmailField(
+        db_index=True,
+        editable=False,
+        help_text=_(
+            "The normalized version of the address used for case-insensitive "
+            "lookups."
+        ),
+        verbose_name=_("normalized address"),
+    )
     time_created = models.DateTimeField(
         auto_now_add=True,
         help_text=_("The time that the instance was created."),
@@ -100,11 +381,36 @@ class EmailAddress(models.Model):
         verbose_name=_("user"),
     )
 
+    objects = EmailAddressQuerySet.as_manager()
+
     class Meta:
+        indexes = [
+            # Supports ``user.email_addresses`` in its default order.
+            models.Index(
+                fields=["user", "time_created"],
+                name="email_auth_user_created_idx",
+            ),
+        ]
         ordering = ("time_created",)
         verbose_name = _("email address")
         verbose_name_plural = _("email addresses")
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Create an instance from a database row, remembering the
+        normalized address it was loaded with.
+
+        This allows caches keyed by the address to be invalidated if the
+        address is changed.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_normalized_address = instance.__dict__.get(
+            "normalized_address"
+        )
+
+        return instance
+
     def __repr__(self):
         """
         Returns:
@@ -131,21 +437,51 @@ class EmailAddress(models.Model):
         """
         return self.address
 
+    def save(self, *args, **kwargs):
+        """
+        Save the instance, keeping the normalized address in sync with
+        the user's preferred spelling of it.
+        """
+        self.normalized_address = normalize_address(self.address)
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "address" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "normalized_address"}
+
+        super().save(*args, **kwargs)
+
+        self._loaded_normalized_address = self.normalized_address
+
     def send_already_verified(self):
         """
         Send an email notifying the user that this email address has
         already been verified.
         """
-        context = {"email": self}
-        template = "email_auth/emails/already-verified"
+        mail.send_email(**self._get_already_verified_email())
 
-        email_utils.send_email(
-            context=context,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[self.address],
-            subject=_("Your Email Address has Already Been Verified"),
-            template_name=template,
-        )
+    async def asend_already_verified(self):
+        """
+        Asynchronous version of :py:meth:`send_already_verified`.
+
+        The email is rendered outside of the thread used for database
+        access, so the address's user must already be loaded, eg by
+        retrieving the address with ``with_user()``.
+        """
+        await mail.asend_email(**self._get_already_verified_email())
+
+    def _get_already_verified_email(self):
+        """
+        Returns:
+            The arguments for :py:func:`email_auth.mail.send_email` that
+            describe the email sent by :py:meth:`send_already_verified`.
+        """
+        return {
+            "context": {"email": self},
+            "from_email": settings.DEFAULT_FROM_EMAIL,
+            "recipient_list": [self.address],
+            "subject": _("Your Email Address has Already Been Verified"),
+            "template_name": "email_auth/emails/already-verified",
+        }
 
     def send_duplicate_notification(self):
         """
@@ -155,7 +491,7 @@ class EmailAddress(models.Model):
         context = {"email": self}
         template = "email_auth/emails/duplicate-email"
 
-        email_utils.send_email(
+        mail.send_email(
             context=context,
             from_email=settings.DEFAULT_FROM_EMAIL,
             recipient_list=[self.address],
@@ -171,7 +507,7 @@ class EmailAddress(models.Model):
         Returns:
             The created :py:class:`EmailVerification` instance.
         """
-        verification = EmailVerification.objects.create(email=self)
+        verification = EmailVerification(email=self)
         verification.send_email()
 
         return verification
@@ -179,16 +515,408 @@ class EmailAddress(models.Model):
     def verify(self):
         """
         Mark the email address instance as verified.
+
+        Raises:
+            ValidationError:
+                If another email address that differs from this one only
+                in case has already been verified.
+        """
+        with transaction.atomic():
+            # Locking every row with the same normalized address
+            # serializes concurrent verifications of the address, so the
+            # check does not depend on the database's unique index.
+            others = (
+                EmailAddress.objects.select_for_update()
+                .filter(normalized_address=normalize_address(self.address))
+                .exclude(pk=self.pk)
+                .order_by("pk")
+                .values_list("is_verified", flat=True)
+            )
+            if any(others):
+                raise ValidationError(
+                    _(
+                        "This email address has already been verified by "
+                        "another account."
+                    ),
+                    code="unique",
+                )
+
+            self.is_verified = True
+            self.time_verified = timezone.now()
+
+            logger.info("Verified email address %s", self.address)
+
+            self.save(
+                update_fields=["is_verified", "time_updated", "time_verified"]
+            )
+
+
+def _supports_delete_returning(connection):
+    """
+    Args:
+        connection:
+            A database connection.
+
+    Returns:
+        A boolean indicating if the database supports returning the
+        rows removed by a ``DELETE`` statement.
+    """
+    if connection.vendor == "postgresql":
+        return True
+
+    if connection.vendor == "sqlite":
+        return connection.Database.sqlite_version_info >= (3, 35)
+
+    return False
+
+
+class TokenQuerySet(models.QuerySet):
+    """
+    Queryset for models storing split tokens.
+    """
+
+    def _get_expiry_cutoff(self):
+        """
+        Returns:
+            The creation time before which instances are expired or
+            ``None`` if instances of the model do not expire.
+        """
+        ttl = self.model.get_ttl()
+        if ttl is None:
+            return None
+
+        return timezone.now() - datetime.timedelta(seconds=ttl)
+
+    def expired(self):
+        """
+        Returns:
+            A queryset containing only the instances that are older
+            than the model's time to live.
+        """
+        cutoff = self._get_expiry_cutoff()
+        if cutoff is None:
+            return self.none()
+
+        return self.filter(time_created__lt=cutoff)
+
+    def unexpired(self):
+        """
+        Returns:
+            A queryset containing only the instances that are still
+            within the model's time to live.
+        """
+        cutoff = self._get_expiry_cutoff()
+        if cutoff is None:
+            return self.all()
+
+        return self.filter(time_created__gte=cutoff)
+
+    def evict_oldest(self, keep):
+        """
+        Delete all but the newest instances in the queryset with a
+        single statement.
+
+        Args:
+            keep:
+                The number of instances to keep.
+
+        Returns:
+            The number of deleted instances.
+        """
+        newest = list(
+            self.order_by("-time_created").values_list("pk", flat=True)[:keep]
+        )
+        deleted, _ = self.exclude(pk__in=newest).delete()
+
+        return deleted
+
+    def sent_within(self, seconds):
+        """
+        Args:
+            seconds:
+                The number of seconds to look back.
+
+        Returns:
+            A queryset containing the unexpired instances that were
+            sent within the provided number of seconds.
+        """
+        cutoff = timezone.now() - datetime.timedelta(seconds=seconds)
+
+        return self.unexpired().filter(time_sent__gte=cutoff)
+
+    def get_by_token(self, token):
+        """
+        Get the instance identified by a token.
+
+        The instance is looked up by the token's selector and the
+        token's verifier is then compared to the stored digest in
+        constant time. Expired instances are never returned.
+
+        Args:
+            token:
+                The full token that was sent to the user.
+
+        Returns:
+            The instance identified by the token. The instance's
+            ``token`` attribute is populated with the provided token.
+
+        Raises:
+            DoesNotExist:
+                If there is no unexpired instance matching the provided
+                token.
+        """
+        selector, verifier = split_token(token)
+        if not verifier:
+            raise self.model.DoesNotExist
+
+        instance = self.unexpired().get(selector=selector)
+        if not instance.check_verifier(verifier):
+            raise self.model.DoesNotExist
+
+        instance.token = token
+
+        return instance
+
+    def claim(self):
+        """
+        Delete the instances in the queryset and return them.
+
+        Each instance is only ever returned to a single caller, even if
+        several callers claim it concurrently. Databases that support
+        ``DELETE ... RETURNING`` claim the instances with a single
+        statement. Other databases lock the rows before deleting them.
+
+        Returns:
+            A list of the instances that were claimed by this call.
+        """
+        if _supports_delete_returning(connections[self.db]):
+            return self._claim_returning()
+
+        return self._claim_locked()
+
+    def consume(self, token):
         """
-        self.is_verified = True
-        self.time_verified = timezone.now()
+        Claim and delete the instance identified by a token.
 
-        logger.info("Verified email address %s", self.address)
+        Args:
+            token:
+                The full token that was sent to the user.
 
-        self.save()
+        Returns:
+            The deleted instance. The instance's ``token`` attribute is
+            populated with the provided token.
+
+        Raises:
+            DoesNotExist:
+                If there is no unexpired instance matching the provided
+                token or it was already consumed.
+        """
+        selector, verifier = split_token(token)
+        if not verifier:
+            raise self.model.DoesNotExist
+
+        claimed = (
+            self.unexpired()
+            .filter(selector=selector, verifier_hash=hash_verifier(verifier))
+            .claim()
+        )
+        if not claimed:
+            raise self.model.DoesNotExist
+
+        instance = claimed[0]
+        instance.token = token
+
+        return instance
+
+    def _claim_locked(self):
+        """
+        Claim the instances in the queryset using row locks.
+
+        Each row is deleted individually and only returned if the delete
+        affected it, which also protects databases where
+        ``select_for_update`` has no effect.
+
+        Returns:
+            A list of the instances that were claimed by this call.
+        """
+        claimed = []
+        with transaction.atomic(using=self.db):
+            for instance in self.select_for_update():
+                rows = self.model._base_manager.using(self.db).filter(
+                    pk=instance.pk
+                )
+                deleted, _ = rows.delete()
+                if deleted:
+                    claimed.append(instance)
+
+        return claimed
+
+    def _claim_returning(self):
+        """
+        Claim the instances in the queryset using a single
+        ``DELETE ... RETURNING`` statement.
+
+        Returns:
+            A list of the instances that were claimed by this call.
+        """
+        connection = connections[self.db]
+        opts = self.model._meta
+        quote = connection.ops.quote_name
+        fields = opts.concrete_fields
+
+        # The subquery is compiled for the queryset's database rather
+        # than the default one.
+        subquery, params = (
+            self.order_by()
+            .values("pk")
+            .query.get_compiler(using=self.db)
+            .as_sql()
+        )
+        sql = (
+            f"DELETE FROM {quote(opts.db_table)} "
+            f"WHERE {quote(opts.pk.column)} IN ({subquery}) "
+            f"RETURNING {', '.join(quote(f.column) for f in fields)}"
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+
+        # Convert the raw values the same way a regular query would.
+        compiler = self.query.get_compiler(self.db)
+        converters = compiler.get_converters(
+            [f.get_col(opts.db_table) for f in fields]
+        )
+        if converters:
+            rows = compiler.apply_converters(rows, converters)
+
+        field_names = [f.attname for f in fields]
+
+        return [
+            self.model.from_db(self.db, field_names, list(row)) for row in rows
+        ]
+
+
+class AbstractToken(models.Model):
+    """
+    Base model for tokens that are emailed to users.
+
+    Each token is split into a selector and a verifier. The selector is
+    stored as is and used to look up the token. Only a digest of the
+    verifier is stored, so the full token is only known to the process
+    that created it and to the user it was sent to.
+    """
+
+    selector = models.CharField(
+        help_text=_("The public part of the token used to look it up."),
+        max_length=TOKEN_SELECTOR_LENGTH,
+        primary_key=True,
+        verbose_name=_("selector"),
+    )
+    verifier_hash = models.BinaryField(
+        help_text=_("A digest of the secret part of the token."),
+        max_length=VERIFIER_HASH_LENGTH,
+        verbose_name=_("verifier hash"),
+    )
+
+    objects = TokenQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def get_ttl(cls):
+        """
+        Returns:
+            The number of seconds that instances are valid for after
+            they are created or ``None`` if they do not expire.
+        """
+        raise NotImplementedError
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize the instance, generating a new token if the instance
+        is not being loaded from the database.
+        """
+        super().__init__(*args, **kwargs)
+
+        # Instances loaded from the database receive positional
+        # arguments. Their raw token is unknown until it is provided
+        # to ``get_by_token``.
+        self.token = None
+        if not args and "selector" not in kwargs and "pk" not in kwargs:
+            self.set_token(generate_token())
+
+    def check_verifier(self, verifier):
+        """
+        Compare a verifier to the stored digest in constant time.
+
+        Args:
+            verifier:
+                The verifier to check.
+
+        Returns:
+            A boolean indicating if the verifier matches the digest.
+        """
+        return hmac.compare_digest(
+            hash_verifier(verifier), bytes(self.verifier_hash)
+        )
+
+    def consume(self):
+        """
+        Claim and delete the instance so that its token cannot be used
+        again.
+
+        Raises:
+            DoesNotExist:
+                If the instance was already consumed, possibly by a
+                concurrent request.
+        """
+        rows = type(self).objects.using(self._state.db).filter(pk=self.pk)
+        if not rows.claim():
+            raise self.DoesNotExist
+
+    def record_sent(self):
+        """
+        Record the time that the token was sent.
+
+        New instances are saved with a single insert and existing
+        instances only have their send and update times written. The
+        instance is saved before the token is emailed so that the user
+        never receives a token that does not exist.
+        """
+        self.time_sent = timezone.now()
+
+        if self._state.adding:
+            self.save(force_insert=True)
+        else:
+            self.save(update_fields=["time_sent", "time_updated"])
+
+    def set_token(self, token):
+        """
+        Set the instance's selector and verifier digest from a token.
+
+        Args:
+            token:
+                The full token.
+
+        Raises:
+            ImproperlyConfigured:
+                If the token is too short to contain a verifier.
+        """
+        selector, verifier = split_token(token)
+        if not verifier:
+            raise ImproperlyConfigured(
+                f"Tokens must be longer than {TOKEN_SELECTOR_LENGTH} "
+                f"characters. Check the TOKEN_LENGTH setting."
+            )
+
+        self.selector = selector
+        self.verifier_hash = hash_verifier(verifier)
+        self.token = token
 
 
-class EmailVerification(models.Model):
+class EmailVerification(AbstractToken):
     """
     A token that allows a user to verify that they own an email address.
 
@@ -207,6 +935,7 @@ class EmailVerification(models.Model):
     )
     time_created = models.DateTimeField(
         auto_now_add=True,
+        db_index=True,
         help_text=_("The time that the instance was created."),
         verbose_name=_("creation time"),
     )
@@ -221,13 +950,6 @@ class EmailVerification(models.Model):
         help_text=_("The time of the last update to the instance."),
         verbose_name=_("last update time"),
     )
-    token = models.CharField(
-        default=generate_token,
-        help_text=_("The random token identifying the verification request."),
-        max_length=TOKEN_LENGTH,
-        primary_key=True,
-        verbose_name=_("token"),
-    )
 
     class Meta:
         ordering = ("time_created",)
@@ -242,7 +964,7 @@ class EmailVerification(models.Model):
         """
         return build_repr(
             self,
-            ["email", "time_created", "time_sent", "time_updated", "token"],
+            ["email", "selector", "time_created", "time_sent", "time_updated"],
         )
 
     def __str__(self):
@@ -253,46 +975,257 @@ class EmailVerification(models.Model):
         """
         return f"Verification for {self.email}"
 
+    @classmethod
+    def get_ttl(cls):
+        """
+        Returns:
+            The number of seconds that verifications are valid for or
+            ``None`` if they do not expire.
+        """
+        return app_settings.EMAIL_VERIFICATION_TTL
+
     def send_email(self):
         """
         Send an email containing the verification token to the email
         address being verified.
+
+        If emails are queued in the outbox, the verification and its
+        email are saved in the same transaction.
         """
-        verification_url_template = app_settings.EMAIL_VERIFICATION_URL
-        if verification_url_template is not None:
-            verification_url = verification_url_template.format(key=self.token)
-        else:
-            verification_url = None
+        with mail.atomic():
+            self.record_sent()
+            send_verification_token(self)
 
-        context = {
-            "email": self.email,
-            "user": self.email.user,
-            "verification": self,
-            "verification_url": verification_url,
-        }
-        template = "email_auth/emails/verify-email"
+    def verify(self):
+        """
+        Mark the associated email address as verified and delete the
+        verification instance.
 
-        email_utils.send_email(
-            context=context,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[self.email.address],
-            subject=_("Please Verify Your Email Address"),
-            template_name=template,
+        Raises:
+            DoesNotExist:
+                If the verification was already used.
+        """
+        with transaction.atomic():
+            self.consume()
+            self.email.verify()
+
+
+class OutboundEmailQuerySet(models.QuerySet):
+    """
+    Queryset for emails in the outbox.
+    """
+
+    def available(self, max_attempts, now=None):
+        """
+        Args:
+            max_attempts:
+                The number of failed attempts after which an email is no
+                longer retried.
+            now:
+                The time to check availability at. Defaults to the
+                current time.
+
+        Returns:
+            A queryset containing the emails that are neither leased
+            nor waiting to be retried and have not exhausted their
+            attempts.
+        """
+        return self.filter(
+            attempts__lt=max_attempts,
+            time_available__lte=now or timezone.now(),
         )
 
-        self.time_sent = timezone.now()
-        self.save()
+    def failed(self, max_attempts):
+        """
+        Args:
+            max_attempts:
+                The number of failed attempts after which an email is no
+                longer retried.
 
-    def verify(self):
+        Returns:
+            A queryset containing the emails that will not be retried.
         """
-        Mark the associated email address as verified and delete the
-        verification instance.
+        return self.filter(attempts__gte=max_attempts)
+
+    def lease(self, batch_size, duration, max_attempts):
+        """
+        Lease a batch of available emails for sending.
+
+        Leased emails are unavailable to other workers until the lease
+        expires. An email whose worker stops before sending it becomes
+        available again once its lease expires.
+
+        Args:
+            batch_size:
+                The maximum number of emails to lease.
+            duration:
+                The number of seconds the lease lasts for.
+            max_attempts:
+                The number of failed attempts after which an email is no
+                longer retried.
+
+        Returns:
+            A list of the leased emails in the order they were queued.
+        """
+        lease_id = uuid.uuid4()
+        now = timezone.now()
+
+        with transaction.atomic(using=self.db):
+            candidates = self.available(max_attempts, now).order_by(
+                "time_available"
+            )
+            if connections[self.db].features.has_select_for_update_skip_locked:
+                candidates = candidates.select_for_update(skip_locked=True)
+
+            pks = list(candidates.values_list("pk", flat=True)[:batch_size])
+
+            # Availability is checked again so that emails leased by
+            # another worker in the meantime are skipped on databases
+            # without row locks.
+            self.available(max_attempts, now).filter(pk__in=pks).update(
+                lease_id=lease_id,
+                time_available=now + datetime.timedelta(seconds=duration),
+            )
+
+        return list(self.filter(lease_id=lease_id).order_by("time_created"))
+
+
+class OutboundEmail(models.Model):
+    """
+    A rendered email waiting in the outbox to be sent.
+
+    Emails are written to the outbox in the same transaction as the
+    changes they describe and sent later by the ``dispatch_emails``
+    management command. Sent emails are deleted.
+    """
+
+    attempts = models.PositiveIntegerField(
+        default=0,
+        help_text=_("The number of failed attempts to send the email."),
+        verbose_name=_("attempts"),
+    )
+    body = models.TextField(
+        blank=True,
+        help_text=_("The plain text body of the email."),
+        verbose_name=_("body"),
+    )
+    from_email = models.CharField(
+        help_text=_("The address the email is sent from."),
+        max_length=255,
+        verbose_name=_("from email"),
+    )
+    html_body = models.TextField(
+        blank=True,
+        help_text=_("The HTML body of the email."),
+        verbose_name=_("HTML body"),
+    )
+    last_error = models.TextField(
+        blank=True,
+        help_text=_("The error from the last failed attempt to send."),
+        verbose_name=_("last error"),
+    )
+    lease_id = models.UUIDField(
+        blank=True,
+        db_index=True,
+        help_text=_("Identifies the worker that last leased the email."),
+        null=True,
+        verbose_name=_("lease ID"),
+    )
+    recipients = models.TextField(
+        help_text=_("The addresses to send the email to, one per line."),
+        verbose_name=_("recipients"),
+    )
+    subject = models.TextField(
+        help_text=_("The subject of the email."), verbose_name=_("subject")
+    )
+    time_available = models.DateTimeField(
+        db_index=True,
+        default=timezone.now,
+        help_text=_(
+            "The time after which the email may be sent. This is pushed back "
+            "while the email is leased and between retries."
+        ),
+        verbose_name=_("available time"),
+    )
+    time_created = models.DateTimeField(
+        auto_now_add=True,
+        help_text=_("The time that the instance was created."),
+        verbose_name=_("creation time"),
+    )
+
+    objects = OutboundEmailQuerySet.as_manager()
+
+    class Meta:
+        ordering = ("time_created",)
+        verbose_name = _("outbound email")
+        verbose_name_plural = _("outbound emails")
+
+    def __repr__(self):
+        """
+        Returns:
+            A string representation of the instance suitable for
+            debugging purposes.
+        """
+        return build_repr(
+            self,
+            [
+                "attempts",
+                "id",
+                "recipients",
+                "subject",
+                "time_available",
+                "time_created",
+            ],
+        )
+
+    def __str__(self):
+        """
+        Returns:
+            A description of the email's subject and recipients.
+        """
+        return f"'{self.subject}' to {', '.join(self.recipient_list)}"
+
+    @property
+    def recipient_list(self):
+        """
+        The list of addresses the email is sent to.
+        """
+        return self.recipients.splitlines()
+
+    def mark_failed(self, error, retry_delay):
+        """
+        Record a failed attempt to send the email and release its lease.
+
+        Args:
+            error:
+                A description of the error that occurred.
+            retry_delay:
+                The number of seconds to wait before the email may be
+                sent again.
+        """
+        self.attempts += 1
+        self.last_error = error
+        self.lease_id = None
+        self.time_available = timezone.now() + datetime.timedelta(
+            seconds=retry_delay
+        )
+        self.save(
+            update_fields=[
+                "attempts",
+                "last_error",
+                "lease_id",
+                "time_available",
+            ]
+        )
+
+    def mark_sent(self):
+        """
+        Delete the email from the outbox after it was sent.
         """
-        self.email.verify()
         self.delete()
 
 
-class PasswordReset(models.Model):
+class PasswordReset(AbstractToken):
     """
     A model containing a token that can be used to reset a user's
     password.
@@ -308,6 +1241,7 @@ class PasswordReset(models.Model):
     )
     time_created = models.DateTimeField(
         auto_now_add=True,
+        db_index=True,
         help_text=_("The time that the instance was created."),
         verbose_name=_("creation time"),
     )
@@ -322,13 +1256,6 @@ class PasswordReset(models.Model):
         help_text=_("The time of the last update to the instance."),
         verbose_name=_("last update time"),
     )
-    token = models.CharField(
-        default=generate_token,
-        help_text=_("The random token identifying the password reset."),
-        max_length=TOKEN_LENGTH,
-        primary_key=True,
-        verbose_name=_("token"),
-    )
 
     class Meta:
         ordering = ("time_created",)
@@ -343,7 +1270,7 @@ class PasswordReset(models.Model):
         """
         return build_repr(
             self,
-            ["email", "time_created", "time_sent", "time_updated", "token"],
+            ["email", "selector", "time_created", "time_sent", "time_updated"],
         )
 
     def __str__(self):
@@ -354,26 +1281,63 @@ class PasswordReset(models.Model):
         """
         return f"Password reset for '{self.email}'"
 
-    def send_email(self):
+    @classmethod
+    def get_ttl(cls):
         """
-        Send the token authorizing the password reset to the email
-        address associated with the instance.
+        Returns:
+            The number of seconds that password resets are valid for or
+            ``None`` if they do not expire.
         """
-        reset_url_template = app_settings.PASSWORD_RESET_URL
-        if reset_url_template is not None:
-            reset_url = reset_url_template.format(key=self.token)
-        else:
-            reset_url = None
+        return app_settings.PASSWORD_RESET_TTL
 
-        context = {"password_reset": self, "reset_url": reset_url}
+    def consume(self):
+        """
+        Claim and delete the instance along with the other password
+        resets of the same user in a single statement, so that none of
+        the user's other reset tokens can be used afterwards.
 
-        email_utils.send_email(
-            context=context,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[self.email.address],
-            subject=_("Reset Your Password"),
-            template_name="email_auth/emails/reset-password",
-        )
+        Raises:
+            DoesNotExist:
+                If the instance was already consumed, possibly by a
+                concurrent request.
+        """
+        # The savepoint lets callers handle ``DoesNotExist`` and keep
+        # using their own transaction.
+        with transaction.atomic(using=self._state.db):
+            resets = PasswordReset.objects.using(self._state.db).filter(
+                email__user_id=self.email.user_id
+            )
+            claimed = resets.claim()
 
-        self.time_sent = timezone.now()
-        self.save()
+            # Raising rolls back the deletion of the other resets.
+            if self.pk not in {reset.pk for reset in claimed}:
+                raise self.DoesNotExist
+
+    def reset_password(self, password):
+        """
+        Set a new password for the owner of the associated email address
+        and delete the user's password resets.
+
+        Args:
+            password:
+                The user's new password.
+
+        Raises:
+            DoesNotExist:
+                If the password reset was already used.
+        """
+        with transaction.atomic():
+            self.consume()
+            set_user_password(self.email.user, password)
+
+    def send_email(self):
+        """
+        Send the token authorizing the password reset to the email
+        address associated with the instance.
+
+        If emails are queued in the outbox, the password reset and its
+        email are saved in the same transaction.
+        """
+        with mail.atomic():
+            self.record_sent()
+            send_password_reset_token(self)
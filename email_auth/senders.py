@@ -0,0 +1,298 @@
+"""
+Senders that deliver the emails rendered by the app.
+
+The sender used is specified by the ``EMAIL_SENDER`` setting. Every
+sender provides the same interface:
+
+* ``send_messages(email_messages)`` delivers a list of
+  :py:class:`django.core.mail.EmailMultiAlternatives` instances and
+  returns the number of messages delivered.
+* ``asend_messages(email_messages)`` is the async version of
+  ``send_messages``.
+* ``atomic()`` returns a context manager wrapping code that saves rows
+  and sends an email about them.
+* ``close()`` delivers any messages the sender is holding on to. It is
+  called when the process exits.
+"""
+
+import atexit
+import contextlib
+import json
+import threading
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from email_auth import app_settings, async_utils
+
+
+# Sender instances keyed by their import path. Senders are reused for
+# the lifetime of the process so that they can batch their work.
+_senders = {}
+
+
+def get_sender():
+    """
+    Returns:
+        The instance of the sender specified by the ``EMAIL_SENDER``
+        setting.
+    """
+    path = app_settings.EMAIL_SENDER
+    sender = _senders.get(path)
+    if sender is None:
+        sender = _senders.setdefault(path, import_string(path)())
+
+    return sender
+
+
+def close_senders():
+    """
+    Close and discard every sender that has been used.
+    """
+    while _senders:
+        _, sender = _senders.popitem()
+        sender.close()
+
+
+def reset_senders(setting, **kwargs):
+    """
+    Signal receiver that closes the existing senders when the app's
+    settings change so that new senders use the new settings.
+
+    Args:
+        setting:
+            The name of the setting that changed.
+    """
+    if setting == "EMAIL_AUTH":
+        close_senders()
+
+
+atexit.register(close_senders)
+
+
+class BaseSender:
+    """
+    Base class for senders.
+    """
+
+    # Whether messages handed to the sender count against the
+    # ``EMAIL_RATE_LIMIT``. Senders that do not talk to the mail server
+    # themselves should disable this.
+    governed = True
+
+    def atomic(self):
+        """
+        Returns:
+            A context manager for code that saves rows and sends an
+            email about them. By default it does nothing, so no
+            transaction is held open while the email is sent.
+        """
+        # An empty exit stack does nothing. ``contextlib.nullcontext``
+        # requires Python 3.7.
+        return contextlib.ExitStack()
+
+    async def asend_messages(self, email_messages):
+        """
+        Asynchronously deliver messages.
+
+        By default, the messages are delivered by ``send_messages`` in
+        the thread used for database access.
+
+        Args:
+            email_messages:
+                A list of the messages to deliver.
+
+        Returns:
+            The number of messages that were delivered.
+        """
+        return await sync_to_async(self.send_messages)(email_messages)
+
+    def close(self):
+        """
+        Deliver any messages held by the sender.
+        """
+
+    def send_messages(self, email_messages):
+        """
+        Deliver messages.
+
+        Args:
+            email_messages:
+                A list of the messages to deliver.
+
+        Returns:
+            The number of messages that were delivered.
+        """
+        raise NotImplementedError
+
+
+class InlineSender(BaseSender):
+    """
+    Sender that sends messages immediately with Django's email backend.
+    """
+
+    async def asend_messages(self, email_messages):
+        # Talking to the mail server does not touch the database, so it
+        # does not need to hold up the thread used for database access.
+        return await async_utils.run_in_thread(
+            self.send_messages, email_messages
+        )
+
+    def send_messages(self, email_messages):
+        for message in email_messages:
+            message.send()
+
+        return len(email_messages)
+
+
+class LocmemSender(BaseSender):
+    """
+    Sender that collects messages in memory without sending them.
+
+    Unlike Django's locmem email backend, messages are not converted to
+    MIME, so collecting them is cheap enough for load tests.
+    """
+
+    # Messages never reach a mail server, so they are not rate limited.
+    governed = False
+
+    # The messages collected by all instances.
+    messages = []
+
+    async def asend_messages(self, email_messages):
+        return self.send_messages(email_messages)
+
+    def send_messages(self, email_messages):
+        self.messages.extend(email_messages)
+
+        return len(email_messages)
+
+
+class OutboxSender(BaseSender):
+    """
+    Sender that saves messages to the outbox to be sent by the
+    ``dispatch_emails`` management command.
+    """
+
+    # The rate limit is applied by the command when it sends messages.
+    governed = False
+
+    def atomic(self):
+        """
+        Returns:
+            A transaction, so that an email is only queued if the rows
+            it describes are saved.
+        """
+        return transaction.atomic()
+
+    def send_messages(self, email_messages):
+        # Imported here because the models send their emails through
+        # the senders.
+        from email_auth.models import OutboundEmail
+
+        OutboundEmail.objects.bulk_create(
+            [
+                OutboundEmail(
+                    body=message.body,
+                    from_email=message.from_email,
+                    html_body=_get_html_body(message),
+                    recipients="\n".join(message.to),
+                    subject=str(message.subject),
+                )
+                for message in email_messages
+            ]
+        )
+
+        return len(email_messages)
+
+
+class SpoolSender(BaseSender):
+    """
+    Sender that appends messages as JSON lines to the file given by the
+    ``EMAIL_SPOOL_PATH`` setting.
+
+    Messages are buffered in memory and written in batches of
+    ``EMAIL_SPOOL_BATCH_SIZE`` lines with a single write, so load tests
+    can run without a mail server. Buffered messages are written when
+    the process exits.
+    """
+
+    # Messages never reach a mail server, so they are not rate limited.
+    governed = False
+
+    def __init__(self):
+        self.batch_size = app_settings.EMAIL_SPOOL_BATCH_SIZE
+        self.path = app_settings.EMAIL_SPOOL_PATH
+        if self.path is None:
+            raise ImproperlyConfigured(
+                "The EMAIL_SPOOL_PATH setting is required by the "
+                "SpoolSender."
+            )
+
+        self._buffer = []
+        self._lock = threading.Lock()
+
+    async def asend_messages(self, email_messages):
+        return await async_utils.run_in_thread(
+            self.send_messages, email_messages
+        )
+
+    def close(self):
+        self.flush()
+
+    def flush(self):
+        """
+        Write the buffered messages to the spool file.
+        """
+        with self._lock:
+            lines, self._buffer = self._buffer, []
+
+        if lines:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("".join(lines))
+
+    def send_messages(self, email_messages):
+        time_sent = timezone.now().isoformat()
+        lines = [
+            json.dumps(
+                {
+                    "body": message.body,
+                    "from_email": message.from_email,
+                    "html_body": _get_html_body(message),
+                    "subject": str(message.subject),
+                    "time_sent": time_sent,
+                    "to": message.to,
+                }
+            )
+            + "\n"
+            for message in email_messages
+        ]
+
+        with self._lock:
+            self._buffer.extend(lines)
+            full = len(self._buffer) >= self.batch_size
+
+        if full:
+            self.flush()
+
+        return len(email_messages)
+
+
+def _get_html_body(message):
+    """
+    Args:
+        message:
+            An email message.
+
+    Returns:
+        The HTML alternative of the message or an empty string if it
+        does not have one.
+    """
+    for content, mimetype in getattr(message, "alternatives", []):
+        if mimetype == "text/html":
+            return content
+
+    return ""
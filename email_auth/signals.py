@@ -0,0 +1,34 @@
+"""
+Signals sent by the app.
+
+These can be used to collect metrics, for example by forwarding the
+provided timings to a monitoring system.
+"""
+
+from django.dispatch import Signal
+
+
+# Sent after the authentication backend hashes a password.
+#
+# Arguments:
+#     wait_time:
+#         The number of seconds spent waiting for a hashing slot.
+#     hash_time:
+#         The number of seconds spent hashing the password.
+password_hashed = Signal()
+
+# Sent when the authentication backend gives up waiting for a hashing
+# slot because the ``PASSWORD_HASHING_TIMEOUT`` was exceeded.
+#
+# Arguments:
+#     wait_time:
+#         The number of seconds spent waiting for a hashing slot.
+password_hashing_timed_out = Signal()
+
+# Sent when an email is saved to the outbox because the
+# ``EMAIL_RATE_LIMIT`` was reached.
+#
+# Arguments:
+#     message:
+#         The deferred :py:class:`django.core.mail.EmailMessage`.
+email_deferred = Signal()
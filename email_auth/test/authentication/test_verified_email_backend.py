@@ -2,14 +2,16 @@ from unittest import mock
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.exceptions import PermissionDenied
 
-from email_auth import authentication, models
+from email_auth import authentication, hashing, models
 
 
 @pytest.fixture
 def mock_email_address_qs():
     mock_qs = mock.Mock(spec=models.EmailAddress.objects)
     mock_qs.all.return_value = mock_qs
+    mock_qs.for_login.return_value = mock_qs
 
     with mock.patch("email_auth.models.EmailAddress.objects", new=mock_qs):
         yield mock_qs
@@ -35,7 +37,7 @@ def test_authenticate_with_verified_email_correct_password(
     password = "password"
     user = get_user_model()(is_active=True)
     user.set_password(password)
-    email = models.EmailAddress(address="test@example.com", user=user)
+    email = models.EmailAddress(address="Test@Example.com", user=user)
     mock_email_address_qs.get.return_value = email
 
     backend = authentication.VerifiedEmailBackend()
@@ -43,10 +45,12 @@ def test_authenticate_with_verified_email_correct_password(
     authenticated_user = backend.authenticate(None, email.address, password)
 
     assert authenticated_user == user
-    assert mock_email_address_qs.get.call_args[1]["address"] == email.address
+    assert mock_email_address_qs.for_login.call_args[0] == (
+        "test@example.com",
+    )
 
 
-@mock.patch("django.contrib.auth.models.User.check_password", autospec=True)
+@mock.patch("email_auth.hashing.hashers.check_password", autospec=True)
 def test_authenticate_with_missing_email(
     mock_check_password, mock_email_address_qs
 ):
@@ -61,11 +65,36 @@ def test_authenticate_with_missing_email(
     authenticated_user = backend.authenticate(None, email, "password")
 
     assert authenticated_user is None
-    assert mock_email_address_qs.get.call_args[1]["address"] == email
-    assert mock_email_address_qs.get.call_args[1]["is_verified"]
+    assert mock_email_address_qs.for_login.call_args[0] == (email,)
 
     # There should still be a password check even if no user is found.
     assert mock_check_password.call_count == 1
+    assert mock_check_password.call_args[0][:2] == (
+        "password",
+        hashing.get_dummy_password_hash(),
+    )
+
+
+@mock.patch("email_auth.hashing.hashers.check_password", autospec=True)
+def test_authenticate_with_ambiguous_email(
+    mock_check_password, mock_email_address_qs
+):
+    """
+    If several verified email addresses differ only in case, the address
+    cannot be attributed to a single user, so authentication should
+    fail.
+    """
+    mock_email_address_qs.get.side_effect = (
+        models.EmailAddress.MultipleObjectsReturned
+    )
+
+    backend = authentication.VerifiedEmailBackend()
+    authenticated_user = backend.authenticate(
+        None, "test@example.com", "password"
+    )
+
+    assert authenticated_user is None
+    assert mock_check_password.call_count == 1
 
 
 def test_authenticate_with_verified_email_incorrect_password(
@@ -107,6 +136,123 @@ def test_authenticate_with_verified_email_correct_password_inactive_user(
     assert authenticated_user is None
 
 
+@mock.patch(
+    "email_auth.hashing.hashing_slot",
+    autospec=True,
+    side_effect=hashing.HashingTimeout,
+)
+def test_authenticate_hashing_timeout(_, mock_email_address_qs):
+    """
+    If the password can't be hashed because all hashing slots are busy,
+    authentication should fail.
+    """
+    password = "password"
+    user = get_user_model()(is_active=True)
+    user.set_password(password)
+    email = models.EmailAddress(address="test@example.com", user=user)
+    mock_email_address_qs.get.return_value = email
+
+    backend = authentication.VerifiedEmailBackend()
+    authenticated_user = backend.authenticate(None, email.address, password)
+
+    assert authenticated_user is None
+
+
+def test_authenticate_throttled(mock_email_address_qs, settings):
+    """
+    If the login attempt exceeds the throttling limits, authentication
+    should be denied without querying the database or hashing the
+    password.
+    """
+    settings.EMAIL_AUTH = {"LOGIN_THROTTLE_ADDRESS_LIMIT": 1}
+    backend = authentication.VerifiedEmailBackend()
+    mock_email_address_qs.get.side_effect = models.EmailAddress.DoesNotExist
+    backend.authenticate(None, "test@example.com", "password")
+
+    with mock.patch(
+        "email_auth.hashing.hashing_slot", autospec=True
+    ) as mock_slot, pytest.raises(PermissionDenied):
+        backend.authenticate(None, "test@example.com", "password")
+
+    assert mock_email_address_qs.get.call_count == 1
+    assert mock_slot.call_count == 0
+
+
+def test_authenticate_without_credentials(mock_email_address_qs):
+    """
+    If no username or password is provided, authentication should fail
+    without querying for an email address.
+    """
+    backend = authentication.VerifiedEmailBackend()
+
+    assert backend.authenticate(None, password="password") is None
+    assert backend.authenticate(None, username="test@example.com") is None
+    assert mock_email_address_qs.get.call_count == 0
+
+
+@pytest.mark.django_db
+def test_authenticate_query_count(django_assert_num_queries):
+    """
+    A successful authentication should fetch the email address and its
+    owner in a single query.
+    """
+    password = "password"
+    user = get_user_model().objects.create_user(
+        password=password, username="test"
+    )
+    email = models.EmailAddress.objects.create(
+        address="test@example.com", is_verified=True, user=user
+    )
+
+    backend = authentication.VerifiedEmailBackend()
+    with django_assert_num_queries(1):
+        authenticated_user = backend.authenticate(
+            None, email.address, password
+        )
+        # Accessing the user's fields should not trigger more queries.
+        assert authenticated_user.username == user.username
+
+    assert authenticated_user == user
+
+
+@pytest.mark.django_db
+def test_authenticate_query_count_missing_email(django_assert_num_queries):
+    """
+    An authentication attempt for an unknown address should only make a
+    single query.
+    """
+    backend = authentication.VerifiedEmailBackend()
+    with django_assert_num_queries(1):
+        authenticated_user = backend.authenticate(
+            None, "test@example.com", "password"
+        )
+
+    assert authenticated_user is None
+
+
+@pytest.mark.django_db
+def test_authenticate_query_count_inactive_user(django_assert_num_queries):
+    """
+    An authentication attempt for an inactive user should only make a
+    single query.
+    """
+    password = "password"
+    user = get_user_model().objects.create_user(
+        is_active=False, password=password, username="test"
+    )
+    email = models.EmailAddress.objects.create(
+        address="test@example.com", is_verified=True, user=user
+    )
+
+    backend = authentication.VerifiedEmailBackend()
+    with django_assert_num_queries(1):
+        authenticated_user = backend.authenticate(
+            None, email.address, password
+        )
+
+    assert authenticated_user is None
+
+
 def test_get_user(mock_user_qs):
     """
     The authentication backend should allow for fetching a user by their
@@ -135,3 +281,109 @@ def test_get_user_invalid_id(mock_user_qs):
 
     assert retrieved_user is None
     assert mock_user_qs.get.call_args[1] == {"pk": 42}
+
+
+@pytest.mark.django_db
+def test_get_user_cached(django_assert_num_queries, settings):
+    """
+    If user caching is enabled, retrieving the same user twice should
+    only query the database once.
+    """
+    settings.EMAIL_AUTH = {"USER_CACHE_TIMEOUT": 300}
+    user = get_user_model().objects.create_user(username="test")
+
+    backend = authentication.VerifiedEmailBackend()
+    with django_assert_num_queries(1):
+        assert backend.get_user(user.pk) == user
+        assert backend.get_user(user.pk) == user
+
+
+@pytest.mark.django_db
+def test_get_user_cached_user_deactivated(settings):
+    """
+    Changes to a cached user should be visible as soon as the user is
+    saved.
+    """
+    settings.EMAIL_AUTH = {"USER_CACHE_TIMEOUT": 300}
+    user = get_user_model().objects.create_user(username="test")
+
+    backend = authentication.VerifiedEmailBackend()
+    assert backend.get_user(user.pk).is_active
+
+    user.is_active = False
+    user.save()
+
+    assert not backend.get_user(user.pk).is_active
+
+
+@pytest.mark.django_db
+def test_authenticate_address_cached(django_assert_num_queries, settings):
+    """
+    If address caching is enabled, subsequent authentications with the
+    same address should only fetch the user by their primary key.
+    """
+    settings.EMAIL_AUTH = {"ADDRESS_CACHE_TIMEOUT": 300}
+    password = "password"
+    user = get_user_model().objects.create_user(
+        password=password, username="test"
+    )
+    email = models.EmailAddress.objects.create(
+        address="test@example.com", is_verified=True, user=user
+    )
+
+    backend = authentication.VerifiedEmailBackend()
+    assert backend.authenticate(None, email.address, password) == user
+
+    with django_assert_num_queries(1) as context:
+        assert backend.authenticate(None, email.address, password) == user
+
+    assert "email_auth_emailaddress" not in context.captured_queries[0]["sql"]
+
+
+@pytest.mark.django_db
+def test_authenticate_address_cached_password_changed(settings):
+    """
+    The password check should always use the user's current password
+    even if the owner of the address is cached.
+    """
+    settings.EMAIL_AUTH = {"ADDRESS_CACHE_TIMEOUT": 300}
+    password = "password"
+    user = get_user_model().objects.create_user(
+        password=password, username="test"
+    )
+    email = models.EmailAddress.objects.create(
+        address="test@example.com", is_verified=True, user=user
+    )
+
+    backend = authentication.VerifiedEmailBackend()
+    assert backend.authenticate(None, email.address, password) == user
+
+    user.set_password("new-password")
+    user.save()
+
+    assert backend.authenticate(None, email.address, password) is None
+    assert backend.authenticate(None, email.address, "new-password") == user
+
+
+@pytest.mark.django_db
+def test_authenticate_address_cached_unverified(settings):
+    """
+    Once an address is no longer verified, it should not be usable for
+    authentication even if its owner was cached.
+    """
+    settings.EMAIL_AUTH = {"ADDRESS_CACHE_TIMEOUT": 300}
+    password = "password"
+    user = get_user_model().objects.create_user(
+        password=password, username="test"
+    )
+    email = models.EmailAddress.objects.create(
+        address="test@example.com", is_verified=True, user=user
+    )
+
+    backend = authentication.VerifiedEmailBackend()
+    assert backend.authenticate(None, email.address, password) == user
+
+    email.is_verified = False
+    email.save()
+
+    assert backend.authenticate(None, email.address, password) is None
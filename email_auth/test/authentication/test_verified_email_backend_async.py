@@ -0,0 +1,197 @@
+import logging
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import hashers
+from django.core.exceptions import PermissionDenied
+
+from email_auth import authentication, hashing
+
+
+PASSWORD = "password"
+
+
+def test_aauthenticate_correct_password(
+    caplog, django_assert_num_queries, verified_email
+):
+    """
+    Providing a verified email and the owner's password should return
+    the owner of the email address using a single query.
+    """
+    caplog.set_level(logging.DEBUG, logger=authentication.__name__)
+    backend = authentication.VerifiedEmailBackend()
+
+    with django_assert_num_queries(1):
+        user = async_to_sync(backend.aauthenticate)(
+            None, "Test@Example.com", PASSWORD
+        )
+
+    assert user == verified_email.user
+    assert "Authenticated user with email" in caplog.text
+
+
+def test_aauthenticate_incorrect_password(verified_email):
+    """
+    Providing an incorrect password should cause authentication to fail.
+    """
+    backend = authentication.VerifiedEmailBackend()
+
+    user = async_to_sync(backend.aauthenticate)(
+        None, verified_email.address, PASSWORD + "invalid"
+    )
+
+    assert user is None
+
+
+def test_aauthenticate_inactive_user(verified_email):
+    """
+    Inactive users should not be able to authenticate.
+    """
+    verified_email.user.is_active = False
+    verified_email.user.save()
+    backend = authentication.VerifiedEmailBackend()
+
+    user = async_to_sync(backend.aauthenticate)(
+        None, verified_email.address, PASSWORD
+    )
+
+    assert user is None
+
+
+@pytest.mark.django_db
+@mock.patch("email_auth.hashing.hashers.check_password", autospec=True)
+def test_aauthenticate_missing_email(mock_check_password, caplog):
+    """
+    If no verified email with the given address exists, authentication
+    should fail after checking the password against the dummy hash.
+    """
+    caplog.set_level(logging.DEBUG, logger=authentication.__name__)
+    backend = authentication.VerifiedEmailBackend()
+
+    user = async_to_sync(backend.aauthenticate)(
+        None, "test@example.com", PASSWORD
+    )
+
+    assert user is None
+    assert "Could not find verified email" in caplog.text
+    assert mock_check_password.call_args[0][:2] == (
+        PASSWORD,
+        hashing.get_dummy_password_hash(),
+    )
+    assert mock_check_password.call_count == 1
+
+
+def test_aauthenticate_upgrades_password_hash(settings, verified_email):
+    """
+    If the password is correct but was hashed using an outdated hasher,
+    the stored hash should be upgraded like it is for synchronous
+    authentication.
+    """
+    settings.PASSWORD_HASHERS = [
+        "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+        "django.contrib.auth.hashers.MD5PasswordHasher",
+    ]
+    user = verified_email.user
+    user.password = hashers.make_password(PASSWORD, hasher="md5")
+    user.save()
+    backend = authentication.VerifiedEmailBackend()
+
+    authenticated = async_to_sync(backend.aauthenticate)(
+        None, verified_email.address, PASSWORD
+    )
+    user.refresh_from_db()
+
+    assert authenticated == user
+    assert hashers.identify_hasher(user.password).algorithm == "pbkdf2_sha256"
+    assert user.check_password(PASSWORD)
+
+
+@mock.patch(
+    "email_auth.hashing.hashing_slot",
+    autospec=True,
+    side_effect=hashing.HashingTimeout,
+)
+def test_aauthenticate_hashing_timeout(_, verified_email):
+    """
+    If the password can't be hashed because all hashing slots are busy,
+    authentication should fail.
+    """
+    backend = authentication.VerifiedEmailBackend()
+
+    user = async_to_sync(backend.aauthenticate)(
+        None, verified_email.address, PASSWORD
+    )
+
+    assert user is None
+
+
+def test_aauthenticate_throttled(settings, verified_email):
+    """
+    If the login attempt exceeds the throttling limits, authentication
+    should be denied.
+    """
+    settings.EMAIL_AUTH = {"LOGIN_THROTTLE_ADDRESS_LIMIT": 1}
+    backend = authentication.VerifiedEmailBackend()
+    async_to_sync(backend.aauthenticate)(None, verified_email.address, "bad")
+
+    with pytest.raises(PermissionDenied):
+        async_to_sync(backend.aauthenticate)(
+            None, verified_email.address, PASSWORD
+        )
+
+
+def test_aauthenticate_address_cached(
+    django_assert_num_queries, settings, verified_email
+):
+    """
+    If address caching is enabled, subsequent authentications with the
+    same address should only fetch the user by their primary key.
+    """
+    settings.EMAIL_AUTH = {"ADDRESS_CACHE_TIMEOUT": 300}
+    backend = authentication.VerifiedEmailBackend()
+    authenticate = async_to_sync(backend.aauthenticate)
+
+    assert authenticate(None, verified_email.address, PASSWORD)
+
+    with django_assert_num_queries(1) as context:
+        user = authenticate(None, verified_email.address, PASSWORD)
+
+    assert user == verified_email.user
+    assert "email_auth_emailaddress" not in context.captured_queries[0]["sql"]
+
+
+def test_aget_user(verified_email):
+    """
+    Users should be retrievable by their ID.
+    """
+    backend = authentication.VerifiedEmailBackend()
+
+    user = async_to_sync(backend.aget_user)(verified_email.user.pk)
+
+    assert user == verified_email.user
+
+
+@pytest.mark.django_db
+def test_aget_user_invalid_id():
+    """
+    If there is no user with the provided ID, ``None`` should be
+    returned.
+    """
+    backend = authentication.VerifiedEmailBackend()
+
+    assert async_to_sync(backend.aget_user)(42) is None
+
+
+def test_aget_user_cached(django_assert_num_queries, settings, verified_email):
+    """
+    If user caching is enabled, retrieving the same user twice should
+    only query the database once.
+    """
+    settings.EMAIL_AUTH = {"USER_CACHE_TIMEOUT": 300}
+    backend = authentication.VerifiedEmailBackend()
+    user = verified_email.user
+
+    with django_assert_num_queries(1):
+        assert async_to_sync(backend.aget_user)(user.pk) == user
+        assert async_to_sync(backend.aget_user)(user.pk) == user
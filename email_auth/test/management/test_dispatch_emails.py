@@ -0,0 +1,101 @@
+import datetime
+import smtplib
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from email_auth import models
+
+
+@pytest.mark.django_db
+def test_dispatch_outbox(email, mailoutbox, settings):
+    """
+    Tokens queued in the outbox should be sent by the dispatcher and
+    then removed from the outbox.
+    """
+    settings.EMAIL_AUTH = {
+        "EMAIL_SENDER": "email_auth.senders.OutboxSender",
+        "EMAIL_VERIFICATION_URL": "/verify/{key}",
+    }
+    verification = email.send_verification_email()
+    out = StringIO()
+
+    assert len(mailoutbox) == 0
+
+    call_command("dispatch_emails", once=True, stdout=out)
+
+    assert len(mailoutbox) == 1
+    assert mailoutbox[0].to == [email.address]
+    assert verification.token in mailoutbox[0].body
+    assert not models.OutboundEmail.objects.exists()
+    assert "Sent 1 emails, 0 failed." in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_dispatch_outbox_in_batches(email, mailoutbox, settings):
+    """
+    Every queued email should be sent, even if there are more than fit
+    in a single batch.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_SENDER": "email_auth.senders.OutboxSender"}
+    for _ in range(5):
+        email.send_duplicate_notification()
+
+    call_command("dispatch_emails", batch_size=2, once=True, stdout=StringIO())
+
+    assert len(mailoutbox) == 5
+    assert not models.OutboundEmail.objects.exists()
+
+
+@pytest.mark.django_db
+@mock.patch("email_auth.mail.send_outbound_email", autospec=True)
+@pytest.mark.parametrize(
+    "attempts, expected_delay", [(0, 10), (1, 20), (2, 40), (3, 60)]
+)
+def test_dispatch_failure(
+    mock_send, attempts, email, expected_delay, settings
+):
+    """
+    Emails that fail to send should be kept and retried after a delay
+    that doubles with each attempt up to a maximum.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_SENDER": "email_auth.senders.OutboxSender"}
+    error = smtplib.SMTPException("Unavailable")
+    mock_send.side_effect = error
+    email.send_duplicate_notification()
+    models.OutboundEmail.objects.update(attempts=attempts)
+    out = StringIO()
+
+    before = timezone.now()
+    call_command(
+        "dispatch_emails", backoff=10, max_backoff=60, once=True, stdout=out
+    )
+
+    outbound = models.OutboundEmail.objects.get()
+    assert outbound.attempts == attempts + 1
+    assert outbound.last_error == repr(error)
+    assert outbound.lease_id is None
+    assert outbound.time_available >= before + datetime.timedelta(
+        seconds=expected_delay
+    )
+    assert "Sent 0 emails, 1 failed." in out.getvalue()
+
+
+@pytest.mark.django_db
+@mock.patch(
+    "email_auth.management.commands.dispatch_emails.time.sleep", autospec=True,
+)
+def test_dispatch_polls(mock_sleep, mailoutbox):
+    """
+    Without ``--once``, the dispatcher should wait for new emails when
+    the outbox is empty.
+    """
+    mock_sleep.side_effect = KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        call_command("dispatch_emails", poll_interval=2, stdout=StringIO())
+
+    assert mock_sleep.call_args == mock.call(2)
@@ -0,0 +1,58 @@
+import datetime
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from email_auth import models
+
+
+def create_verifications(email, count, age):
+    """
+    Create verifications that were created a given number of seconds
+    ago.
+    """
+    models.EmailVerification.objects.bulk_create(
+        [models.EmailVerification(email=email) for _ in range(count)]
+    )
+    models.EmailVerification.objects.filter(time_created__isnull=False).update(
+        time_created=timezone.now() - datetime.timedelta(seconds=age)
+    )
+
+
+@pytest.mark.django_db
+def test_prune_without_ttl(email):
+    """
+    If no time to live is configured, nothing should be deleted.
+    """
+    create_verifications(email, 3, 60 * 60 * 24 * 365)
+    out = StringIO()
+
+    call_command("prune_expired_tokens", stdout=out)
+
+    assert models.EmailVerification.objects.count() == 3
+    assert "Skipping email verifications" in out.getvalue()
+
+
+@pytest.mark.django_db
+@mock.patch(
+    "email_auth.management.commands.prune_expired_tokens.time.sleep",
+    autospec=True,
+)
+def test_prune_in_batches(mock_sleep, email, settings):
+    """
+    Expired tokens should be deleted in batches with a pause between
+    them while unexpired tokens are kept.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_VERIFICATION_TTL": 60}
+    create_verifications(email, 5, 120)
+    fresh = models.EmailVerification.objects.create(email=email)
+    out = StringIO()
+
+    call_command("prune_expired_tokens", batch_size=2, pause=0.5, stdout=out)
+
+    assert list(models.EmailVerification.objects.all()) == [fresh]
+    assert "Deleted 5 expired email verifications." in out.getvalue()
+    assert mock_sleep.call_args_list == [mock.call(0.5)] * 2
@@ -1,7 +1,11 @@
 from unittest import mock
 
+import pytest
+from asgiref.sync import async_to_sync
 from django.conf import settings
 from django.contrib import auth
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError
 from django.utils import timezone
 
 from email_auth import models
@@ -51,7 +55,7 @@ def test_repr():
     assert repr(email) == expected
 
 
-@mock.patch("email_auth.models.email_utils.send_email", autospec=True)
+@mock.patch("email_auth.models.mail.send_email", autospec=True)
 def test_send_already_verified(mock_send_email):
     """
     This method should send a notification to the email address letting
@@ -69,7 +73,25 @@ def test_send_already_verified(mock_send_email):
     }
 
 
-@mock.patch("email_auth.models.email_utils.send_email", autospec=True)
+def test_asend_already_verified(mailoutbox):
+    """
+    The notification that an email address is already verified should
+    also be sendable asynchronously.
+    """
+    user = auth.get_user_model()(username="Test User")
+    email = models.EmailAddress(address="test@example.com", user=user)
+
+    async_to_sync(email.asend_already_verified)()
+
+    assert len(mailoutbox) == 1
+    assert mailoutbox[0].subject == (
+        "Your Email Address has Already Been Verified"
+    )
+    assert mailoutbox[0].to == [email.address]
+    assert str(user) in mailoutbox[0].body
+
+
+@mock.patch("email_auth.models.mail.send_email", autospec=True)
 def test_send_duplicate_notification(mock_send_email):
     """
     This method should send a notification to the email address letting
@@ -98,10 +120,40 @@ def test_send_verification_email(*_):
     email = models.EmailAddress(address="test@example.com")
     verification = email.send_verification_email()
 
-    assert verification.save.call_count == 1
+    # The verification is saved by ``send_email`` with a single insert.
+    assert verification.email == email
+    assert verification.save.call_count == 0
     assert verification.send_email.call_count == 1
 
 
+@mock.patch("email_auth.models.models.Model.save", autospec=True)
+def test_save_normalizes_address(mock_save):
+    """
+    Saving an email address should populate the normalized address used
+    for lookups.
+    """
+    email = models.EmailAddress(address="Test@Example.com")
+    email.save()
+
+    assert email.normalized_address == "test@example.com"
+    assert mock_save.call_count == 1
+
+
+@mock.patch("email_auth.models.models.Model.save", autospec=True)
+def test_save_address_update_fields(mock_save):
+    """
+    If the address is explicitly listed in the fields to update, the
+    normalized address should be updated along with it.
+    """
+    email = models.EmailAddress(address="Test@Example.com")
+    email.save(update_fields=["address"])
+
+    assert set(mock_save.call_args[1]["update_fields"]) == {
+        "address",
+        "normalized_address",
+    }
+
+
 def test_str():
     """
     Converting an email address to a string should return the address
@@ -112,6 +164,7 @@ def test_str():
     assert str(email) == email.address
 
 
+@pytest.mark.django_db
 @mock.patch("email_auth.models.timezone.now", return_value=timezone.now())
 def test_verify(mock_now):
     email = models.EmailAddress()
@@ -121,4 +174,48 @@ def test_verify(mock_now):
 
     assert email.is_verified
     assert email.time_verified == mock_now.return_value
-    assert mock_save.call_count == 1
+    assert mock_save.call_args[1] == {
+        "update_fields": ["is_verified", "time_updated", "time_verified"]
+    }
+
+
+@pytest.mark.django_db
+def test_verified_addresses_unique_ignoring_case():
+    """
+    Only one verified email address may exist for each normalized
+    address.
+    """
+    user = auth.get_user_model().objects.create_user(username="Test User")
+    models.EmailAddress.objects.create(
+        address="test@example.com", is_verified=True, user=user
+    )
+    models.EmailAddress.objects.create(address="TEST@example.com", user=user)
+
+    with pytest.raises(IntegrityError):
+        models.EmailAddress.objects.create(
+            address="Test@Example.com", is_verified=True, user=user
+        )
+
+
+@pytest.mark.django_db
+def test_verify_address_verified_by_other_account():
+    """
+    Verifying an address that differs only in case from one that has
+    already been verified should fail without changing the address.
+    """
+    User = auth.get_user_model()
+    models.EmailAddress.objects.create(
+        address="test@example.com",
+        is_verified=True,
+        user=User.objects.create_user(username="verified"),
+    )
+    email = models.EmailAddress.objects.create(
+        address="TEST@example.com",
+        user=User.objects.create_user(username="unverified"),
+    )
+
+    with pytest.raises(ValidationError):
+        email.verify()
+
+    email.refresh_from_db()
+    assert not email.is_verified
@@ -0,0 +1,93 @@
+import pytest
+from django.contrib.auth import get_user_model
+
+from email_auth import models
+
+
+@pytest.fixture
+def user():
+    return get_user_model().objects.create_user(username="test-user")
+
+
+@pytest.mark.django_db
+def test_for_address(user):
+    """
+    Addresses should be matched regardless of case.
+    """
+    email = models.EmailAddress.objects.create(
+        address="Test@Example.com", user=user
+    )
+    models.EmailAddress.objects.create(address="other@example.com", user=user)
+
+    result = models.EmailAddress.objects.for_address("TEST@example.COM")
+
+    assert list(result) == [email]
+
+
+@pytest.mark.django_db
+def test_for_login(django_assert_num_queries, user):
+    """
+    Only verified addresses should be returned for logins, and their
+    owner should be fetched in the same query.
+    """
+    models.EmailAddress.objects.create(
+        address="unverified@example.com", user=user
+    )
+    models.EmailAddress.objects.create(
+        address="verified@example.com", is_verified=True, user=user
+    )
+    addresses = models.EmailAddress.objects
+
+    with django_assert_num_queries(1):
+        email = addresses.for_login("Verified@Example.com").get()
+        assert email.user == user
+
+    assert not addresses.for_login("unverified@example.com").exists()
+
+
+@pytest.mark.django_db
+def test_for_user(user):
+    """
+    A user's addresses should be returned in the order they were added.
+    """
+    other_user = get_user_model().objects.create_user(username="other")
+    first = models.EmailAddress.objects.create(
+        address="first@example.com", user=user
+    )
+    models.EmailAddress.objects.create(
+        address="other@example.com", user=other_user
+    )
+    second = models.EmailAddress.objects.create(
+        address="second@example.com", user=user
+    )
+
+    result = models.EmailAddress.objects.for_user(user)
+
+    assert list(result) == [first, second]
+
+
+@pytest.mark.django_db
+def test_verified(user):
+    """
+    Only verified addresses should be returned.
+    """
+    models.EmailAddress.objects.create(
+        address="unverified@example.com", user=user
+    )
+    verified = models.EmailAddress.objects.create(
+        address="verified@example.com", is_verified=True, user=user
+    )
+
+    assert list(models.EmailAddress.objects.verified()) == [verified]
+
+
+@pytest.mark.django_db
+def test_with_user(django_assert_num_queries, user):
+    """
+    The owner of each address should be fetched in the same query.
+    """
+    models.EmailAddress.objects.create(address="test@example.com", user=user)
+
+    with django_assert_num_queries(1):
+        email = models.EmailAddress.objects.with_user().get()
+        assert email.user == user
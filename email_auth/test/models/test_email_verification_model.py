@@ -1,7 +1,13 @@
+import datetime
+import threading
+import time
 from unittest import mock
 
+import pytest
 from django.conf import settings as django_settings
 from django.contrib.auth import get_user_model
+from django.db import OperationalError, connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from email_auth import models
@@ -32,14 +38,14 @@ def test_repr():
     )
     expected = test_utils.create_expected_repr(
         verification,
-        ["email", "time_created", "time_sent", "time_updated", "token"],
+        ["email", "selector", "time_created", "time_sent", "time_updated"],
     )
 
     assert repr(verification) == expected
 
 
 @mock.patch("email_auth.models.EmailVerification.save", autospec=True)
-@mock.patch("email_auth.models.email_utils.send_email", autospec=True)
+@mock.patch("email_auth.models.mail.send_email", autospec=True)
 @mock.patch("email_auth.models.timezone.now", autospec=True)
 def test_send_email(mock_now, mock_send_email, _):
     """
@@ -70,7 +76,7 @@ def test_send_email(mock_now, mock_send_email, _):
 
 
 @mock.patch("email_auth.models.EmailVerification.save", autospec=True)
-@mock.patch("email_auth.models.email_utils.send_email", autospec=True)
+@mock.patch("email_auth.models.mail.send_email", autospec=True)
 @mock.patch("email_auth.models.timezone.now", autospec=True)
 def test_send_email_with_verification_url(
     mock_now, mock_send_email, _, settings
@@ -119,6 +125,7 @@ def test_str():
     assert str(verification) == expected
 
 
+@pytest.mark.django_db
 def test_verify():
     """
     Verifying an instance should mark the associated email as verified
@@ -130,9 +137,206 @@ def test_verify():
     with mock.patch.object(
         email, "verify", autospec=True
     ) as mock_verify, mock.patch.object(
-        verification, "delete", autospec=True
-    ) as mock_delete:
+        verification, "consume", autospec=True
+    ) as mock_consume:
         verification.verify()
 
     assert mock_verify.call_count == 1
-    assert mock_delete.call_count == 1
+    assert mock_consume.call_count == 1
+
+
+def test_check_verifier():
+    """
+    Only the token a verification was created with should match its
+    verifier.
+    """
+    verification = models.EmailVerification()
+    _, verifier = models.split_token(verification.token)
+
+    assert verification.check_verifier(verifier)
+    assert not verification.check_verifier("wrong")
+
+
+@pytest.mark.django_db
+def test_get_by_token():
+    """
+    A verification should be retrievable using its full token but not
+    by its selector alone or with the wrong verifier.
+    """
+    user = get_user_model().objects.create_user(username="test-user")
+    email = models.EmailAddress.objects.create(
+        address="test@example.com", user=user
+    )
+    verification = models.EmailVerification.objects.create(email=email)
+    token = verification.token
+    selector, _ = models.split_token(token)
+    verifications = models.EmailVerification.objects
+
+    assert verifications.get_by_token(token) == verification
+    assert verifications.get_by_token(token).token == token
+
+    for invalid in (selector, selector + "wrong"):
+        with pytest.raises(models.EmailVerification.DoesNotExist):
+            verifications.get_by_token(invalid)
+
+
+@pytest.mark.django_db
+def test_get_by_token_expired(settings):
+    """
+    Verifications older than the ``EMAIL_VERIFICATION_TTL`` setting
+    should not be retrievable by their token.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_VERIFICATION_TTL": 60}
+    user = get_user_model().objects.create_user(username="test-user")
+    email = models.EmailAddress.objects.create(
+        address="test@example.com", user=user
+    )
+    verification = models.EmailVerification.objects.create(email=email)
+    verifications = models.EmailVerification.objects
+
+    assert verifications.get_by_token(verification.token) == verification
+    assert not verifications.expired().exists()
+
+    verifications.update(
+        time_created=timezone.now() - datetime.timedelta(seconds=61)
+    )
+
+    assert list(verifications.expired()) == [verification]
+
+    with pytest.raises(models.EmailVerification.DoesNotExist):
+        verifications.get_by_token(verification.token)
+
+
+@pytest.mark.django_db
+def test_issue_statements():
+    """
+    Issuing a verification should insert it with a single statement.
+    """
+    user = get_user_model().objects.create_user(username="test-user")
+    email = models.EmailAddress.objects.create(
+        address="test@example.com", user=user
+    )
+
+    with CaptureQueriesContext(connection) as ctx:
+        verification = email.send_verification_email()
+
+    assert test_utils.get_statements(ctx.captured_queries) == [
+        "INSERT email_auth_emailverification"
+    ]
+    assert models.EmailVerification.objects.get().time_sent == (
+        verification.time_sent
+    )
+
+
+@pytest.mark.django_db
+def test_redeem_statements():
+    """
+    Redeeming a verification should check that no other account has
+    verified the address, only write the changed columns of the email
+    address, and delete the verification in one transaction.
+    """
+    user = get_user_model().objects.create_user(username="test-user")
+    email = models.EmailAddress.objects.create(
+        address="test@example.com", user=user
+    )
+    verification = models.EmailVerification.objects.create(email=email)
+
+    with CaptureQueriesContext(connection) as ctx:
+        verification.verify()
+
+    assert test_utils.get_statements(ctx.captured_queries) == [
+        "DELETE email_auth_emailverification",
+        "SELECT email_auth_emailaddress",
+        "UPDATE email_auth_emailaddress",
+    ]
+    (update_sql,) = [
+        query["sql"]
+        for query in ctx.captured_queries
+        if query["sql"].startswith("UPDATE")
+    ]
+    assert '"is_verified"' in update_sql
+    assert '"time_verified"' in update_sql
+    assert '"address"' not in update_sql
+    assert ctx.captured_queries[0]["sql"].startswith("SAVEPOINT")
+    assert not models.EmailVerification.objects.exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("supports_returning", [True, False])
+def test_consume(supports_returning):
+    """
+    Consuming a token should delete and return the verification it
+    identifies exactly once, with or without ``DELETE ... RETURNING``.
+    """
+    user = get_user_model().objects.create_user(username="test-user")
+    email = models.EmailAddress.objects.create(
+        address="test@example.com", user=user
+    )
+    verification = models.EmailVerification.objects.create(email=email)
+    verifications = models.EmailVerification.objects
+
+    with mock.patch(
+        "email_auth.models._supports_delete_returning",
+        autospec=True,
+        return_value=supports_returning,
+    ):
+        with pytest.raises(models.EmailVerification.DoesNotExist):
+            verifications.consume(verification.selector + "wrong")
+
+        consumed = verifications.consume(verification.token)
+
+        with pytest.raises(models.EmailVerification.DoesNotExist):
+            verifications.consume(verification.token)
+
+    assert consumed.pk == verification.pk
+    assert consumed.email_id == email.pk
+    assert consumed.time_created == verification.time_created
+    assert consumed.token == verification.token
+    assert not verifications.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_consume_concurrent():
+    """
+    If many threads try to redeem the same token at once, exactly one of
+    them should succeed.
+    """
+    user = get_user_model().objects.create_user(username="test-user")
+    email = models.EmailAddress.objects.create(
+        address="test@example.com", user=user
+    )
+    token = models.EmailVerification.objects.create(email=email).token
+    verifications = models.EmailVerification.objects
+
+    thread_count = 8
+    barrier = threading.Barrier(thread_count)
+    results = []
+
+    def redeem():
+        barrier.wait()
+        try:
+            while True:
+                try:
+                    verifications.get_by_token(token).verify()
+                    results.append(True)
+                    break
+                except models.EmailVerification.DoesNotExist:
+                    results.append(False)
+                    break
+                except OperationalError:
+                    # The in-memory SQLite database used for tests
+                    # rejects concurrent writers instead of making them
+                    # wait, so retry like a client would.
+                    time.sleep(0.01)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=redeem) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == thread_count
+    assert results.count(True) == 1
+    assert not models.EmailVerification.objects.exists()
@@ -0,0 +1,51 @@
+from unittest import mock
+
+from email_auth import models
+
+
+def test_generate_email_address_id():
+    """
+    By default, email addresses should be given random UUIDs.
+    """
+    assert models.generate_email_address_id().version == 4
+
+
+def test_generate_email_address_id_time_ordered(settings):
+    """
+    If the ``TIME_ORDERED_IDS`` setting is enabled, email addresses
+    should be given time ordered UUIDs.
+    """
+    settings.EMAIL_AUTH = {"TIME_ORDERED_IDS": True}
+
+    assert models.generate_email_address_id().version == 7
+
+
+def test_generate_time_ordered_uuid():
+    """
+    The generated UUID should follow the version 7 layout with the
+    current time in milliseconds as its most significant bits.
+    """
+    with mock.patch(
+        "email_auth.models.time.time", return_value=1_600_000_000.1235,
+    ):
+        result = models.generate_time_ordered_uuid()
+
+    assert result.version == 7
+    assert result.variant == "specified in RFC 4122"
+    assert result.int >> 80 == 1_600_000_000_123
+
+
+def test_generate_time_ordered_uuid_ordering():
+    """
+    UUIDs generated at later times should sort after earlier ones.
+    """
+    ids = []
+    for timestamp_ms in range(1_600_000_000_000, 1_600_000_000_100):
+        with mock.patch(
+            "email_auth.models.time.time",
+            return_value=(timestamp_ms + 0.5) / 1000,
+        ):
+            ids.append(models.generate_time_ordered_uuid())
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
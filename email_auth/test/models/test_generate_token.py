@@ -4,16 +4,22 @@ from unittest import mock
 from email_auth import models
 
 
-@mock.patch("email_auth.models.crypto.get_random_string", autospec=True)
-def test_generate_token(mock_random_string):
+@mock.patch("email_auth.models.token_generation.generate_token", autospec=True)
+def test_generate_token(mock_generate_token):
     """
-    The generation function should use Django's cryptography utilities
-    to generate a random alphanumeric string.
+    The generation function should generate an alphanumeric token with
+    the configured length.
     """
-    char_set = set(string.ascii_letters + string.digits)
-
     result = models.generate_token()
 
-    assert result == mock_random_string.return_value
-    assert set(mock_random_string.call_args[1]["allowed_chars"]) == char_set
-    assert mock_random_string.call_args[1]["length"] == 64
+    assert result == mock_generate_token.return_value
+    assert mock_generate_token.call_args[0] == (64,)
+
+
+def test_generate_token_alphabet():
+    """
+    Generated tokens should be alphanumeric.
+    """
+    char_set = set(string.ascii_letters + string.digits)
+
+    assert set(models.generate_token()) <= char_set
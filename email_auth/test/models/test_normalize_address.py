@@ -0,0 +1,18 @@
+from email_auth import models
+
+
+def test_normalize_address():
+    """
+    Normalizing an address should produce a case-insensitive form of it.
+    """
+    assert models.normalize_address("Test@Example.com") == "test@example.com"
+
+
+def test_normalize_address_already_normalized():
+    """
+    Normalizing an address that is already normalized should not change
+    it.
+    """
+    address = "test@example.com"
+
+    assert models.normalize_address(address) == address
@@ -0,0 +1,124 @@
+import datetime
+
+import pytest
+from django.utils import timezone
+
+from email_auth import models
+
+
+def create_email(**kwargs):
+    return models.OutboundEmail.objects.create(
+        body="Body",
+        from_email="noreply@example.com",
+        recipients="test@example.com",
+        subject="Subject",
+        **kwargs,
+    )
+
+
+def test_recipient_list():
+    """
+    The recipients should be stored one per line.
+    """
+    email = models.OutboundEmail(recipients="a@example.com\nb@example.com")
+
+    assert email.recipient_list == ["a@example.com", "b@example.com"]
+
+
+def test_str():
+    """
+    Converting an email to a string should describe its subject and
+    recipients.
+    """
+    email = models.OutboundEmail(
+        recipients="a@example.com\nb@example.com", subject="Hello"
+    )
+
+    assert str(email) == "'Hello' to a@example.com, b@example.com"
+
+
+@pytest.mark.django_db
+def test_lease():
+    """
+    Leasing should return the available emails in the order they were
+    queued and hide them from other workers until the lease expires.
+    """
+    first = create_email()
+    second = create_email()
+    create_email(
+        time_available=timezone.now() + datetime.timedelta(seconds=60)
+    )
+
+    leased = models.OutboundEmail.objects.lease(10, 60, 5)
+
+    assert leased == [first, second]
+    assert models.OutboundEmail.objects.lease(10, 60, 5) == []
+    assert leased[0].lease_id == leased[1].lease_id
+    assert leased[0].time_available > timezone.now()
+
+
+@pytest.mark.django_db
+def test_lease_batch_size():
+    """
+    No more than the requested number of emails should be leased.
+    """
+    emails = [create_email() for _ in range(3)]
+
+    assert models.OutboundEmail.objects.lease(2, 60, 5) == emails[:2]
+    assert models.OutboundEmail.objects.lease(2, 60, 5) == emails[2:]
+
+
+@pytest.mark.django_db
+def test_lease_expired():
+    """
+    Emails whose lease has expired should be leased again.
+    """
+    email = create_email()
+    models.OutboundEmail.objects.lease(10, -1, 5)
+
+    assert models.OutboundEmail.objects.lease(10, 60, 5) == [email]
+
+
+@pytest.mark.django_db
+def test_lease_exhausted_attempts():
+    """
+    Emails that have used up their attempts should not be leased.
+    """
+    create_email(attempts=3)
+
+    assert models.OutboundEmail.objects.lease(10, 60, 3) == []
+    assert models.OutboundEmail.objects.failed(3).count() == 1
+
+
+@pytest.mark.django_db
+def test_mark_failed():
+    """
+    Marking an email as failed should record the error and release the
+    email to be retried after the provided delay.
+    """
+    create_email()
+    (email,) = models.OutboundEmail.objects.lease(10, 60, 5)
+
+    email.mark_failed("SMTPException()", 30)
+    email.refresh_from_db()
+
+    assert email.attempts == 1
+    assert email.last_error == "SMTPException()"
+    assert email.lease_id is None
+    assert (
+        timezone.now() + datetime.timedelta(seconds=25)
+        < email.time_available
+        <= timezone.now() + datetime.timedelta(seconds=30)
+    )
+
+
+@pytest.mark.django_db
+def test_mark_sent():
+    """
+    Sent emails should be removed from the outbox.
+    """
+    email = create_email()
+
+    email.mark_sent()
+
+    assert not models.OutboundEmail.objects.exists()
@@ -1,7 +1,11 @@
+import datetime
 from unittest import mock
 
+import pytest
 from django.conf import settings as django_settings
 from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from email_auth import models
@@ -34,14 +38,14 @@ def test_repr():
     )
     expected = test_utils.create_expected_repr(
         password_reset,
-        ["email", "time_created", "time_sent", "time_updated", "token"],
+        ["email", "selector", "time_created", "time_sent", "time_updated"],
     )
 
     assert repr(password_reset) == expected
 
 
 @mock.patch("email_auth.models.PasswordReset.save", autospec=True)
-@mock.patch("email_auth.models.email_utils.send_email", autospec=True)
+@mock.patch("email_auth.models.mail.send_email", autospec=True)
 @mock.patch("email_auth.models.timezone.now", autospec=True)
 def test_send_email(mock_now, mock_send_email, _):
     """
@@ -66,7 +70,7 @@ def test_send_email(mock_now, mock_send_email, _):
 
 
 @mock.patch("email_auth.models.PasswordReset.save", autospec=True)
-@mock.patch("email_auth.models.email_utils.send_email", autospec=True)
+@mock.patch("email_auth.models.mail.send_email", autospec=True)
 @mock.patch("email_auth.models.timezone.now", autospec=True)
 def test_send_email_with_reset_url(mock_now, mock_send_email, _, settings):
     """
@@ -106,3 +110,196 @@ def test_str():
     expected = f"Password reset for '{email}'"
 
     assert str(password_reset) == expected
+
+
+@pytest.mark.django_db
+@mock.patch("email_auth.models.PasswordReset.consume", autospec=True)
+@mock.patch("django.contrib.auth.models.User.save", autospec=True)
+def test_reset_password(_, __):
+    """
+    Resetting a password should save the user's new password and delete
+    the password reset.
+    """
+    user = get_user_model()()
+    password_reset = models.PasswordReset(email=models.EmailAddress(user=user))
+
+    password_reset.reset_password("new-password")
+
+    assert user.check_password("new-password")
+    assert user.save.call_args[1] == {"update_fields": ["password"]}
+    assert password_reset.consume.call_count == 1
+
+
+@pytest.mark.django_db
+def test_issue_statements():
+    """
+    Issuing a password reset should insert it with a single statement.
+    """
+    user = get_user_model().objects.create_user(username="test-user")
+    email = models.EmailAddress.objects.create(
+        address="test@example.com", is_verified=True, user=user
+    )
+
+    with CaptureQueriesContext(connection) as ctx:
+        models.PasswordReset(email=email).send_email()
+
+    assert test_utils.get_statements(ctx.captured_queries) == [
+        "INSERT email_auth_passwordreset"
+    ]
+
+
+@pytest.mark.django_db
+def test_redeem_statements():
+    """
+    Redeeming a password reset should only write the user's password and
+    delete the reset in one transaction.
+    """
+    user = get_user_model().objects.create_user(username="test-user")
+    email = models.EmailAddress.objects.create(
+        address="test@example.com", is_verified=True, user=user
+    )
+    password_reset = models.PasswordReset.objects.create(email=email)
+
+    with CaptureQueriesContext(connection) as ctx:
+        password_reset.reset_password("new-password")
+
+    assert test_utils.get_statements(ctx.captured_queries) == [
+        "DELETE email_auth_passwordreset",
+        f"UPDATE {get_user_model()._meta.db_table}",
+    ]
+    (update_sql,) = [
+        query["sql"]
+        for query in ctx.captured_queries
+        if query["sql"].startswith("UPDATE")
+    ]
+    assert '"password"' in update_sql
+    assert '"username"' not in update_sql
+    assert ctx.captured_queries[0]["sql"].startswith("SAVEPOINT")
+
+
+@pytest.mark.django_db
+def test_reset_password_invalidates_other_resets():
+    """
+    Redeeming a password reset should delete the user's other password
+    resets, including those for their other addresses, but not the
+    resets of other users.
+    """
+    user = get_user_model().objects.create_user(username="test-user")
+    other_user = get_user_model().objects.create_user(username="other-user")
+    email = models.EmailAddress.objects.create(
+        address="test@example.com", is_verified=True, user=user
+    )
+    second_email = models.EmailAddress.objects.create(
+        address="test2@example.com", is_verified=True, user=user
+    )
+    other_email = models.EmailAddress.objects.create(
+        address="other@example.com", is_verified=True, user=other_user
+    )
+    password_reset = models.PasswordReset.objects.create(email=email)
+    models.PasswordReset.objects.create(email=email)
+    models.PasswordReset.objects.create(email=second_email)
+    other_reset = models.PasswordReset.objects.create(email=other_email)
+
+    password_reset.reset_password("new-password")
+
+    assert list(models.PasswordReset.objects.all()) == [other_reset]
+
+
+@pytest.mark.django_db
+def test_reset_password_already_used():
+    """
+    If the password reset was already redeemed, the user's other
+    password resets should be kept.
+    """
+    user = get_user_model().objects.create_user(username="test-user")
+    email = models.EmailAddress.objects.create(
+        address="test@example.com", is_verified=True, user=user
+    )
+    password_reset = models.PasswordReset.objects.create(email=email)
+    other_reset = models.PasswordReset.objects.create(email=email)
+    models.PasswordReset.objects.filter(pk=password_reset.pk).delete()
+
+    with pytest.raises(models.PasswordReset.DoesNotExist):
+        password_reset.reset_password("new-password")
+
+    user.refresh_from_db()
+
+    assert list(models.PasswordReset.objects.all()) == [other_reset]
+    assert not user.check_password("new-password")
+
+
+@pytest.mark.django_db
+def test_consume_already_used_in_transaction():
+    """
+    If a caller handles the error from consuming a used password reset,
+    their transaction should still be usable.
+    """
+    user = get_user_model().objects.create_user(username="test-user")
+    email = models.EmailAddress.objects.create(
+        address="test@example.com", is_verified=True, user=user
+    )
+    password_reset = models.PasswordReset.objects.create(email=email)
+    models.PasswordReset.objects.filter(pk=password_reset.pk).delete()
+
+    with transaction.atomic():
+        with pytest.raises(models.PasswordReset.DoesNotExist):
+            password_reset.consume()
+
+        other_reset = models.PasswordReset.objects.create(email=email)
+
+    assert list(models.PasswordReset.objects.all()) == [other_reset]
+
+
+@pytest.mark.django_db
+def test_evict_oldest():
+    """
+    All but the newest password resets in the queryset should be
+    deleted in one statement.
+    """
+    user = get_user_model().objects.create_user(username="test-user")
+    email = models.EmailAddress.objects.create(
+        address="test@example.com", user=user
+    )
+    resets = [
+        models.PasswordReset.objects.create(email=email) for _ in range(4)
+    ]
+    models.PasswordReset.objects.filter(pk=resets[0].pk).update(
+        time_created=timezone.now() - datetime.timedelta(seconds=60)
+    )
+
+    with CaptureQueriesContext(connection) as ctx:
+        deleted = models.PasswordReset.objects.filter(
+            email=email
+        ).evict_oldest(2)
+
+    assert deleted == 2
+    assert test_utils.get_statements(ctx.captured_queries) == [
+        "SELECT email_auth_passwordreset",
+        "DELETE email_auth_passwordreset",
+    ]
+    assert set(models.PasswordReset.objects.all()) == set(resets[2:])
+
+
+@pytest.mark.django_db
+def test_sent_within(settings):
+    """
+    Only unexpired password resets sent within the provided number of
+    seconds should be returned.
+    """
+    settings.EMAIL_AUTH = {"PASSWORD_RESET_TTL": 600}
+    user = get_user_model().objects.create_user(username="test-user")
+    email = models.EmailAddress.objects.create(
+        address="test@example.com", user=user
+    )
+    now = timezone.now()
+    recent = models.PasswordReset.objects.create(email=email, time_sent=now)
+    models.PasswordReset.objects.create(
+        email=email, time_sent=now - datetime.timedelta(seconds=120)
+    )
+    models.PasswordReset.objects.create(email=email)
+    expired = models.PasswordReset.objects.create(email=email, time_sent=now)
+    models.PasswordReset.objects.filter(pk=expired.pk).update(
+        time_created=now - datetime.timedelta(seconds=601)
+    )
+
+    assert list(models.PasswordReset.objects.sent_within(60)) == [recent]
@@ -0,0 +1,34 @@
+from email_auth import models
+
+
+def test_split_token():
+    """
+    A token should be split into a fixed length selector and the
+    remaining verifier.
+    """
+    token = "a" * models.TOKEN_SELECTOR_LENGTH + "b" * 48
+
+    assert models.split_token(token) == (
+        "a" * models.TOKEN_SELECTOR_LENGTH,
+        "b" * 48,
+    )
+
+
+def test_split_token_short():
+    """
+    A token that is too short to contain a verifier should produce an
+    empty verifier.
+    """
+    assert models.split_token("abc") == ("abc", "")
+
+
+def test_hash_verifier():
+    """
+    Hashing a verifier should produce a digest of the stored length.
+    """
+    digest = models.hash_verifier("verifier")
+
+    assert isinstance(digest, bytes)
+    assert len(digest) == models.VERIFIER_HASH_LENGTH
+    assert digest == models.hash_verifier("verifier")
+    assert digest != models.hash_verifier("other")
@@ -34,6 +34,81 @@ def verify_setting_behavior(settings, setting_name, test_value, default=None):
     assert getattr(app_settings, setting_name) == test_value
 
 
+def test_address_cache_timeout(settings):
+    """
+    Test the behavior of the ``ADDRESS_CACHE_TIMEOUT`` setting.
+    """
+    verify_setting_behavior(settings, "ADDRESS_CACHE_TIMEOUT", 300)
+
+
+def test_async_views(settings):
+    """
+    Test the behavior of the ``ASYNC_VIEWS`` setting.
+    """
+    verify_setting_behavior(settings, "ASYNC_VIEWS", True, False)
+
+
+def test_cache_alias(settings):
+    """
+    Test the behavior of the ``CACHE_ALIAS`` setting.
+    """
+    verify_setting_behavior(settings, "CACHE_ALIAS", "other", "default")
+
+
+def test_email_coalescing_window(settings):
+    """
+    Test the behavior of the ``EMAIL_COALESCING_WINDOW`` setting.
+    """
+    verify_setting_behavior(settings, "EMAIL_COALESCING_WINDOW", 10)
+
+
+def test_email_connection_idle_timeout(settings):
+    """
+    Test the behavior of the ``EMAIL_CONNECTION_IDLE_TIMEOUT`` setting.
+    """
+    verify_setting_behavior(settings, "EMAIL_CONNECTION_IDLE_TIMEOUT", 5, 30)
+
+
+def test_email_connection_max_messages(settings):
+    """
+    Test the behavior of the ``EMAIL_CONNECTION_MAX_MESSAGES`` setting.
+    """
+    verify_setting_behavior(settings, "EMAIL_CONNECTION_MAX_MESSAGES", 10, 100)
+
+
+def test_email_rate_limit(settings):
+    """
+    Test the behavior of the ``EMAIL_RATE_LIMIT`` setting.
+    """
+    verify_setting_behavior(settings, "EMAIL_RATE_LIMIT", 10)
+
+
+def test_email_sender(settings):
+    """
+    Test the behavior of the ``EMAIL_SENDER`` setting.
+    """
+    verify_setting_behavior(
+        settings,
+        "EMAIL_SENDER",
+        "email_auth.senders.OutboxSender",
+        "email_auth.senders.InlineSender",
+    )
+
+
+def test_email_spool_batch_size(settings):
+    """
+    Test the behavior of the ``EMAIL_SPOOL_BATCH_SIZE`` setting.
+    """
+    verify_setting_behavior(settings, "EMAIL_SPOOL_BATCH_SIZE", 10, 100)
+
+
+def test_email_spool_path(settings):
+    """
+    Test the behavior of the ``EMAIL_SPOOL_PATH`` setting.
+    """
+    verify_setting_behavior(settings, "EMAIL_SPOOL_PATH", "/tmp/emails.jsonl")
+
+
 def test_email_verification_url(settings):
     """
     Test the behavior of the ``EMAIL_VERIFICATION_URL`` setting.
@@ -43,6 +118,20 @@ def test_email_verification_url(settings):
     )
 
 
+def test_email_verification_ttl(settings):
+    """
+    Test the behavior of the ``EMAIL_VERIFICATION_TTL`` setting.
+    """
+    verify_setting_behavior(settings, "EMAIL_VERIFICATION_TTL", 86400)
+
+
+def test_password_reset_ttl(settings):
+    """
+    Test the behavior of the ``PASSWORD_RESET_TTL`` setting.
+    """
+    verify_setting_behavior(settings, "PASSWORD_RESET_TTL", 3600)
+
+
 def test_password_reset_url(settings):
     """
     Test the behavior of the ``PASSWORD_RESET_URL`` setting.
@@ -50,3 +139,92 @@ def test_password_reset_url(settings):
     verify_setting_behavior(
         settings, "PASSWORD_RESET_URL", "example.com/{key}"
     )
+
+
+def test_login_throttle_address_limit(settings):
+    """
+    Test the behavior of the ``LOGIN_THROTTLE_ADDRESS_LIMIT`` setting.
+    """
+    verify_setting_behavior(settings, "LOGIN_THROTTLE_ADDRESS_LIMIT", 5)
+
+
+def test_login_throttle_ip_limit(settings):
+    """
+    Test the behavior of the ``LOGIN_THROTTLE_IP_LIMIT`` setting.
+    """
+    verify_setting_behavior(settings, "LOGIN_THROTTLE_IP_LIMIT", 100)
+
+
+def test_login_throttle_window(settings):
+    """
+    Test the behavior of the ``LOGIN_THROTTLE_WINDOW`` setting.
+    """
+    verify_setting_behavior(settings, "LOGIN_THROTTLE_WINDOW", 300, 60)
+
+
+def test_password_hashing_concurrency(settings):
+    """
+    Test the behavior of the ``PASSWORD_HASHING_CONCURRENCY`` setting.
+    """
+    verify_setting_behavior(settings, "PASSWORD_HASHING_CONCURRENCY", 4)
+
+
+def test_password_hashing_timeout(settings):
+    """
+    Test the behavior of the ``PASSWORD_HASHING_TIMEOUT`` setting.
+    """
+    verify_setting_behavior(settings, "PASSWORD_HASHING_TIMEOUT", 0.5)
+
+
+def test_signed_token_max_age(settings):
+    """
+    Test the behavior of the ``SIGNED_TOKEN_MAX_AGE`` setting.
+    """
+    verify_setting_behavior(settings, "SIGNED_TOKEN_MAX_AGE", 3600, 86400)
+
+
+def test_time_ordered_ids(settings):
+    """
+    Test the behavior of the ``TIME_ORDERED_IDS`` setting.
+    """
+    verify_setting_behavior(settings, "TIME_ORDERED_IDS", True, False)
+
+
+def test_token_address_limit(settings):
+    """
+    Test the behavior of the ``TOKEN_ADDRESS_LIMIT`` setting.
+    """
+    verify_setting_behavior(settings, "TOKEN_ADDRESS_LIMIT", 5)
+
+
+def test_token_backend(settings):
+    """
+    Test the behavior of the ``TOKEN_BACKEND`` setting.
+    """
+    verify_setting_behavior(
+        settings,
+        "TOKEN_BACKEND",
+        "email_auth.tokens.SignedTokenBackend",
+        "email_auth.tokens.ModelTokenBackend",
+    )
+
+
+def test_token_length(settings):
+    """
+    Test the behavior of the ``TOKEN_LENGTH`` setting.
+    """
+    verify_setting_behavior(settings, "TOKEN_LENGTH", 32, 64)
+
+
+def test_token_resend_interval(settings):
+    """
+    Test the behavior of the ``TOKEN_RESEND_INTERVAL`` setting.
+    """
+    verify_setting_behavior(settings, "TOKEN_RESEND_INTERVAL", 60)
+
+
+def test_user_cache_timeout(settings):
+    """
+    Test the behavior of the ``USER_CACHE_TIMEOUT`` setting.
+    """
+    verify_setting_behavior(settings, "USER_CACHE_TIMEOUT", 300)
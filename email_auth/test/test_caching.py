@@ -0,0 +1,199 @@
+import pytest
+from django.contrib.auth import get_user_model
+
+from email_auth import caching, models
+
+
+@pytest.fixture
+def user_cache(settings):
+    settings.EMAIL_AUTH = {"USER_CACHE_TIMEOUT": 300}
+
+
+def test_get_cached_user_disabled():
+    """
+    If user caching is disabled, no user should be returned from the
+    cache.
+    """
+    user = get_user_model()(pk=1)
+    caching.get_cache().set(caching.get_user_cache_key(user.pk), user)
+
+    assert caching.get_cached_user(user.pk) is None
+
+
+def test_cache_user_disabled():
+    """
+    If user caching is disabled, caching a user should do nothing.
+    """
+    user = get_user_model()(pk=1)
+    caching.cache_user(user)
+
+    assert caching.get_cache().get(caching.get_user_cache_key(user.pk)) is None
+
+
+def test_cache_user(user_cache):
+    """
+    If user caching is enabled, a cached user should be retrievable by
+    their ID.
+    """
+    user = get_user_model()(pk=1, username="test")
+    caching.cache_user(user)
+
+    cached = caching.get_cached_user(user.pk)
+
+    assert cached == user
+    assert cached.username == user.username
+
+
+def test_cache_user_custom_alias(settings):
+    """
+    Users should be cached in the cache specified by the ``CACHE_ALIAS``
+    setting.
+    """
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache"
+        },
+        "other": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "other",
+        },
+    }
+    settings.EMAIL_AUTH = {"CACHE_ALIAS": "other", "USER_CACHE_TIMEOUT": 300}
+    user = get_user_model()(pk=1)
+
+    caching.cache_user(user)
+
+    key = caching.get_user_cache_key(user.pk)
+    assert caching.get_cache().get(key) == user
+
+
+@pytest.mark.django_db
+def test_invalidate_on_save(user_cache):
+    """
+    Saving a user should remove them from the cache.
+    """
+    user = get_user_model().objects.create_user(username="test")
+    caching.cache_user(user)
+
+    user.set_password("new-password")
+    user.save()
+
+    assert caching.get_cached_user(user.pk) is None
+
+
+@pytest.mark.django_db
+def test_invalidate_on_delete(user_cache):
+    """
+    Deleting a user should remove them from the cache.
+    """
+    user = get_user_model().objects.create_user(username="test")
+    pk = user.pk
+    caching.cache_user(user)
+
+    user.delete()
+
+    assert caching.get_cached_user(pk) is None
+
+
+@pytest.fixture
+def address_cache(settings):
+    settings.EMAIL_AUTH = {"ADDRESS_CACHE_TIMEOUT": 300}
+
+
+def test_increment():
+    """
+    Incrementing a counter should create it if it does not exist and
+    return its new value.
+    """
+    assert caching.increment("email_auth:test:counter", timeout=60) == 1
+    assert caching.increment("email_auth:test:counter", timeout=60) == 2
+    assert caching.get_cache().get("email_auth:test:counter") == 2
+
+
+def test_make_key():
+    """
+    Cache keys should not contain the raw value so that any user input
+    results in a valid cache key.
+    """
+    key = caching.make_key("email_auth:test", "some input\n")
+
+    assert key.startswith("email_auth:test:")
+    assert "some input" not in key
+    assert key == caching.make_key("email_auth:test", "some input\n")
+
+
+def test_get_address_cache_key():
+    """
+    Address cache keys should not contain the raw address so that any
+    user input results in a valid cache key.
+    """
+    key = caching.get_address_cache_key("some input\n")
+
+    assert key.startswith("email_auth:address:")
+    assert "some input" not in key
+
+
+def test_cache_user_id_disabled():
+    """
+    If address caching is disabled, caching a user ID should do nothing.
+    """
+    caching.cache_user_id("test@example.com", 1)
+
+    assert caching.get_cached_user_id("test@example.com") is None
+
+
+def test_cache_user_id(address_cache):
+    """
+    If address caching is enabled, the cached user ID should be
+    retrievable using the normalized address.
+    """
+    caching.cache_user_id("test@example.com", 1)
+
+    assert caching.get_cached_user_id("test@example.com") == 1
+
+
+def test_invalidate_user_id_on_save(address_cache, verified_email):
+    """
+    Saving an email address should remove its owner from the cache.
+    """
+    caching.cache_user_id(
+        verified_email.normalized_address, verified_email.user_id
+    )
+
+    verified_email.is_verified = False
+    verified_email.save()
+
+    assert (
+        caching.get_cached_user_id(verified_email.normalized_address) is None
+    )
+
+
+def test_invalidate_user_id_on_address_change(address_cache, verified_email):
+    """
+    Changing an email address should remove the owner of the original
+    address from the cache.
+    """
+    email = models.EmailAddress.objects.get(pk=verified_email.pk)
+    caching.cache_user_id(email.normalized_address, email.user_id)
+    caching.cache_user_id("new@example.com", email.user_id)
+
+    email.address = "New@Example.com"
+    email.save()
+
+    assert caching.get_cached_user_id("test@example.com") is None
+    assert caching.get_cached_user_id("new@example.com") is None
+
+
+def test_invalidate_user_id_on_delete(address_cache, verified_email):
+    """
+    Deleting an email address should remove its owner from the cache.
+    """
+    caching.cache_user_id(
+        verified_email.normalized_address, verified_email.user_id
+    )
+
+    verified_email.user.delete()
+
+    assert (
+        caching.get_cached_user_id(verified_email.normalized_address) is None
+    )
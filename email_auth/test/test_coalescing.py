@@ -0,0 +1,99 @@
+import pytest
+from asgiref.sync import async_to_sync
+
+from email_auth import coalescing
+
+
+def test_coalesce_disabled():
+    """
+    If coalescing is disabled, every request should send its email.
+    """
+    for _ in range(2):
+        with coalescing.coalesce("verification", "test@example.com") as send:
+            assert send
+
+
+def test_coalesce(settings):
+    """
+    Only the first request for a type of email to an address within the
+    window should send it.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_COALESCING_WINDOW": 10}
+
+    with coalescing.coalesce("verification", "test@example.com") as send:
+        assert send
+
+    with coalescing.coalesce("verification", "TEST@example.com") as send:
+        assert not send
+
+    with coalescing.coalesce("password_reset", "test@example.com") as send:
+        assert send
+
+    with coalescing.coalesce("verification", "other@example.com") as send:
+        assert send
+
+
+def test_coalesce_error(settings):
+    """
+    If sending the email fails, the next request should try again.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_COALESCING_WINDOW": 10}
+
+    with pytest.raises(RuntimeError):
+        with coalescing.coalesce("verification", "test@example.com"):
+            raise RuntimeError
+
+    with coalescing.coalesce("verification", "test@example.com") as send:
+        assert send
+
+
+def test_coalesce_async(settings):
+    """
+    The context manager should also be usable from async code and
+    release its claim if the block raises an exception.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_COALESCING_WINDOW": 10}
+
+    async def request(error=False):
+        async with coalescing.coalesce(
+            "verification", "test@example.com"
+        ) as send:
+            if error:
+                raise RuntimeError
+
+            return send
+
+    with pytest.raises(RuntimeError):
+        async_to_sync(request)(error=True)
+
+    assert async_to_sync(request)()
+    assert not async_to_sync(request)()
+
+
+def test_coalesce_error_not_claimed(settings):
+    """
+    If a request that did not claim the send fails, the claim of the
+    request sending the email should be kept.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_COALESCING_WINDOW": 10}
+    coalescing.claim("verification", "test@example.com")
+
+    with pytest.raises(RuntimeError):
+        with coalescing.coalesce("verification", "test@example.com"):
+            raise RuntimeError
+
+    assert not coalescing.claim("verification", "test@example.com")
+
+
+def test_release(settings):
+    """
+    Releasing a claim should allow the next request to send the email.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_COALESCING_WINDOW": 10}
+
+    assert coalescing.claim("verification", "test@example.com")
+    assert not coalescing.claim("verification", "test@example.com")
+
+    coalescing.release("verification", "test@example.com")
+
+    assert coalescing.claim("verification", "test@example.com")
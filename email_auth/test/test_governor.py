@@ -0,0 +1,177 @@
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.mail import EmailMultiAlternatives
+from django.core.management import call_command
+
+from email_auth import governor, mail, models, senders, signals
+
+
+SEND_KWARGS = {
+    "context": {"email": "test@example.com"},
+    "from_email": "noreply@example.com",
+    "recipient_list": ["test@example.com"],
+    "subject": "Unregistered Email Address",
+    "template_name": "email_auth/emails/unregistered-email",
+}
+
+
+def test_acquire_disabled():
+    """
+    Without a rate limit, tokens should always be available.
+    """
+    assert all(governor.acquire() for _ in range(100))
+    assert governor.get_available_tokens() is None
+
+
+@mock.patch("email_auth.governor.time.time", autospec=True)
+def test_acquire(mock_time, settings):
+    """
+    The bucket should hold the configured number of tokens and be
+    refilled at the same number of tokens per second.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_RATE_LIMIT": 2}
+    mock_time.return_value = 1000.2
+
+    assert governor.get_available_tokens() == 2
+    assert [governor.acquire() for _ in range(3)] == [True, True, False]
+    assert governor.get_available_tokens() == 0
+
+    mock_time.return_value = 1000.7
+
+    assert governor.get_available_tokens() == 1
+    assert [governor.acquire() for _ in range(2)] == [True, False]
+
+    mock_time.return_value = 1010.0
+
+    assert governor.get_available_tokens() == 2
+
+
+@mock.patch("email_auth.governor.time.time", autospec=True)
+def test_acquire_across_second(mock_time, settings):
+    """
+    Tokens taken just before a second boundary should not be available
+    again just after it.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_RATE_LIMIT": 2}
+    mock_time.return_value = 1000.9
+    governor.acquire()
+    governor.acquire()
+
+    mock_time.return_value = 1001.1
+
+    assert governor.get_available_tokens() == 0
+    assert not governor.acquire()
+
+
+@mock.patch("email_auth.governor.time.sleep", autospec=True)
+@mock.patch("email_auth.governor.time.time", autospec=True)
+def test_wait(mock_time, mock_sleep, settings):
+    """
+    Waiting for a token should sleep until the next token is added to
+    the bucket.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_RATE_LIMIT": 2}
+    mock_time.return_value = 1000.0
+    governor.acquire()
+    governor.acquire()
+    mock_time.return_value = 1000.1
+
+    def advance(seconds):
+        mock_time.return_value += seconds
+
+    mock_sleep.side_effect = advance
+
+    governor.wait()
+
+    assert mock_sleep.call_args_list == [mock.call(pytest.approx(0.4))]
+    assert governor.get_available_tokens() == 0
+
+
+@pytest.mark.django_db
+def test_defer():
+    """
+    Deferring a message should save it to the outbox, count it, and
+    send a signal.
+    """
+    message = EmailMultiAlternatives(
+        body="Body", subject="Subject", to=["test@example.com"]
+    )
+    receiver = mock.Mock()
+    signals.email_deferred.connect(receiver)
+
+    try:
+        governor.defer(message)
+        governor.defer(message)
+    finally:
+        signals.email_deferred.disconnect(receiver)
+
+    assert models.OutboundEmail.objects.count() == 2
+    assert governor.get_deferred_count() == 2
+    assert receiver.call_args[1]["message"] is message
+
+
+@pytest.mark.django_db
+def test_send_email_rate_limited(mailoutbox, settings):
+    """
+    Emails sent once the rate limit is reached should be saved to the
+    outbox and sent by the dispatcher.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_RATE_LIMIT": 1}
+
+    with mock.patch("email_auth.governor.time.time", return_value=1000.0):
+        mail.send_email(**SEND_KWARGS)
+        mail.send_email(**SEND_KWARGS)
+
+    assert len(mailoutbox) == 1
+    assert models.OutboundEmail.objects.count() == 1
+
+    call_command("dispatch_emails", once=True, stdout=StringIO())
+
+    assert len(mailoutbox) == 2
+    assert not models.OutboundEmail.objects.exists()
+
+
+@pytest.mark.django_db
+def test_send_email_outbox_not_governed(settings):
+    """
+    Emails queued by the outbox sender should not take tokens since the
+    dispatcher takes them when it sends the emails.
+    """
+    settings.EMAIL_AUTH = {
+        "EMAIL_RATE_LIMIT": 1,
+        "EMAIL_SENDER": "email_auth.senders.OutboxSender",
+    }
+
+    mail.send_email(**SEND_KWARGS)
+
+    assert governor.get_available_tokens() == 1
+    assert governor.get_deferred_count() == 0
+
+
+@pytest.mark.django_db
+def test_send_email_load_test_senders_not_governed(settings, tmp_path):
+    """
+    Emails collected by the load testing senders should not take tokens
+    or be deferred since they never reach a mail server.
+    """
+    settings.EMAIL_AUTH = {
+        "EMAIL_RATE_LIMIT": 0,
+        "EMAIL_SENDER": "email_auth.senders.LocmemSender",
+        "EMAIL_SPOOL_PATH": str(tmp_path / "emails.jsonl"),
+    }
+    senders.LocmemSender.messages.clear()
+
+    mail.send_email(**SEND_KWARGS)
+
+    settings.EMAIL_AUTH = {
+        **settings.EMAIL_AUTH,
+        "EMAIL_SENDER": "email_auth.senders.SpoolSender",
+    }
+
+    mail.send_email(**SEND_KWARGS)
+
+    assert len(senders.LocmemSender.messages) == 1
+    assert governor.get_deferred_count() == 0
+    assert not models.OutboundEmail.objects.exists()
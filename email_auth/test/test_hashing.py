@@ -0,0 +1,149 @@
+import threading
+import time
+from unittest import mock
+
+import pytest
+from django.contrib.auth import hashers
+
+from email_auth import hashing, signals
+
+
+def test_get_dummy_password_hash():
+    """
+    The dummy hash should be generated with the default password hasher.
+    """
+    encoded = hashing.get_dummy_password_hash()
+
+    assert hashers.identify_hasher(encoded) == hashers.get_hasher()
+
+
+def test_get_dummy_password_hash_cached():
+    """
+    The dummy hash should only be computed once for each hasher.
+    """
+    expected = hashing.get_dummy_password_hash()
+
+    with mock.patch(
+        "email_auth.hashing.hashers.make_password", autospec=True
+    ) as mock_make_password:
+        encoded = hashing.get_dummy_password_hash()
+
+    assert encoded == expected
+    assert mock_make_password.call_count == 0
+
+
+def test_get_dummy_password_hash_hasher_changed(settings):
+    """
+    If the default password hasher changes, a new dummy hash should be
+    generated with the new hasher.
+    """
+    settings.PASSWORD_HASHERS = [
+        "django.contrib.auth.hashers.MD5PasswordHasher"
+    ]
+
+    encoded = hashing.get_dummy_password_hash()
+
+    assert hashers.identify_hasher(encoded).algorithm == "md5"
+
+
+@mock.patch("email_auth.hashing.hashers.check_password", autospec=True)
+def test_check_dummy_password(mock_check_password):
+    """
+    Checking a password against the dummy hash should verify it exactly
+    once and always fail.
+    """
+    mock_check_password.return_value = True
+
+    assert not hashing.check_dummy_password("password")
+    assert mock_check_password.call_args[0][:2] == (
+        "password",
+        hashing.get_dummy_password_hash(),
+    )
+    assert mock_check_password.call_count == 1
+
+
+def test_hashing_slot_reports_timings():
+    """
+    Leaving a hashing slot should report the time spent waiting for the
+    slot and the time spent inside it.
+    """
+    receiver = mock.Mock()
+    signals.password_hashed.connect(receiver)
+
+    try:
+        with hashing.hashing_slot():
+            time.sleep(0.01)
+    finally:
+        signals.password_hashed.disconnect(receiver)
+
+    assert receiver.call_count == 1
+    assert receiver.call_args[1]["hash_time"] >= 0.01
+    assert receiver.call_args[1]["wait_time"] >= 0
+
+
+def test_hashing_slot_timeout(settings):
+    """
+    If all hashing slots are taken for longer than the configured
+    timeout, an exception should be raised.
+    """
+    settings.EMAIL_AUTH = {
+        "PASSWORD_HASHING_CONCURRENCY": 1,
+        "PASSWORD_HASHING_TIMEOUT": 0.01,
+    }
+    receiver = mock.Mock()
+    signals.password_hashing_timed_out.connect(receiver)
+
+    try:
+        with hashing.hashing_slot():
+            with pytest.raises(hashing.HashingTimeout):
+                with hashing.hashing_slot():
+                    pass
+    finally:
+        signals.password_hashing_timed_out.disconnect(receiver)
+
+    assert receiver.call_count == 1
+    assert receiver.call_args[1]["wait_time"] >= 0.01
+
+
+def test_hashing_slot_limits_concurrency(settings):
+    """
+    No more than the configured number of threads should hold a hashing
+    slot at the same time.
+    """
+    settings.EMAIL_AUTH = {"PASSWORD_HASHING_CONCURRENCY": 2}
+    lock = threading.Lock()
+    active = []
+    max_active = []
+
+    def hash_password():
+        with hashing.hashing_slot():
+            with lock:
+                active.append(1)
+                max_active.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.pop()
+
+    threads = [threading.Thread(target=hash_password) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max(max_active) == 2
+
+
+def test_hashing_slot_released(settings):
+    """
+    A slot should become available again after it is released.
+    """
+    settings.EMAIL_AUTH = {
+        "PASSWORD_HASHING_CONCURRENCY": 1,
+        "PASSWORD_HASHING_TIMEOUT": 0.01,
+    }
+
+    with hashing.hashing_slot():
+        pass
+
+    with hashing.hashing_slot():
+        pass
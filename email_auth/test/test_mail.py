@@ -0,0 +1,285 @@
+from unittest import mock
+
+import email_utils
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.mail import EmailMessage
+from django.db import IntegrityError
+
+from email_auth import mail, models, senders
+
+
+SEND_KWARGS = {
+    "context": {"email": "test@example.com"},
+    "from_email": "noreply@example.com",
+    "recipient_list": ["test@example.com"],
+    "subject": "Unregistered Email Address",
+    "template_name": "email_auth/emails/unregistered-email",
+}
+
+
+async def asend_email():
+    """
+    Send the test email asynchronously.
+
+    The arguments are passed from inside a coroutine because newer
+    versions of ``async_to_sync`` reserve the ``context`` keyword.
+    """
+    await mail.asend_email(**SEND_KWARGS)
+
+
+def test_send_email(mailoutbox):
+    """
+    By default, emails should be rendered and sent immediately.
+    """
+    mail.send_email(**SEND_KWARGS)
+
+    text, _ = mail.render_email(
+        SEND_KWARGS["template_name"], SEND_KWARGS["context"]
+    )
+    assert len(mailoutbox) == 1
+    message = mailoutbox[0]
+    assert message.alternatives == []
+    assert message.body == text
+    assert message.from_email == SEND_KWARGS["from_email"]
+    assert message.subject == SEND_KWARGS["subject"]
+    assert message.to == SEND_KWARGS["recipient_list"]
+
+
+@mock.patch("email_auth.mail.render_email", autospec=True)
+def test_send_email_html(mock_render_email, settings):
+    """
+    The rendered HTML body should be attached as an alternative.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_SENDER": "email_auth.senders.LocmemSender"}
+    mock_render_email.return_value = ("Text", "<p>HTML</p>")
+    senders.LocmemSender.messages.clear()
+
+    mail.send_email(**SEND_KWARGS)
+
+    (message,) = senders.LocmemSender.messages
+    assert message.alternatives == [("<p>HTML</p>", "text/html")]
+    assert message.body == "Text"
+
+
+def test_asend_email(mailoutbox):
+    """
+    Emails should be rendered and sent asynchronously.
+    """
+    async_to_sync(asend_email)()
+
+    text, _ = mail.render_email(
+        SEND_KWARGS["template_name"], SEND_KWARGS["context"]
+    )
+    assert len(mailoutbox) == 1
+    assert mailoutbox[0].body == text
+    assert mailoutbox[0].to == SEND_KWARGS["recipient_list"]
+
+
+@pytest.mark.django_db
+def test_asend_email_rate_limited(mailoutbox, settings):
+    """
+    Emails sent asynchronously once the rate limit is reached should be
+    saved to the outbox.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_RATE_LIMIT": 0}
+
+    async_to_sync(asend_email)()
+
+    assert len(mailoutbox) == 0
+    assert models.OutboundEmail.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_atomic_outbox(settings):
+    """
+    If the outbox is used, queued emails should be discarded along with
+    the rest of a failed transaction.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_SENDER": "email_auth.senders.OutboxSender"}
+
+    with pytest.raises(IntegrityError):
+        with mail.atomic():
+            mail.send_email(**SEND_KWARGS)
+            raise IntegrityError
+
+    assert not models.OutboundEmail.objects.exists()
+
+
+def test_render_email():
+    """
+    The plain text template should be rendered and the missing HTML
+    template should result in an empty body.
+    """
+    text, html = mail.render_email(
+        "email_auth/emails/unregistered-email", {"email": "test@example.com"}
+    )
+
+    assert "test@example.com" in text
+    assert html == ""
+
+
+def test_render_email_missing_templates():
+    """
+    Rendering an email without templates should raise the same
+    exception as ``email_utils``.
+    """
+    with pytest.raises(email_utils.NoTemplatesException):
+        mail.render_email("does/not/exist", {})
+
+
+@mock.patch("email_auth.mail.get_template", autospec=True)
+def test_render_email_cached(mock_get_template):
+    """
+    The templates of an email should only be loaded once.
+    """
+    mail.render_email("email_auth/emails/test-cached", {})
+    mail.render_email("email_auth/emails/test-cached", {})
+
+    assert mock_get_template.call_args_list == [
+        mock.call("email_auth/emails/test-cached.txt"),
+        mock.call("email_auth/emails/test-cached.html"),
+    ]
+
+
+@mock.patch("email_auth.mail.get_template", autospec=True)
+def test_render_email_debug(mock_get_template, settings):
+    """
+    If ``DEBUG`` is enabled, templates should be loaded for every email
+    so that changes to them take effect.
+    """
+    settings.DEBUG = True
+
+    mail.render_email("email_auth/emails/test-debug", {})
+    mail.render_email("email_auth/emails/test-debug", {})
+
+    assert mock_get_template.call_count == 4
+
+
+def test_render_email_templates_changed(settings, tmp_path):
+    """
+    Changing the template settings should discard cached templates.
+    """
+    template_name = "email_auth/emails/unregistered-email"
+    context = {"email": "test@example.com"}
+    mail.render_email(template_name, context)
+
+    (tmp_path / "email_auth" / "emails").mkdir(parents=True)
+    (tmp_path / f"{template_name}.txt").write_text("Override")
+    settings.TEMPLATES = [
+        {**settings.TEMPLATES[0], "DIRS": [str(tmp_path)]},
+    ]
+
+    assert mail.render_email(template_name, context) == ("Override", "")
+
+
+def test_send_outbound_email(mailoutbox):
+    """
+    Sending an email from the outbox should send its stored content.
+    """
+    email = models.OutboundEmail(
+        body="Body",
+        from_email="noreply@example.com",
+        html_body="<p>Body</p>",
+        recipients="a@example.com\nb@example.com",
+        subject="Subject",
+    )
+
+    mail.send_outbound_email(email)
+
+    assert len(mailoutbox) == 1
+    message = mailoutbox[0]
+    assert message.alternatives == [("<p>Body</p>", "text/html")]
+    assert message.body == "Body"
+    assert message.from_email == "noreply@example.com"
+    assert message.subject == "Subject"
+    assert message.to == ["a@example.com", "b@example.com"]
+
+
+@mock.patch("email_auth.mail.mail.get_connection", autospec=True)
+def test_persistent_connection_reuse(mock_get_connection):
+    """
+    Messages sent through a persistent connection should share a single
+    underlying connection until the connection is closed.
+    """
+    backend = mock_get_connection.return_value
+
+    with mail.PersistentConnection(max_messages=None) as connection:
+        for _ in range(3):
+            connection.send_messages([mock.Mock()])
+
+    assert mock_get_connection.call_count == 1
+    assert backend.open.call_count == 1
+    assert backend.send_messages.call_count == 3
+    assert backend.close.call_count == 1
+
+
+@mock.patch("email_auth.mail.mail.get_connection", autospec=True)
+def test_persistent_connection_max_messages(mock_get_connection):
+    """
+    The underlying connection should be reopened once it has sent the
+    maximum number of messages.
+    """
+    connection = mail.PersistentConnection(max_messages=2)
+
+    for _ in range(5):
+        connection.send_messages([mock.Mock()])
+
+    assert mock_get_connection.call_count == 3
+    assert mock_get_connection.return_value.close.call_count == 2
+
+
+@mock.patch("email_auth.mail.time.monotonic", autospec=True)
+@mock.patch("email_auth.mail.mail.get_connection", autospec=True)
+def test_persistent_connection_idle_timeout(mock_get_connection, mock_time):
+    """
+    A connection that has been idle for longer than its timeout should
+    be reopened before it is used again.
+    """
+    mock_time.return_value = 0
+    connection = mail.PersistentConnection(idle_timeout=10)
+    connection.send_messages([mock.Mock()])
+
+    mock_time.return_value = 10
+    connection.send_messages([mock.Mock()])
+
+    assert mock_get_connection.call_count == 1
+
+    mock_time.return_value = 21
+    connection.close_if_idle()
+
+    assert mock_get_connection.return_value.close.call_count == 1
+
+    connection.send_messages([mock.Mock()])
+
+    assert mock_get_connection.call_count == 2
+
+
+@mock.patch("email_auth.mail.mail.get_connection", autospec=True)
+def test_persistent_connection_error(mock_get_connection):
+    """
+    If sending fails, the underlying connection should be closed so that
+    the next message uses a new connection.
+    """
+    backend = mock_get_connection.return_value
+    backend.send_messages.side_effect = [OSError, 1]
+    connection = mail.PersistentConnection()
+
+    with pytest.raises(OSError):
+        connection.send_messages([mock.Mock()])
+
+    connection.send_messages([mock.Mock()])
+
+    assert backend.close.call_count == 1
+    assert mock_get_connection.call_count == 2
+
+
+def test_persistent_connection_message(mailoutbox):
+    """
+    A persistent connection should be usable as the connection of an
+    email message.
+    """
+    with mail.PersistentConnection() as connection:
+        EmailMessage(connection=connection, to=["test@example.com"]).send()
+
+    assert len(mailoutbox) == 1
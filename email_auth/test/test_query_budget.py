@@ -0,0 +1,176 @@
+"""
+Query budgets for the authentication backend, emails, and admin pages.
+
+Each test pins the maximum number of queries a code path may issue.
+Exceeding a budget usually means a related object is being loaded
+lazily, so fix the query rather than raising the budget.
+"""
+
+import pytest
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+
+from email_auth import authentication, models, tokens
+
+
+# The number of rows created for admin changelist tests. This is large
+# enough that loading a related object per row is obvious.
+ROW_COUNT = 25
+
+
+@pytest.fixture
+def many_rows():
+    for i in range(ROW_COUNT):
+        user = get_user_model().objects.create_user(username=f"user-{i}")
+        email = models.EmailAddress.objects.create(
+            address=f"user-{i}@example.com", user=user
+        )
+        models.EmailVerification.objects.create(email=email)
+        models.PasswordReset.objects.create(email=email)
+
+
+@pytest.mark.django_db
+def test_authenticate(django_assert_max_num_queries, verified_email):
+    """
+    Authenticating should fetch the address and its owner together.
+    """
+    backend = authentication.VerifiedEmailBackend()
+
+    with django_assert_max_num_queries(1):
+        user = backend.authenticate(None, verified_email.address, "password")
+
+    assert user == verified_email.user
+
+
+@pytest.mark.django_db
+def test_authenticate_unknown_address(django_assert_max_num_queries):
+    """
+    Failing to authenticate with an unknown address should only take the
+    address lookup.
+    """
+    backend = authentication.VerifiedEmailBackend()
+
+    with django_assert_max_num_queries(1):
+        assert backend.authenticate(None, "foo@example.com", "bar") is None
+
+
+@pytest.mark.django_db
+def test_authenticate_cached(
+    django_assert_max_num_queries, settings, verified_email
+):
+    """
+    With address caching enabled, repeat logins should only fetch the
+    user.
+    """
+    settings.EMAIL_AUTH = {"ADDRESS_CACHE_TIMEOUT": 60}
+    backend = authentication.VerifiedEmailBackend()
+    backend.authenticate(None, verified_email.address, "password")
+
+    with django_assert_max_num_queries(1):
+        backend.authenticate(None, verified_email.address, "password")
+
+
+@pytest.mark.django_db
+def test_get_user(django_assert_max_num_queries, verified_email):
+    """
+    Getting a user should take a single query.
+    """
+    backend = authentication.VerifiedEmailBackend()
+
+    with django_assert_max_num_queries(1):
+        assert backend.get_user(verified_email.user.pk) == verified_email.user
+
+
+@pytest.mark.django_db
+def test_get_user_cached(
+    django_assert_max_num_queries, settings, verified_email
+):
+    """
+    With user caching enabled, repeat lookups should not query the
+    database.
+    """
+    settings.EMAIL_AUTH = {"USER_CACHE_TIMEOUT": 60}
+    backend = authentication.VerifiedEmailBackend()
+    backend.get_user(verified_email.user.pk)
+
+    with django_assert_max_num_queries(0):
+        backend.get_user(verified_email.user.pk)
+
+
+@pytest.mark.django_db
+def test_send_notifications(
+    django_assert_max_num_queries, mailoutbox, verified_email
+):
+    """
+    Rendering notifications for an address loaded with its owner should
+    not query the database.
+    """
+    email = models.EmailAddress.objects.with_user().get()
+
+    with django_assert_max_num_queries(0):
+        email.send_already_verified()
+        email.send_duplicate_notification()
+
+    assert len(mailoutbox) == 2
+
+
+@pytest.mark.django_db
+def test_send_tokens(
+    django_assert_max_num_queries, mailoutbox, verified_email
+):
+    """
+    Sending a token for an address loaded with its owner should only
+    insert the token.
+    """
+    email = models.EmailAddress.objects.with_user().get()
+    backend = tokens.ModelTokenBackend()
+
+    with django_assert_max_num_queries(1):
+        backend.send_verification(email)
+
+    with django_assert_max_num_queries(1):
+        backend.send_password_reset(email)
+
+    assert len(mailoutbox) == 2
+
+
+@pytest.mark.django_db
+def test_token_reprs(django_assert_max_num_queries, verified_email):
+    """
+    Building the repr of instances loaded from the database should not
+    load related objects.
+    """
+    models.EmailVerification.objects.create(email=verified_email)
+    models.PasswordReset.objects.create(email=verified_email)
+
+    email = models.EmailAddress.objects.get()
+    verification = models.EmailVerification.objects.get()
+    password_reset = models.PasswordReset.objects.get()
+
+    with django_assert_max_num_queries(0):
+        assert f"user_id={email.user_id!r}" in repr(email)
+        assert f"email_id={verification.email_id!r}" in repr(verification)
+        assert f"email_id={password_reset.email_id!r}" in repr(password_reset)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "model",
+    [models.EmailAddress, models.EmailVerification, models.PasswordReset],
+)
+def test_admin_changelist(
+    admin_user, django_assert_max_num_queries, many_rows, model, rf
+):
+    """
+    The number of queries used to render an admin changelist should not
+    depend on the number of rows displayed.
+    """
+    model_admin = admin.site._registry[model]
+    request = rf.get("/")
+    request.user = admin_user
+
+    with django_assert_max_num_queries(5):
+        response = model_admin.changelist_view(request)
+        response.render()
+
+    assert response.context_data["cl"].result_count == ROW_COUNT
@@ -0,0 +1,158 @@
+import json
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.exceptions import ImproperlyConfigured
+from django.core.mail import EmailMultiAlternatives
+
+from email_auth import models, senders
+
+
+def create_message(subject="Subject"):
+    message = EmailMultiAlternatives(
+        body="Body",
+        from_email="noreply@example.com",
+        subject=subject,
+        to=["test@example.com"],
+    )
+    message.attach_alternative("<p>Body</p>", "text/html")
+
+    return message
+
+
+def test_get_sender(settings):
+    """
+    The sender specified by the ``EMAIL_SENDER`` setting should be
+    returned and reused.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_SENDER": "email_auth.senders.LocmemSender"}
+
+    sender = senders.get_sender()
+
+    assert isinstance(sender, senders.LocmemSender)
+    assert senders.get_sender() is sender
+
+
+def test_get_sender_default():
+    """
+    Emails should be sent inline by default.
+    """
+    assert isinstance(senders.get_sender(), senders.InlineSender)
+
+
+def test_get_sender_settings_changed(settings):
+    """
+    Changing the app's settings should close the existing senders.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_SENDER": "email_auth.senders.LocmemSender"}
+    sender = senders.get_sender()
+
+    with mock.patch.object(sender, "close", autospec=True) as mock_close:
+        settings.EMAIL_AUTH = {
+            "EMAIL_SENDER": "email_auth.senders.LocmemSender"
+        }
+
+    assert mock_close.call_count == 1
+    assert senders.get_sender() is not sender
+
+
+def test_inline_sender(mailoutbox):
+    """
+    The inline sender should send messages with Django's email backend.
+    """
+    message = create_message()
+
+    assert senders.InlineSender().send_messages([message]) == 1
+    assert mailoutbox == [message]
+
+
+def test_inline_sender_async(mailoutbox):
+    """
+    The inline sender should send messages asynchronously with Django's
+    email backend.
+    """
+    message = create_message()
+    sender = senders.InlineSender()
+
+    assert async_to_sync(sender.asend_messages)([message]) == 1
+    assert mailoutbox == [message]
+
+
+def test_locmem_sender():
+    """
+    The locmem sender should collect messages without sending them.
+    """
+    message = create_message()
+    senders.LocmemSender.messages.clear()
+
+    assert senders.LocmemSender().send_messages([message]) == 1
+    assert senders.LocmemSender.messages == [message]
+
+
+@pytest.mark.django_db
+def test_outbox_sender(mailoutbox):
+    """
+    The outbox sender should save messages to the outbox.
+    """
+    sender = senders.OutboxSender()
+
+    assert sender.send_messages([create_message("1"), create_message("2")])
+
+    emails = list(models.OutboundEmail.objects.order_by("subject"))
+    assert len(mailoutbox) == 0
+    assert [email.subject for email in emails] == ["1", "2"]
+    assert emails[0].body == "Body"
+    assert emails[0].from_email == "noreply@example.com"
+    assert emails[0].html_body == "<p>Body</p>"
+    assert emails[0].recipient_list == ["test@example.com"]
+
+
+@pytest.mark.django_db
+def test_outbox_sender_async():
+    """
+    The outbox sender should asynchronously save messages to the outbox.
+    """
+    sender = senders.OutboxSender()
+
+    assert async_to_sync(sender.asend_messages)([create_message()]) == 1
+    assert models.OutboundEmail.objects.count() == 1
+
+
+def test_spool_sender_without_path():
+    """
+    The spool sender should require a path to write to.
+    """
+    with pytest.raises(ImproperlyConfigured):
+        senders.SpoolSender()
+
+
+def test_spool_sender(settings, tmp_path):
+    """
+    The spool sender should write messages as JSON lines once a full
+    batch has been buffered.
+    """
+    path = tmp_path / "emails.jsonl"
+    settings.EMAIL_AUTH = {
+        "EMAIL_SPOOL_BATCH_SIZE": 3,
+        "EMAIL_SPOOL_PATH": str(path),
+    }
+    sender = senders.SpoolSender()
+
+    sender.send_messages([create_message("1"), create_message("2")])
+
+    assert not path.exists()
+
+    sender.send_messages([create_message("3")])
+    sender.send_messages([create_message("4")])
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["subject"] for line in lines] == ["1", "2", "3"]
+    assert lines[0]["body"] == "Body"
+    assert lines[0]["from_email"] == "noreply@example.com"
+    assert lines[0]["html_body"] == "<p>Body</p>"
+    assert lines[0]["to"] == ["test@example.com"]
+
+    sender.close()
+
+    assert len(path.read_text().splitlines()) == 4
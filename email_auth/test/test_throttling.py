@@ -0,0 +1,125 @@
+from unittest import mock
+
+import pytest
+from django.test import RequestFactory
+
+from email_auth import caching, throttling
+
+
+@pytest.fixture
+def request_from_ip():
+    return RequestFactory().post("/", REMOTE_ADDR="10.0.0.1")
+
+
+def test_get_counter_key():
+    """
+    Counter keys should not contain the raw identifier so that any user
+    input results in a valid cache key.
+    """
+    key = throttling.get_counter_key("address", "Some Input\n", 3)
+
+    assert key.startswith("email_auth:throttle:address:")
+    assert key.endswith(":3")
+    assert "Some Input" not in key
+
+
+@mock.patch("email_auth.throttling.time.time", return_value=600.0)
+def test_record_attempt_within_limit(_):
+    """
+    Attempts within the limit should not be throttled.
+    """
+    results = [
+        throttling.record_attempt("address", "test@example.com", 3, 60)
+        for _ in range(3)
+    ]
+
+    assert results == [False, False, False]
+
+
+@mock.patch("email_auth.throttling.time.time", return_value=600.0)
+def test_record_attempt_over_limit(_):
+    """
+    Attempts exceeding the limit should be throttled.
+    """
+    for _ in range(3):
+        throttling.record_attempt("address", "test@example.com", 3, 60)
+
+    assert throttling.record_attempt("address", "test@example.com", 3, 60)
+    assert not throttling.record_attempt("address", "other@example.com", 3, 60)
+
+
+@mock.patch("email_auth.throttling.time.time")
+def test_record_attempt_sliding_window(mock_time):
+    """
+    Attempts from the previous window should count towards the limit in
+    proportion to how much of the previous window overlaps the sliding
+    window.
+    """
+    mock_time.return_value = 600.0
+    for _ in range(4):
+        throttling.record_attempt("address", "test@example.com", 4, 60)
+
+    # Halfway through the next window, half of the previous attempts
+    # still count.
+    mock_time.return_value = 690.0
+    results = [
+        throttling.record_attempt("address", "test@example.com", 4, 60)
+        for _ in range(3)
+    ]
+
+    assert results == [False, False, True]
+
+
+@mock.patch("email_auth.throttling.time.time")
+def test_record_attempt_window_expired(mock_time):
+    """
+    Attempts older than the sliding window should not count towards the
+    limit.
+    """
+    mock_time.return_value = 600.0
+    for _ in range(4):
+        throttling.record_attempt("address", "test@example.com", 3, 60)
+
+    mock_time.return_value = 720.0
+
+    assert not throttling.record_attempt("address", "test@example.com", 3, 60)
+
+
+def test_is_login_throttled_disabled(request_from_ip):
+    """
+    If no limits are configured, no attempts should be throttled or
+    recorded.
+    """
+    with mock.patch.object(caching, "get_cache", autospec=True) as mock_cache:
+        for _ in range(10):
+            assert not throttling.is_login_throttled(
+                request_from_ip, "test@example.com"
+            )
+
+    assert mock_cache.call_count == 0
+
+
+def test_is_login_throttled_by_address(request_from_ip, settings):
+    """
+    Attempts for the same normalized address should be throttled
+    regardless of the address's capitalization.
+    """
+    settings.EMAIL_AUTH = {"LOGIN_THROTTLE_ADDRESS_LIMIT": 2}
+
+    assert not throttling.is_login_throttled(None, "test@example.com")
+    assert not throttling.is_login_throttled(None, "Test@Example.com")
+    assert throttling.is_login_throttled(request_from_ip, "TEST@example.com")
+
+
+def test_is_login_throttled_by_ip(request_from_ip, settings):
+    """
+    Attempts from the same IP address should be throttled regardless of
+    the address being logged in to.
+    """
+    settings.EMAIL_AUTH = {"LOGIN_THROTTLE_IP_LIMIT": 2}
+    other_ip = RequestFactory().post("/", REMOTE_ADDR="10.0.0.2")
+
+    assert not throttling.is_login_throttled(request_from_ip, "a@example.com")
+    assert not throttling.is_login_throttled(request_from_ip, "b@example.com")
+    assert throttling.is_login_throttled(request_from_ip, "c@example.com")
+    assert not throttling.is_login_throttled(other_ip, "c@example.com")
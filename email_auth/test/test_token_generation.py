@@ -0,0 +1,73 @@
+from unittest import mock
+
+import pytest
+
+from email_auth import token_generation
+
+
+def test_generate_token():
+    """
+    A token of the requested length should be made of alphanumeric
+    characters.
+    """
+    token = token_generation.generate_token(64)
+
+    assert len(token) == 64
+    assert set(token) <= set(token_generation.ALPHANUMERIC)
+
+
+def test_generate_tokens():
+    """
+    A batch of distinct tokens with the requested length should be
+    generated.
+    """
+    tokens = token_generation.generate_tokens(100, 32)
+
+    assert len(tokens) == 100
+    assert len(set(tokens)) == 100
+    assert all(len(token) == 32 for token in tokens)
+
+
+def test_generate_tokens_custom_alphabet():
+    """
+    Tokens should only contain characters from the provided alphabet.
+    """
+    tokens = token_generation.generate_tokens(10, 50, alphabet="ab")
+
+    assert set("".join(tokens)) == {"a", "b"}
+
+
+@mock.patch("email_auth.token_generation.secrets.token_bytes", autospec=True)
+def test_generate_tokens_discards_biased_bytes(mock_token_bytes):
+    """
+    Bytes that would make some characters more likely should be
+    discarded so that each character maps from the same number of byte
+    values.
+    """
+    # 248 is the largest multiple of 62 below 256.
+    mock_token_bytes.side_effect = [bytes(range(256)), bytes(range(248))]
+
+    token = token_generation.generate_token(400)
+
+    expected = token_generation.ALPHANUMERIC * 4 * 2
+    assert token == expected[:400]
+
+
+def test_generate_tokens_uniform():
+    """
+    Every character of the alphabet should be roughly equally likely.
+    """
+    alphabet = "abc"
+    text = "".join(token_generation.generate_tokens(1000, 30, alphabet))
+
+    for char in alphabet:
+        assert abs(text.count(char) / len(text) - 1 / 3) < 0.02
+
+
+@pytest.mark.parametrize("alphabet", ["a", "aab", "é" * 300])
+def test_generate_tokens_invalid_alphabet(alphabet):
+    """
+    Alphabets that cannot be mapped onto bytes should be rejected.
+    """
+    with pytest.raises(ValueError):
+        token_generation.generate_token(10, alphabet)
@@ -0,0 +1,205 @@
+import datetime
+import time
+from unittest import mock
+
+import pytest
+from django.utils import timezone
+
+from email_auth import models, tokens
+
+
+def test_get_token_backend(settings):
+    """
+    The backend specified by the ``TOKEN_BACKEND`` setting should be
+    returned.
+    """
+    settings.EMAIL_AUTH = {
+        "TOKEN_BACKEND": "email_auth.tokens.SignedTokenBackend"
+    }
+
+    assert isinstance(tokens.get_token_backend(), tokens.SignedTokenBackend)
+
+
+def test_get_token_backend_default():
+    """
+    Tokens should be stored in the database by default.
+    """
+    assert isinstance(tokens.get_token_backend(), tokens.ModelTokenBackend)
+
+
+@pytest.mark.django_db
+def test_model_backend_verification(email, mailoutbox, settings):
+    """
+    The model backend should store the verification it sends and look
+    it up by its token.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_VERIFICATION_URL": "/verify/{key}"}
+    backend = tokens.ModelTokenBackend()
+
+    verification = backend.send_verification(email)
+
+    assert len(mailoutbox) == 1
+    assert verification.token in mailoutbox[0].body
+    assert backend.get_verification(verification.token) == verification
+
+
+@pytest.mark.django_db
+def test_model_backend_resend_interval(email, mailoutbox, settings):
+    """
+    Requests for a token of the same type within the resend interval
+    should be ignored.
+    """
+    settings.EMAIL_AUTH = {"TOKEN_RESEND_INTERVAL": 60}
+    backend = tokens.ModelTokenBackend()
+
+    verification = backend.send_verification(email)
+    repeated = backend.send_verification(email)
+    reset = backend.send_password_reset(email)
+
+    assert repeated == verification
+    assert repeated.token is None
+    assert reset.token is not None
+    assert len(mailoutbox) == 2
+    assert models.EmailVerification.objects.count() == 1
+
+    models.EmailVerification.objects.update(
+        time_sent=timezone.now() - datetime.timedelta(seconds=61)
+    )
+
+    assert backend.send_verification(email) != verification
+    assert len(mailoutbox) == 3
+
+
+@pytest.mark.django_db
+def test_model_backend_address_limit(email, mailoutbox, settings):
+    """
+    Only the newest tokens of each type up to the address limit should
+    be kept.
+    """
+    settings.EMAIL_AUTH = {"TOKEN_ADDRESS_LIMIT": 2}
+    backend = tokens.ModelTokenBackend()
+
+    resets = [backend.send_password_reset(email) for _ in range(3)]
+    verification = backend.send_verification(email)
+
+    assert len(mailoutbox) == 4
+    assert set(models.PasswordReset.objects.all()) == set(resets[1:])
+    assert list(models.EmailVerification.objects.all()) == [verification]
+
+
+@pytest.mark.django_db
+def test_model_backend_invalid_token():
+    """
+    Looking up an unknown token should raise an ``InvalidToken``
+    exception.
+    """
+    backend = tokens.ModelTokenBackend()
+
+    with pytest.raises(tokens.InvalidToken):
+        backend.get_verification("a" * 64)
+
+    with pytest.raises(tokens.InvalidToken):
+        backend.get_password_reset("a" * 64)
+
+
+@pytest.mark.django_db
+def test_signed_backend_issue_without_writes(
+    django_assert_num_queries, email, mailoutbox, settings
+):
+    """
+    Issuing signed tokens should not query the database.
+    """
+    settings.EMAIL_AUTH = {"EMAIL_VERIFICATION_URL": "/verify/{key}"}
+    backend = tokens.SignedTokenBackend()
+
+    with django_assert_num_queries(0):
+        verification = backend.send_verification(email)
+
+    assert len(mailoutbox) == 1
+    assert verification.token in mailoutbox[0].body
+    assert not models.EmailVerification.objects.exists()
+
+
+@pytest.mark.django_db
+def test_signed_backend_verification(email):
+    """
+    A signed verification token should only be usable until the address
+    is verified.
+    """
+    backend = tokens.SignedTokenBackend()
+    token = backend.send_verification(email).token
+
+    verification = backend.get_verification(token)
+    verification.verify()
+    email.refresh_from_db()
+
+    assert verification.email == email
+    assert email.is_verified
+
+    with pytest.raises(tokens.InvalidToken):
+        backend.get_verification(token)
+
+
+@pytest.mark.django_db
+def test_signed_backend_password_reset(email):
+    """
+    A signed password reset token should only be usable until the user's
+    password is changed.
+    """
+    email.is_verified = True
+    email.save()
+    backend = tokens.SignedTokenBackend()
+    token = backend.send_password_reset(email).token
+
+    backend.get_password_reset(token).reset_password("new-password")
+    email.user.refresh_from_db()
+
+    assert email.user.check_password("new-password")
+
+    with pytest.raises(tokens.InvalidToken):
+        backend.get_password_reset(token)
+
+
+@pytest.mark.django_db
+def test_signed_backend_token_types(email):
+    """
+    Verification tokens should not be accepted as password reset tokens
+    and vice versa.
+    """
+    backend = tokens.SignedTokenBackend()
+    verification = backend.send_verification(email)
+    reset = backend.send_password_reset(email)
+
+    with pytest.raises(tokens.InvalidToken):
+        backend.get_password_reset(verification.token)
+
+    with pytest.raises(tokens.InvalidToken):
+        backend.get_verification(reset.token)
+
+
+@pytest.mark.django_db
+def test_signed_backend_expired(email, settings):
+    """
+    Tokens older than the ``SIGNED_TOKEN_MAX_AGE`` setting should be
+    rejected.
+    """
+    settings.EMAIL_AUTH = {"SIGNED_TOKEN_MAX_AGE": 60}
+    backend = tokens.SignedTokenBackend()
+    token = backend.send_verification(email).token
+
+    with mock.patch("time.time", return_value=time.time() + 61):
+        with pytest.raises(tokens.InvalidToken):
+            backend.get_verification(token)
+
+
+@pytest.mark.django_db
+def test_signed_backend_tampered(email):
+    """
+    Tokens that have been modified should be rejected.
+    """
+    backend = tokens.SignedTokenBackend()
+    token = backend.send_verification(email).token
+
+    for invalid in ("foo", token[:-1], token + "a", "a" + token):
+        with pytest.raises(tokens.InvalidToken):
+            backend.get_verification(invalid)
@@ -1,3 +1,8 @@
+import asyncio
+
+from asgiref.sync import async_to_sync
+
+
 def create_expected_repr(instance, fields):
     """
     Create the expected string representation of an instance.
@@ -14,3 +19,51 @@ def create_expected_repr(instance, fields):
     values = [f"{field}={repr(getattr(instance, field))}" for field in fields]
 
     return f"{instance.__class__.__name__}({', '.join(values)})"
+
+
+def get_statements(queries):
+    """
+    Summarize the statements run by a block of code.
+
+    Args:
+        queries:
+            The queries captured by a
+            :py:class:`django.test.utils.CaptureQueriesContext`.
+
+    Returns:
+        A list containing the first word of each statement along with
+        the table it affects. Savepoints are excluded because they
+        depend on whether the code runs inside another transaction.
+    """
+    statements = []
+    for query in queries:
+        sql = query["sql"]
+        if sql.startswith(("SAVEPOINT", "RELEASE SAVEPOINT")):
+            continue
+
+        table = sql.split('"')[1]
+        statements.append(f"{sql.split()[0]} {table}")
+
+    return statements
+
+
+def call_view(view, request):
+    """
+    Call a view function with a request.
+
+    Async views are only coroutine functions on versions of Django that
+    serve them natively, so they are run to completion here.
+
+    Args:
+        view:
+            The view function to call.
+        request:
+            The request to pass to the view.
+
+    Returns:
+        The view's response.
+    """
+    if asyncio.iscoroutinefunction(view):
+        return async_to_sync(view)(request)
+
+    return view(request)
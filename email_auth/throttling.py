@@ -0,0 +1,118 @@
+"""
+Throttling of login attempts.
+
+Attempts are counted per normalized email address and per client IP
+address using a sliding window. The counters are stored in the cache
+specified by the ``CACHE_ALIAS`` setting, so a shared cache must be used
+for the limits to apply across processes.
+"""
+
+import time
+
+from email_auth import app_settings, async_utils, caching, models
+
+
+def get_counter_key(scope, identifier, window_index):
+    """
+    Args:
+        scope:
+            The type of identifier being throttled, eg ``"address"``.
+        identifier:
+            The value being throttled.
+        window_index:
+            The index of the fixed window the counter belongs to.
+
+    Returns:
+        The cache key of the counter.
+    """
+    key = caching.make_key(f"email_auth:throttle:{scope}", identifier)
+
+    return f"{key}:{window_index}"
+
+
+def record_attempt(scope, identifier, limit, window):
+    """
+    Record an attempt and determine if it exceeds the allowed rate.
+
+    The rate is estimated using a sliding window built from the counts
+    of the current and previous fixed windows. The previous window's
+    count is weighted by how much of it still overlaps the sliding
+    window.
+
+    Args:
+        scope:
+            The type of identifier being throttled.
+        identifier:
+            The value being throttled.
+        limit:
+            The maximum number of attempts allowed within the window.
+        window:
+            The length of the window in seconds.
+
+    Returns:
+        A boolean indicating if the attempt exceeds the limit.
+    """
+    now = time.time()
+    window_index = int(now // window)
+
+    current_key = get_counter_key(scope, identifier, window_index)
+    previous_key = get_counter_key(scope, identifier, window_index - 1)
+
+    # Counters must outlive the window after theirs so they can be used
+    # as the previous count.
+    current = caching.increment(current_key, timeout=window * 2)
+    previous = caching.get_cache().get(previous_key, 0)
+    overlap = 1 - (now % window) / window
+
+    return previous * overlap + current > limit
+
+
+def is_login_throttled(request, username):
+    """
+    Record a login attempt and determine if it should be rejected.
+
+    Args:
+        request:
+            The request the login attempt was made with. This may be
+            ``None`` in which case attempts are only throttled by email
+            address.
+        username:
+            The email address provided for the login attempt.
+
+    Returns:
+        A boolean indicating if the attempt exceeds the configured
+        limits.
+    """
+    window = app_settings.LOGIN_THROTTLE_WINDOW
+    throttled = False
+
+    address_limit = app_settings.LOGIN_THROTTLE_ADDRESS_LIMIT
+    if address_limit is not None:
+        throttled |= record_attempt(
+            "address",
+            models.normalize_address(username),
+            address_limit,
+            window,
+        )
+
+    ip_limit = app_settings.LOGIN_THROTTLE_IP_LIMIT
+    ip_address = request.META.get("REMOTE_ADDR") if request else None
+    if ip_limit is not None and ip_address:
+        throttled |= record_attempt("ip", ip_address, ip_limit, window)
+
+    return throttled
+
+
+async def ais_login_throttled(request, username):
+    """
+    Asynchronous version of :py:func:`is_login_throttled`.
+    """
+    if (
+        app_settings.LOGIN_THROTTLE_ADDRESS_LIMIT is None
+        and app_settings.LOGIN_THROTTLE_IP_LIMIT is None
+    ):
+        return False
+
+    return await async_utils.run_in_thread(
+        is_login_throttled, request, username
+    )
@@ -0,0 +1,94 @@
+"""
+Generation of random tokens.
+
+Tokens are built by translating a single read of random bytes into the
+target alphabet. Bytes that would make some characters more likely than
+others are discarded, so every character is drawn uniformly from the
+alphabet just like with :py:func:`secrets.choice`.
+"""
+
+import functools
+import secrets
+import string
+
+
+ALPHANUMERIC = string.ascii_letters + string.digits
+
+
+@functools.lru_cache(maxsize=8)
+def _get_translation(alphabet):
+    """
+    Build the tables used to map random bytes onto an alphabet.
+
+    Args:
+        alphabet:
+            A string of distinct ASCII characters.
+
+    Returns:
+        A tuple containing the translation table mapping bytes to
+        characters, the bytes that must be discarded to avoid bias, and
+        the fraction of bytes that are kept.
+    """
+    size = len(alphabet)
+    if not 1 < size <= 256 or len(set(alphabet)) != size:
+        raise ValueError(
+            "The alphabet must contain between 2 and 256 unique characters."
+        )
+
+    # Only bytes below the largest multiple of the alphabet size are
+    # used. Mapping the rest would favor the start of the alphabet.
+    limit = 256 - 256 % size
+    encoded = alphabet.encode("ascii")
+    table = bytes(encoded[b % size] for b in range(256))
+
+    return table, bytes(range(limit, 256)), limit / 256
+
+
+def generate_tokens(count, length, alphabet=ALPHANUMERIC):
+    """
+    Generate a batch of random tokens.
+
+    Args:
+        count:
+            The number of tokens to generate.
+        length:
+            The number of characters in each token.
+        alphabet:
+            The characters tokens are made of.
+
+    Returns:
+        A list of random tokens.
+    """
+    table, discard, ratio = _get_translation(alphabet)
+    needed = count * length
+
+    chars = b""
+    while len(chars) < needed:
+        # Request enough bytes that a single read almost always
+        # suffices after discarded bytes are removed.
+        missing = needed - len(chars)
+        data = secrets.token_bytes(int(missing / ratio) + 16)
+        chars += data.translate(table, discard)
+
+    text = chars[:needed].decode("ascii")
+    slices = (
+        slice(start, start + length) for start in range(0, needed, length)
+    )
+
+    return [text[s] for s in slices]
+
+
+def generate_token(length, alphabet=ALPHANUMERIC):
+    """
+    Generate a single random token.
+
+    Args:
+        length:
+            The number of characters in the token.
+        alphabet:
+            The characters the token is made of.
+
+    Returns:
+        A random token.
+    """
+    return generate_tokens(1, length, alphabet)[0]
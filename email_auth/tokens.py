@@ -0,0 +1,384 @@
+"""
+Backends that issue and validate email verification and password reset
+tokens.
+
+The backend used is specified by the ``TOKEN_BACKEND`` setting. Every
+backend provides the same interface:
+
+* ``send_verification(email)`` and ``send_password_reset(email)`` issue
+  a new token, email it to the provided address, and return an object
+  with ``email`` and ``token`` attributes.
+* ``get_verification(token)`` returns an object whose ``verify()``
+  method marks its ``email`` as verified.
+* ``get_password_reset(token)`` returns an object whose
+  ``reset_password(password)`` method sets a new password for the owner
+  of its ``email``.
+
+Both lookups raise :py:class:`InvalidToken` if the token is not valid.
+Redeeming a stored token with ``verify()`` or ``reset_password()``
+raises :py:class:`django.core.exceptions.ObjectDoesNotExist` if another
+request redeemed it first.
+"""
+
+from django.core import signing
+from django.core.exceptions import ValidationError
+from django.utils import crypto
+from django.utils.module_loading import import_string
+
+from email_auth import app_settings, models
+
+
+class InvalidToken(Exception):
+    """
+    Exception raised when a token does not identify a pending email
+    verification or password reset.
+    """
+
+
+def get_token_backend():
+    """
+    Returns:
+        An instance of the token backend specified by the
+        ``TOKEN_BACKEND`` setting.
+    """
+    return import_string(app_settings.TOKEN_BACKEND)()
+
+
+class ModelTokenBackend:
+    """
+    Token backend that stores tokens using the
+    :py:class:`email_auth.models.EmailVerification` and
+    :py:class:`email_auth.models.PasswordReset` models.
+    """
+
+    def get_password_reset(self, token):
+        """
+        Args:
+            token:
+                The token provided by the user.
+
+        Returns:
+            The :py:class:`PasswordReset` identified by the token.
+
+        Raises:
+            InvalidToken:
+                If the token does not match a password reset.
+        """
+        resets = models.PasswordReset.objects.select_related("email__user")
+
+        try:
+            return resets.get_by_token(token)
+        except models.PasswordReset.DoesNotExist:
+            raise InvalidToken
+
+    def get_verification(self, token):
+        """
+        Args:
+            token:
+                The token provided by the user.
+
+        Returns:
+            The :py:class:`EmailVerification` identified by the token.
+
+        Raises:
+            InvalidToken:
+                If the token does not match an email verification.
+        """
+        verifications = models.EmailVerification.objects.select_related(
+            "email"
+        )
+
+        try:
+            return verifications.get_by_token(token)
+        except models.EmailVerification.DoesNotExist:
+            raise InvalidToken
+
+    def send_password_reset(self, email):
+        """
+        Create and send a password reset for an email address.
+
+        Args:
+            email:
+                The verified email address to send the reset to.
+
+        Returns:
+            The created :py:class:`PasswordReset` instance, or the
+            recently sent instance if the request was ignored.
+        """
+        return self._send(models.PasswordReset, email)
+
+    def send_verification(self, email):
+        """
+        Create and send a verification for an email address.
+
+        Args:
+            email:
+                The email address to verify.
+
+        Returns:
+            The created :py:class:`EmailVerification` instance, or the
+            recently sent instance if the request was ignored.
+        """
+        return self._send(models.EmailVerification, email)
+
+    @staticmethod
+    def _send(model, email):
+        """
+        Create and send a token for an email address.
+
+        If a token of the same type was sent to the address within the
+        ``TOKEN_RESEND_INTERVAL``, no token is created and no email is
+        sent. Only a digest of the earlier token is stored, so it cannot
+        be sent again. Once a token is created, the oldest tokens of the
+        same type for the address beyond the ``TOKEN_ADDRESS_LIMIT`` are
+        deleted.
+
+        Args:
+            model:
+                The token model to create an instance of.
+            email:
+                The email address to send the token to.
+
+        Returns:
+            The created instance, or the recently sent instance whose
+            ``token`` attribute is ``None``.
+        """
+        interval = app_settings.TOKEN_RESEND_INTERVAL
+        if interval is not None:
+            recent = (
+                model.objects.filter(email=email)
+                .sent_within(interval)
+                .order_by("-time_sent")
+                .first()
+            )
+            if recent is not None:
+                return recent
+
+        instance = model(email=email)
+        instance.send_email()
+
+        limit = app_settings.TOKEN_ADDRESS_LIMIT
+        if limit is not None:
+            model.objects.filter(email=email).evict_oldest(limit)
+
+        return instance
+
+
+class SignedPasswordReset:
+    """
+    A password reset issued by the :py:class:`SignedTokenBackend`.
+    """
+
+    def __init__(self, email, token):
+        self.email = email
+        self.token = token
+
+    def __repr__(self):
+        """
+        Returns:
+            A string representation of the instance suitable for
+            debugging purposes.
+        """
+        return models.build_repr(self, ["email"])
+
+    def reset_password(self, password):
+        """
+        Set a new password for the owner of the email address. Changing
+        the password invalidates the token.
+
+        Args:
+            password:
+                The user's new password.
+        """
+        models.set_user_password(self.email.user, password)
+
+
+class SignedVerification:
+    """
+    An email verification issued by the :py:class:`SignedTokenBackend`.
+    """
+
+    def __init__(self, email, token):
+        self.email = email
+        self.token = token
+
+    def __repr__(self):
+        """
+        Returns:
+            A string representation of the instance suitable for
+            debugging purposes.
+        """
+        return models.build_repr(self, ["email"])
+
+    def verify(self):
+        """
+        Mark the email address as verified. Verifying the address
+        invalidates the token.
+        """
+        self.email.verify()
+
+
+class SignedTokenBackend:
+    """
+    Token backend that issues timestamped tokens signed with the
+    project's ``SECRET_KEY``.
+
+    Issuing a token does not write to the database. Instead, each token
+    contains the ID of its email address and a digest of the state that
+    redeeming the token changes. Verification tokens are bound to the
+    address and its verification status, and password reset tokens are
+    also bound to the user's password hash. Redeeming a token changes
+    that state, so each token can only be used once. Tokens expire after
+    the number of seconds given by the ``SIGNED_TOKEN_MAX_AGE`` setting.
+    """
+
+    password_reset_salt = "email_auth.tokens.SignedTokenBackend.reset"
+    verification_salt = "email_auth.tokens.SignedTokenBackend.verification"
+
+    def get_password_reset(self, token):
+        """
+        Args:
+            token:
+                The token provided by the user.
+
+        Returns:
+            A :py:class:`SignedPasswordReset` for the email address the
+            token was issued to.
+
+        Raises:
+            InvalidToken:
+                If the token is invalid, has expired, or has already
+                been used.
+        """
+        email = self._load(token, self.password_reset_salt)
+
+        return SignedPasswordReset(email, token)
+
+    def get_verification(self, token):
+        """
+        Args:
+            token:
+                The token provided by the user.
+
+        Returns:
+            A :py:class:`SignedVerification` for the email address the
+            token was issued to.
+
+        Raises:
+            InvalidToken:
+                If the token is invalid, has expired, or has already
+                been used.
+        """
+        email = self._load(token, self.verification_salt)
+
+        return SignedVerification(email, token)
+
+    def send_password_reset(self, email):
+        """
+        Send a password reset token to an email address.
+
+        Args:
+            email:
+                The verified email address to send the token to.
+
+        Returns:
+            The :py:class:`SignedPasswordReset` that was sent.
+        """
+        reset = SignedPasswordReset(
+            email, self._dump(email, self.password_reset_salt)
+        )
+        models.send_password_reset_token(reset)
+
+        return reset
+
+    def send_verification(self, email):
+        """
+        Send a verification token to an email address.
+
+        Args:
+            email:
+                The email address to verify.
+
+        Returns:
+            The :py:class:`SignedVerification` that was sent.
+        """
+        verification = SignedVerification(
+            email, self._dump(email, self.verification_salt)
+        )
+        models.send_verification_token(verification)
+
+        return verification
+
+    @staticmethod
+    def _get_state(email, salt):
+        """
+        Args:
+            email:
+                The email address a token is issued for.
+            salt:
+                The salt identifying the type of token.
+
+        Returns:
+            A digest of the state that a token of the given type is
+            bound to. Only a digest is included in tokens because their
+            payload is not encrypted.
+        """
+        state = f"{email.normalized_address}:{email.is_verified}"
+        if salt == SignedTokenBackend.password_reset_salt:
+            state += f":{email.user.password}"
+
+        return crypto.salted_hmac(salt, state).hexdigest()
+
+    def _dump(self, email, salt):
+        """
+        Args:
+            email:
+                The email address to issue a token for.
+            salt:
+                The salt identifying the type of token.
+
+        Returns:
+            A new signed token for the email address.
+        """
+        payload = {"e": str(email.pk), "s": self._get_state(email, salt)}
+
+        return signing.dumps(payload, salt=salt)
+
+    def _load(self, token, salt):
+        """
+        Args:
+            token:
+                The token to validate.
+            salt:
+                The salt identifying the type of token.
+
+        Returns:
+            The email address the token was issued for.
+
+        Raises:
+            InvalidToken:
+                If the token is invalid, has expired, or the state it is
+                bound to has changed.
+        """
+        try:
+            payload = signing.loads(
+                token, max_age=app_settings.SIGNED_TOKEN_MAX_AGE, salt=salt
+            )
+            email = models.EmailAddress.objects.with_user().get(
+                pk=payload["e"]
+            )
+        except (
+            KeyError,
+            TypeError,
+            ValidationError,
+            models.EmailAddress.DoesNotExist,
+            signing.BadSignature,
+        ):
+            raise InvalidToken
+
+        if not crypto.constant_time_compare(
+            payload.get("s"), self._get_state(email, salt)
+        ):
+            raise InvalidToken
+
+        return email
@@ -23,6 +23,8 @@ setup(
         "Framework :: Django",
         "Framework :: Django :: 2.1",
         "Framework :: Django :: 2.2",
+        "Framework :: Django :: 3.1",
+        "Framework :: Django :: 3.2",
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
         "Natural Language :: English",
@@ -36,7 +38,11 @@ setup(
     include_package_data=True,
     packages=find_packages(),
     # Dependencies
-    install_requires=["Django >= 2.1", "django-email-utils >= 1.0"],
+    install_requires=[
+        "asgiref >= 3.3",
+        "Django >= 2.1, < 4.0",
+        "django-email-utils >= 1.0",
+    ],
     # Interface-specific dependencies
     extras_require={"rest": ["djangorestframework"]},
 )
@@ -31,6 +31,7 @@ TEMPLATES = [
         "APP_DIRS": True,
         "OPTIONS": {
             "context_processors": [
+                "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
             ]
@@ -48,6 +49,11 @@ DATABASES = {
         # real file for database access or if they are still using an in-memory
         # database.
         "NAME": os.path.join(BASE_DIR, "db.sqlite3"),
+        # The test database is also stored in a file. On Django 2.1, the
+        # "live_server" fixture cannot share an in-memory database with
+        # its server thread, which fails once other tests have already
+        # created it.
+        "TEST": {"NAME": os.path.join(BASE_DIR, "test_db.sqlite3")},
     }
 }
 